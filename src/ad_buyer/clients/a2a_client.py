@@ -67,6 +67,7 @@ class A2AClient:
         base_url: str = "https://agentic-direct-server-hwgrypmndq-uk.a.run.app",
         agent_type: str = "buyer",
         timeout: float = 60.0,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """Initialize the A2A client.
 
@@ -74,12 +75,15 @@ class A2AClient:
             base_url: Base URL for the A2A server
             agent_type: Type of agent to use ('buyer' or 'seller')
             timeout: Request timeout in seconds
+            http_client: Optional shared HTTP client; it is left open on close()
         """
         self.base_url = base_url.rstrip("/")
         self.agent_type = agent_type
         self.jsonrpc_url = f"{self.base_url}/a2a/{agent_type}/jsonrpc"
         self.agent_card_url = f"{self.base_url}/a2a/{agent_type}/.well-known/agent-card.json"
-        self._client = httpx.AsyncClient(
+        self._timeout = timeout
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.AsyncClient(
             timeout=timeout,
             headers={"Content-Type": "application/json"},
         )
@@ -91,7 +95,7 @@ class A2AClient:
         Returns:
             Agent card JSON with name, skills, capabilities, etc.
         """
-        response = await self._client.get(self.agent_card_url)
+        response = await self._client.get(self.agent_card_url, timeout=self._timeout)
         response.raise_for_status()
         return response.json()
 
@@ -101,7 +105,7 @@ class A2AClient:
         Returns:
             MCP info with tool list
         """
-        response = await self._client.get(f"{self.base_url}/mcp/info")
+        response = await self._client.get(f"{self.base_url}/mcp/info", timeout=self._timeout)
         response.raise_for_status()
         return response.json()
 
@@ -141,7 +145,9 @@ class A2AClient:
             "id": request_id,
         }
 
-        response = await self._client.post(self.jsonrpc_url, json=payload)
+        response = await self._client.post(
+            self.jsonrpc_url, json=payload, timeout=self._timeout
+        )
         response.raise_for_status()
         result = response.json()
 
@@ -188,7 +194,9 @@ class A2AClient:
             "id": request_id,
         }
 
-        response = await self._client.post(self.jsonrpc_url, json=payload)
+        response = await self._client.post(
+            self.jsonrpc_url, json=payload, timeout=self._timeout
+        )
         response.raise_for_status()
         result = response.json()
 
@@ -298,8 +306,9 @@ class A2AClient:
         return await self.send_message(msg)
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client unless it is shared."""
+        if self._owns_client:
+            await self._client.aclose()
 
     async def __aenter__(self) -> "A2AClient":
         return self
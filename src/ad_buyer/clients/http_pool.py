@@ -0,0 +1,48 @@
+# Author: Green Mountain Systems AI Inc.
+# Donated to IAB Tech Lab
+
+"""Shared keep-alive HTTP connection pool for seller clients.
+
+Tools and flows create ``UnifiedClient`` instances freely; handing each of them
+the same ``httpx.AsyncClient`` keeps TCP/TLS connections to the seller warm
+across tool invocations instead of paying a new handshake every time. httpx
+connections are bound to the event loop that opened them, so one pool is kept
+per running loop.
+"""
+
+import asyncio
+import weakref
+
+import httpx
+
+# Pool sizing for the shared client
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=100,
+    keepalive_expiry=60.0,
+)
+
+_shared_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+
+
+def shared_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for the running event loop.
+
+    Callers must not close the returned client; use
+    ``close_shared_http_client`` on shutdown instead.
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(limits=HTTP_POOL_LIMITS)
+        _shared_clients[loop] = client
+    return client
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared HTTP client for the running event loop, if any."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
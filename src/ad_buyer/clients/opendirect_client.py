@@ -3,6 +3,9 @@
 
 """HTTP client for IAB OpenDirect 2.1 API."""
 
+import json
+import time
+from collections import OrderedDict
 from typing import Any, Optional
 
 import httpx
@@ -17,6 +20,16 @@ from ..models.opendirect import (
     Order,
     Product,
 )
+from .http_pool import HTTP_POOL_LIMITS
+
+# Fail fast on unreachable hosts without shortening slow seller responses
+_CONNECT_TIMEOUT = 5.0
+
+# Agents re-issue identical product and avails queries while iterating on a
+# plan, so those responses are cached briefly per client. Reserving, booking
+# or cancelling a line changes remaining inventory and clears the cache.
+RESPONSE_CACHE_TTL_SECONDS = 60.0
+RESPONSE_CACHE_MAX_ENTRIES = 256
 
 
 class OpenDirectClient:
@@ -28,6 +41,7 @@ class OpenDirectClient:
         api_key: Optional[str] = None,
         oauth_token: Optional[str] = None,
         timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         """Initialize the client.
 
@@ -36,13 +50,22 @@ class OpenDirectClient:
             api_key: Optional API key for authentication
             oauth_token: Optional OAuth bearer token
             timeout: Request timeout in seconds
+            transport: Optional httpx transport, e.g. ``httpx.MockTransport``
+                in tests; defaults to a pooled HTTP/2 connection
         """
         self.base_url = base_url.rstrip("/")
+        # Every tool shares this one client, so keep enough idle connections
+        # for concurrent tool calls and multiplex them over HTTP/2 where the
+        # server supports it.
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
             headers=self._build_headers(api_key, oauth_token),
-            timeout=timeout,
+            timeout=httpx.Timeout(timeout, connect=min(timeout, _CONNECT_TIMEOUT)),
+            limits=HTTP_POOL_LIMITS,
+            http2=True,
+            transport=transport,
         )
+        self._response_cache: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
 
     def _build_headers(
         self, api_key: Optional[str], oauth_token: Optional[str]
@@ -55,29 +78,59 @@ class OpenDirectClient:
             headers["X-API-Key"] = api_key
         return headers
 
+    def clear_cache(self) -> None:
+        """Drop all cached product and availability responses."""
+        self._response_cache.clear()
+
+    def _cache_get(self, key: tuple[str, str]) -> Any:
+        """Get a fresh cached response, or None on a miss."""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= RESPONSE_CACHE_TTL_SECONDS:
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        return entry[1]
+
+    def _cache_put(self, key: tuple[str, str], value: Any) -> None:
+        """Cache a response, evicting the least recently used past the limit."""
+        self._response_cache[key] = (time.monotonic(), value)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+            self._response_cache.popitem(last=False)
+
     # -------------------------------------------------------------------------
     # Products
     # -------------------------------------------------------------------------
 
     async def list_products(
-        self, skip: int = 0, top: int = 50, **filters: Any
+        self, skip: int = 0, top: int = 50, use_cache: bool = True, **filters: Any
     ) -> list[Product]:
         """List available products with pagination.
 
         Args:
             skip: Number of items to skip
             top: Maximum number of items to return
+            use_cache: Whether to consult and populate the response cache
             **filters: Additional filter parameters
 
         Returns:
             List of Product objects
         """
         params = {"$skip": skip, "$top": top, **filters}
+        key = ("list_products", json.dumps(params, sort_keys=True, default=str))
+        if use_cache and (cached := self._cache_get(key)) is not None:
+            return list(cached)
+
         response = await self._client.get("/products", params=params)
         response.raise_for_status()
         data = response.json()
         products = data.get("products", data) if isinstance(data, dict) else data
-        return [Product.model_validate(p) for p in products]
+        result = [Product.model_validate(p) for p in products]
+        if use_cache:
+            self._cache_put(key, result)
+        return list(result)
 
     async def get_product(self, product_id: str) -> Product:
         """Get a single product by ID.
@@ -90,37 +143,56 @@ class OpenDirectClient:
         """
         response = await self._client.get(f"/products/{product_id}")
         response.raise_for_status()
-        return Product.model_validate(response.json())
+        return Product.model_validate_json(response.content)
 
-    async def search_products(self, filters: dict[str, Any]) -> list[Product]:
+    async def search_products(
+        self, filters: dict[str, Any], use_cache: bool = True
+    ) -> list[Product]:
         """Search products with filters.
 
         Args:
             filters: Search filter parameters (channel, format, pricing, etc.)
+            use_cache: Whether to consult and populate the response cache
 
         Returns:
             List of matching Product objects
         """
+        key = ("search_products", json.dumps(filters, sort_keys=True, default=str))
+        if use_cache and (cached := self._cache_get(key)) is not None:
+            return list(cached)
+
         response = await self._client.post("/products/search", json=filters)
         response.raise_for_status()
         data = response.json()
         products = data.get("products", data) if isinstance(data, dict) else data
-        return [Product.model_validate(p) for p in products]
-
-    async def check_avails(self, request: AvailsRequest) -> AvailsResponse:
+        result = [Product.model_validate(p) for p in products]
+        if use_cache:
+            self._cache_put(key, result)
+        return list(result)
+
+    async def check_avails(
+        self, request: AvailsRequest, use_cache: bool = True
+    ) -> AvailsResponse:
         """Check availability and pricing for a product.
 
         Args:
             request: Availability check request parameters
+            use_cache: Whether to consult and populate the response cache
 
         Returns:
             AvailsResponse with availability and pricing info
         """
-        response = await self._client.post(
-            "/products/avails", json=request.model_dump(by_alias=True, exclude_none=True)
-        )
+        body = request.model_dump(mode="json", by_alias=True, exclude_none=True)
+        key = ("check_avails", json.dumps(body, sort_keys=True, default=str))
+        if use_cache and (cached := self._cache_get(key)) is not None:
+            return cached
+
+        response = await self._client.post("/products/avails", json=body)
         response.raise_for_status()
-        return AvailsResponse.model_validate(response.json())
+        result = AvailsResponse.model_validate_json(response.content)
+        if use_cache:
+            self._cache_put(key, result)
+        return result
 
     # -------------------------------------------------------------------------
     # Accounts
@@ -136,10 +208,10 @@ class OpenDirectClient:
             Created Account with ID
         """
         response = await self._client.post(
-            "/accounts", json=account.model_dump(by_alias=True, exclude_none=True)
+            "/accounts", json=account.model_dump(mode="json", by_alias=True, exclude_none=True)
         )
         response.raise_for_status()
-        return Account.model_validate(response.json())
+        return Account.model_validate_json(response.content)
 
     async def get_account(self, account_id: str) -> Account:
         """Get an account by ID.
@@ -152,7 +224,7 @@ class OpenDirectClient:
         """
         response = await self._client.get(f"/accounts/{account_id}")
         response.raise_for_status()
-        return Account.model_validate(response.json())
+        return Account.model_validate_json(response.content)
 
     async def list_accounts(self, skip: int = 0, top: int = 50) -> list[Account]:
         """List accounts with pagination.
@@ -187,10 +259,10 @@ class OpenDirectClient:
         """
         response = await self._client.post(
             f"/accounts/{account_id}/orders",
-            json=order.model_dump(by_alias=True, exclude_none=True),
+            json=order.model_dump(mode="json", by_alias=True, exclude_none=True),
         )
         response.raise_for_status()
-        return Order.model_validate(response.json())
+        return Order.model_validate_json(response.content)
 
     async def get_order(self, account_id: str, order_id: str) -> Order:
         """Get an order by ID.
@@ -204,7 +276,7 @@ class OpenDirectClient:
         """
         response = await self._client.get(f"/accounts/{account_id}/orders/{order_id}")
         response.raise_for_status()
-        return Order.model_validate(response.json())
+        return Order.model_validate_json(response.content)
 
     async def list_orders(
         self, account_id: str, skip: int = 0, top: int = 50
@@ -241,10 +313,10 @@ class OpenDirectClient:
         """
         response = await self._client.patch(
             f"/accounts/{account_id}/orders/{order_id}",
-            json=order.model_dump(by_alias=True, exclude_none=True),
+            json=order.model_dump(mode="json", by_alias=True, exclude_none=True),
         )
         response.raise_for_status()
-        return Order.model_validate(response.json())
+        return Order.model_validate_json(response.content)
 
     # -------------------------------------------------------------------------
     # Lines
@@ -265,10 +337,10 @@ class OpenDirectClient:
         """
         response = await self._client.post(
             f"/accounts/{account_id}/orders/{order_id}/lines",
-            json=line.model_dump(by_alias=True, exclude_none=True),
+            json=line.model_dump(mode="json", by_alias=True, exclude_none=True),
         )
         response.raise_for_status()
-        return Line.model_validate(response.json())
+        return Line.model_validate_json(response.content)
 
     async def get_line(self, account_id: str, order_id: str, line_id: str) -> Line:
         """Get a line item by ID.
@@ -285,7 +357,7 @@ class OpenDirectClient:
             f"/accounts/{account_id}/orders/{order_id}/lines/{line_id}"
         )
         response.raise_for_status()
-        return Line.model_validate(response.json())
+        return Line.model_validate_json(response.content)
 
     async def list_lines(
         self, account_id: str, order_id: str, skip: int = 0, top: int = 50
@@ -328,7 +400,8 @@ class OpenDirectClient:
             params={"action": "reserve"},
         )
         response.raise_for_status()
-        return Line.model_validate(response.json())
+        self.clear_cache()
+        return Line.model_validate_json(response.content)
 
     async def book_line(self, account_id: str, order_id: str, line_id: str) -> Line:
         """Confirm booking for a line item.
@@ -346,7 +419,8 @@ class OpenDirectClient:
             params={"action": "book"},
         )
         response.raise_for_status()
-        return Line.model_validate(response.json())
+        self.clear_cache()
+        return Line.model_validate_json(response.content)
 
     async def cancel_line(
         self, account_id: str, order_id: str, line_id: str
@@ -366,7 +440,8 @@ class OpenDirectClient:
             params={"action": "cancel"},
         )
         response.raise_for_status()
-        return Line.model_validate(response.json())
+        self.clear_cache()
+        return Line.model_validate_json(response.content)
 
     async def get_line_stats(
         self, account_id: str, order_id: str, line_id: str
@@ -385,7 +460,7 @@ class OpenDirectClient:
             f"/accounts/{account_id}/orders/{order_id}/lines/{line_id}/stats"
         )
         response.raise_for_status()
-        return LineStats.model_validate(response.json())
+        return LineStats.model_validate_json(response.content)
 
     # -------------------------------------------------------------------------
     # Creatives
@@ -403,10 +478,10 @@ class OpenDirectClient:
         """
         response = await self._client.post(
             f"/accounts/{account_id}/creatives",
-            json=creative.model_dump(by_alias=True, exclude_none=True),
+            json=creative.model_dump(mode="json", by_alias=True, exclude_none=True),
         )
         response.raise_for_status()
-        return Creative.model_validate(response.json())
+        return Creative.model_validate_json(response.content)
 
     async def get_creative(self, account_id: str, creative_id: str) -> Creative:
         """Get a creative by ID.
@@ -422,7 +497,7 @@ class OpenDirectClient:
             f"/accounts/{account_id}/creatives/{creative_id}"
         )
         response.raise_for_status()
-        return Creative.model_validate(response.json())
+        return Creative.model_validate_json(response.content)
 
     async def list_creatives(
         self, account_id: str, skip: int = 0, top: int = 50
@@ -7,13 +7,19 @@ This client handles the exchange of embeddings between buyer and seller agents
 following the IAB Tech Lab UCP specification.
 """
 
+import asyncio
 import logging
 import math
+import random
+import time
+import weakref
 from datetime import datetime
 from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
 
 import httpx
 
+from ..config.settings import get_settings
 from ..models.ucp import (
     AudienceCapability,
     AudienceValidationResult,
@@ -30,6 +36,49 @@ logger = logging.getLogger(__name__)
 # UCP Content-Type header
 UCP_CONTENT_TYPE = "application/vnd.ucp.embedding+json; v=1"
 
+# Seller capabilities are effectively static over short windows, so discovery
+# responses are cached per endpoint and shared by every UCPClient instance.
+CAPABILITIES_CACHE_TTL_SECONDS = 60.0
+
+_capabilities_cache: dict[str, tuple[float, list[AudienceCapability]]] = {}
+_capabilities_inflight: dict[str, "asyncio.Future[list[AudienceCapability]]"] = {}
+
+
+# Seller requests are capped per event loop (UCP_MAX_CONCURRENCY) and
+# rate-limited or failed responses are retried with jittered backoff.
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# A 5xx may arrive after the seller applied the request, so methods that are
+# not idempotent (embedding POSTs) are only retried when rate-limited
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RATE_LIMITED_STATUS_CODES = frozenset({429})
+MAX_ATTEMPTS = 5
+RETRY_BACKOFF_SECONDS = 0.1
+
+_seller_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+
+def _seller_semaphore() -> asyncio.Semaphore:
+    """Get the seller request semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _seller_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_settings().ucp_max_concurrency)
+        _seller_semaphores[loop] = semaphore
+    return semaphore
+
+
+def clear_capabilities_cache() -> None:
+    """Drop all cached capability discovery responses."""
+    _capabilities_cache.clear()
+
+
+def _is_cacheable_endpoint(endpoint: str) -> bool:
+    """Check whether discovery responses for an endpoint may be cached."""
+    return "nocache" not in parse_qs(urlsplit(endpoint).query, keep_blank_values=True)
+
 
 class UCPExchangeResult:
     """Result of a UCP embedding exchange."""
@@ -90,6 +139,46 @@ class UCPClient:
         if self._client and not self._client.is_closed:
             await self._client.aclose()
 
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request to a seller with bounded concurrency and retries.
+
+        Idempotent requests are retried on any status in
+        ``RETRY_STATUS_CODES``; other methods only on a 429. Retries happen up
+        to ``MAX_ATTEMPTS`` times with exponential backoff and jitter. The
+        concurrency slot is released while backing off.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            **kwargs: Passed through to ``httpx.AsyncClient.request``
+
+        Returns:
+            The final HTTP response
+        """
+        client = await self._get_client()
+        retry_statuses = (
+            RETRY_STATUS_CODES
+            if method.upper() in IDEMPOTENT_METHODS
+            else RATE_LIMITED_STATUS_CODES
+        )
+
+        for attempt in range(MAX_ATTEMPTS):
+            async with _seller_semaphore():
+                response = await client.request(method, url, **kwargs)
+            if (
+                response.status_code not in retry_statuses
+                or attempt == MAX_ATTEMPTS - 1
+            ):
+                return response
+            delay = RETRY_BACKOFF_SECONDS * 2**attempt + random.random() * 0.05
+            logger.warning(
+                f"UCP {method} {url} returned {response.status_code}, "
+                f"retrying in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
+
+        return response
+
     async def send_embedding(
         self,
         embedding: UCPEmbedding,
@@ -104,15 +193,14 @@ class UCPClient:
         Returns:
             Response from the seller endpoint
         """
-        client = await self._get_client()
-
         headers = {
             "Content-Type": UCP_CONTENT_TYPE,
             "Accept": UCP_CONTENT_TYPE,
         }
 
         try:
-            response = await client.post(
+            response = await self._request(
+                "POST",
                 endpoint,
                 json=embedding.model_dump(by_alias=True, mode="json"),
                 headers=headers,
@@ -141,12 +229,11 @@ class UCPClient:
         Returns:
             UCPEmbedding if successful, None otherwise
         """
-        client = await self._get_client()
-
         headers = {"Accept": UCP_CONTENT_TYPE}
 
         try:
-            response = await client.get(
+            response = await self._request(
+                "GET",
                 endpoint,
                 params=query_params,
                 headers=headers,
@@ -165,19 +252,69 @@ class UCPClient:
     async def discover_capabilities(
         self,
         endpoint: str,
+        use_cache: bool = True,
     ) -> list[AudienceCapability]:
         """Discover audience capabilities from a seller endpoint.
 
+        Responses are cached per endpoint for ``CAPABILITIES_CACHE_TTL_SECONDS``
+        and concurrent requests for the same endpoint share a single upstream
+        call. Endpoints with a ``nocache`` query parameter, responses marked
+        ``Cache-Control: no-store`` and empty results are never cached.
+
         Args:
             endpoint: Seller's capability discovery endpoint
+            use_cache: Whether to consult and populate the shared cache
 
         Returns:
             List of available audience capabilities
         """
-        client = await self._get_client()
+        if not use_cache or not _is_cacheable_endpoint(endpoint):
+            capabilities, _ = await self._fetch_capabilities(endpoint)
+            return capabilities
+
+        entry = _capabilities_cache.get(endpoint)
+        if entry and time.monotonic() - entry[0] < CAPABILITIES_CACHE_TTL_SECONDS:
+            return list(entry[1])
+
+        loop = asyncio.get_running_loop()
+        pending = _capabilities_inflight.get(endpoint)
+        if pending is not None and pending.get_loop() is loop:
+            try:
+                return list(await asyncio.shield(pending))
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+            # The leading request was cancelled, not this one; start over so
+            # one follower leads a fresh fetch for the rest
+            return await self.discover_capabilities(endpoint)
+
+        future: asyncio.Future[list[AudienceCapability]] = loop.create_future()
+        _capabilities_inflight[endpoint] = future
+        try:
+            capabilities, cacheable = await self._fetch_capabilities(endpoint)
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            if _capabilities_inflight.get(endpoint) is future:
+                del _capabilities_inflight[endpoint]
+
+        if cacheable and capabilities:
+            _capabilities_cache[endpoint] = (time.monotonic(), capabilities)
+        future.set_result(capabilities)
+        return list(capabilities)
+
+    async def _fetch_capabilities(
+        self,
+        endpoint: str,
+    ) -> tuple[list[AudienceCapability], bool]:
+        """Fetch capabilities from the seller, bypassing the cache.
 
+        Returns:
+            Tuple of (capabilities, whether the response may be cached)
+        """
         try:
-            response = await client.get(endpoint)
+            response = await self._request("GET", endpoint)
             response.raise_for_status()
             data = response.json()
 
@@ -188,11 +325,12 @@ class UCPClient:
                 except Exception as e:
                     logger.warning(f"Failed to parse capability: {e}")
 
-            return capabilities
+            cache_control = response.headers.get("Cache-Control", "").lower()
+            return capabilities, "no-store" not in cache_control
 
         except Exception as e:
             logger.error(f"Capability discovery failed: {e}")
-            return []
+            return [], False
 
     def compute_similarity(
         self,
@@ -272,15 +410,14 @@ class UCPClient:
             UCPExchangeResult with similarity score and embeddings
         """
         # Send buyer embedding and expect seller embedding in response
-        client = await self._get_client()
-
         headers = {
             "Content-Type": UCP_CONTENT_TYPE,
             "Accept": UCP_CONTENT_TYPE,
         }
 
         try:
-            response = await client.post(
+            response = await self._request(
+                "POST",
                 seller_endpoint,
                 json=buyer_embedding.model_dump(by_alias=True, mode="json"),
                 headers=headers,
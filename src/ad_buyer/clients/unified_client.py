@@ -3,11 +3,15 @@
 
 """Unified client for IAB agentic-direct server supporting both MCP and A2A protocols."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Optional, Union
 
+import httpx
+
 from .a2a_client import A2AClient, A2AResponse
+from .http_pool import shared_http_client
 from .mcp_client import IABMCPClient, MCPToolResult
 
 if TYPE_CHECKING:
@@ -90,6 +94,7 @@ class UnifiedClient:
         protocol: Protocol = Protocol.MCP,
         a2a_agent_type: str = "buyer",
         buyer_identity: "Optional[BuyerIdentity]" = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """Initialize the unified client.
 
@@ -98,11 +103,14 @@ class UnifiedClient:
             protocol: Default protocol to use (MCP or A2A)
             a2a_agent_type: Agent type for A2A ('buyer' or 'seller')
             buyer_identity: Optional BuyerIdentity for tiered pricing access
+            http_client: HTTP client for A2A requests (defaults to the shared
+                keep-alive pool, which close() leaves open)
         """
         self.base_url = base_url
         self.default_protocol = protocol
         self.a2a_agent_type = a2a_agent_type
         self.buyer_identity = buyer_identity
+        self._http_client = http_client
 
         self._mcp_client: Optional[IABMCPClient] = None
         self._a2a_client: Optional[A2AClient] = None
@@ -124,6 +132,7 @@ class UnifiedClient:
                 self._a2a_client = A2AClient(
                     base_url=self.base_url,
                     agent_type=self.a2a_agent_type,
+                    http_client=self._http_client or shared_http_client(),
                 )
                 # A2A doesn't need explicit connect
 
@@ -258,9 +267,40 @@ class UnifiedClient:
 
     # Convenience methods that use the default protocol
 
-    async def list_products(self, protocol: Protocol = None) -> UnifiedResult:
-        """List available advertising products."""
-        return await self.call_tool("list_products", protocol=protocol)
+    async def list_products(
+        self,
+        protocol: Protocol = None,
+        filters: dict = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> UnifiedResult:
+        """List available advertising products.
+
+        Args:
+            protocol: Protocol to use for the request
+            filters: Optional filters for the seller to apply server-side,
+                sent only when the seller's list_products or search_products
+                tool declares a ``filters`` argument; otherwise the unfiltered
+                list is returned
+            fields: Optional product fields to return, sent only when the
+                seller's tool declares a ``fields`` argument
+
+        Returns:
+            UnifiedResult with the product list
+        """
+        args = await self._declared_args(
+            "list_products",
+            {"filters": filters, "fields": list(fields) if fields else None},
+            protocol,
+        )
+        if filters and "filters" not in args:
+            search_args = await self._declared_args(
+                "search_products",
+                {"filters": filters, "fields": list(fields) if fields else None},
+                protocol,
+            )
+            if "filters" in search_args:
+                return await self.call_tool("search_products", search_args, protocol=protocol)
+        return await self.call_tool("list_products", args or None, protocol=protocol)
 
     async def get_product(self, product_id: str, protocol: Protocol = None) -> UnifiedResult:
         """Get a specific product by ID."""
@@ -271,6 +311,7 @@ class UnifiedClient:
         query: str = None,
         filters: dict = None,
         protocol: Protocol = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> UnifiedResult:
         """Search for products."""
         args = {}
@@ -278,8 +319,44 @@ class UnifiedClient:
             args["query"] = query
         if filters:
             args["filters"] = filters
+        args.update(await self._projection("search_products", fields, protocol))
         return await self.call_tool("search_products", args, protocol=protocol)
 
+    async def _projection(
+        self,
+        tool_name: str,
+        fields: Optional[Sequence[str]],
+        protocol: Optional[Protocol],
+    ) -> dict[str, Any]:
+        """Build field-projection arguments for a product tool.
+
+        Projection is only requested over MCP, and only when the seller's tool
+        schema declares a ``fields`` argument; otherwise the full product is
+        returned as before.
+        """
+        return await self._declared_args(
+            tool_name, {"fields": list(fields) if fields else None}, protocol
+        )
+
+    async def _declared_args(
+        self,
+        tool_name: str,
+        args: dict[str, Any],
+        protocol: Optional[Protocol],
+    ) -> dict[str, Any]:
+        """Keep the optional arguments a seller's MCP tool schema declares.
+
+        Empty values are dropped, and nothing is kept over A2A, so sellers
+        that predate an argument keep receiving the original call.
+        """
+        args = {key: value for key, value in args.items() if value}
+        if not args or (protocol or self.default_protocol) != Protocol.MCP:
+            return {}
+        await self._ensure_protocol(Protocol.MCP)
+        schema = self.tools.get(tool_name, {}).get("schema") or {}
+        properties = schema.get("properties", {})
+        return {key: value for key, value in args.items() if key in properties}
+
     async def list_accounts(self, protocol: Protocol = None) -> UnifiedResult:
         """List all accounts."""
         return await self.call_tool("list_accounts", protocol=protocol)
@@ -450,28 +527,27 @@ class UnifiedClient:
         Returns:
             UnifiedResult with discovered inventory
         """
-        # Build filters including identity context
-        filters = self._get_identity_context()
+        # Build predicate filters; identity context alone does not narrow the catalog
+        predicates = {}
         if channel:
-            filters["channel"] = channel
+            predicates["channel"] = channel
         if max_cpm is not None:
-            filters["maxPrice"] = max_cpm
+            predicates["maxPrice"] = max_cpm
         if min_impressions is not None:
-            filters["minImpressions"] = min_impressions
+            predicates["minImpressions"] = min_impressions
         if targeting:
-            filters["targeting"] = targeting
+            predicates["targeting"] = targeting
         if publisher:
-            filters["publisher"] = publisher
-
-        args = {"filters": filters}
-        if query:
-            args["query"] = query
+            predicates["publisher"] = publisher
+        filters = {**self._get_identity_context(), **predicates}
 
         # Try search_products first, fall back to list_products
         if query:
+            args = {"filters": filters, "query": query}
             return await self.call_tool("search_products", args, protocol=protocol)
-        else:
-            return await self.call_tool("list_products", protocol=protocol)
+        if predicates:
+            return await self.list_products(protocol=protocol, filters=filters)
+        return await self.call_tool("list_products", protocol=protocol)
 
     async def get_pricing(
         self,
@@ -610,19 +686,20 @@ class UnifiedClient:
                 final_price = floor_price
 
         # Generate Deal ID
-        timestamp = datetime.now().strftime("%Y%m%d%H%M")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d%H%M")
         identity_seed = ""
         if self.buyer_identity:
             identity_seed = self.buyer_identity.agency_id or self.buyer_identity.seat_id or "public"
         seed = f"{product_id}-{identity_seed}-{timestamp}"
-        hash_suffix = hashlib.md5(seed.encode()).hexdigest()[:8].upper()
+        hash_suffix = hashlib.blake2b(seed.encode(), digest_size=4).hexdigest().upper()
         deal_id = f"DEAL-{hash_suffix}"
 
         # Default flight dates
         if not flight_start:
-            flight_start = datetime.now().strftime("%Y-%m-%d")
+            flight_start = now.strftime("%Y-%m-%d")
         if not flight_end:
-            flight_end = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
+            flight_end = (now + timedelta(days=30)).strftime("%Y-%m-%d")
 
         # Build deal response
         deal_data = {
@@ -644,7 +721,7 @@ class UnifiedClient:
                 "xandr": f"Xandr > Inventory > Deals > Create Deal with ID: {deal_id}",
                 "yahoo": f"Yahoo DSP > Inventory > Private Marketplace > Enter Deal ID: {deal_id}",
             },
-            "expires_at": (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d"),
+            "expires_at": (now + timedelta(days=7)).strftime("%Y-%m-%d"),
         }
 
         return UnifiedResult(
@@ -28,6 +28,9 @@ class Settings(BaseSettings):
     opendirect_token: Optional[str] = None
     opendirect_api_key: Optional[str] = None
 
+    # UCP audience exchange: max concurrent requests to sellers per event loop
+    ucp_max_concurrency: int = 64
+
     def get_seller_endpoints(self) -> list[str]:
         """Parse seller endpoints from comma-separated string.
 
@@ -16,11 +16,22 @@ from ..agents.level3.research_agent import create_research_agent
 from ..agents.level3.audience_planner_agent import create_audience_planner_agent
 from ..clients.opendirect_client import OpenDirectClient
 from ..config.settings import settings
-from ..tools.execution.line_management import BookLineTool, CreateLineTool, ReserveLineTool
+from ..tools.execution.line_management import (
+    BookLineTool,
+    CreateLineTool,
+    CreateLinesBulkTool,
+    ReserveAndBookLineTool,
+    ReserveLineTool,
+)
 from ..tools.execution.order_management import CreateOrderTool
 from ..tools.research.avails_check import AvailsCheckTool
 from ..tools.research.product_search import ProductSearchTool
-from ..tools.audience import AudienceDiscoveryTool, AudienceMatchingTool, CoverageEstimationTool
+from ..tools.audience import (
+    AudienceDiscoveryTool,
+    AudienceMatchingTool,
+    CoverageEstimationTool,
+    PlanAudienceTool,
+)
 
 
 def _create_research_tools(client: OpenDirectClient) -> list[Any]:
@@ -36,8 +47,10 @@ def _create_execution_tools(client: OpenDirectClient) -> list[Any]:
     return [
         CreateOrderTool(client),
         CreateLineTool(client),
+        CreateLinesBulkTool(client),
         ReserveLineTool(client),
         BookLineTool(client),
+        ReserveAndBookLineTool(client),
     ]
 
 
@@ -47,6 +60,7 @@ def _create_audience_tools() -> list[Any]:
         AudienceDiscoveryTool(),
         AudienceMatchingTool(),
         CoverageEstimationTool(),
+        PlanAudienceTool(),
     ]
 
 
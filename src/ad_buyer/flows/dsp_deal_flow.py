@@ -21,6 +21,7 @@ from ..models.buyer_identity import (
     DealResponse,
     DealType,
 )
+from ..runtime import run_sync
 from ..tools.dsp import DiscoverInventoryTool, GetPricingTool, RequestDealTool
 
 
@@ -147,7 +148,9 @@ class DSPDealFlow(Flow[DSPFlowState]):
         self._client = client
         self._buyer_context = buyer_context
 
-        # Create tools
+        # Create tools. Flow steps call _run directly: arguments come from the
+        # already-validated flow state, so BaseTool.run's args_schema
+        # validation would only repeat work.
         self._discover_tool = DiscoverInventoryTool(
             client=client,
             buyer_context=buyer_context,
@@ -322,16 +325,22 @@ Return the product_id of the best matching product and explain why.""",
         try:
             self.state.status = DSPFlowStatus.REQUESTING_DEAL
 
-            deal_result = self._deal_tool._run(
-                product_id=product_id,
-                deal_type=self.state.deal_type.value,
-                impressions=self.state.impressions,
-                flight_start=self.state.flight_start,
-                flight_end=self.state.flight_end,
+            deal = run_sync(
+                self._deal_tool.request_deal(
+                    product_id=product_id,
+                    deal_type=self.state.deal_type.value,
+                    impressions=self.state.impressions,
+                    flight_start=self.state.flight_start,
+                    flight_end=self.state.flight_end,
+                )
             )
+            deal_result = self._deal_tool._format_deal_response(deal)
 
-            # Store deal response
-            self.state.deal_response = {"raw": deal_result}
+            # Store the structured deal alongside its formatted text
+            self.state.deal_response = {
+                "raw": deal_result,
+                **deal.model_dump(mode="json"),
+            }
             self.state.status = DSPFlowStatus.DEAL_CREATED
             self.state.updated_at = datetime.utcnow()
 
@@ -18,6 +18,25 @@ class AccessTier(str, Enum):
     ADVERTISER = "advertiser"  # Agency + Advertiser - 15% discount
 
 
+# Discount percentage unlocked by each access tier
+TIER_DISCOUNTS: dict[AccessTier, float] = {
+    AccessTier.PUBLIC: 0.0,
+    AccessTier.SEAT: 5.0,
+    AccessTier.AGENCY: 10.0,
+    AccessTier.ADVERTISER: 15.0,
+}
+
+# Tiers that may negotiate prices and access premium inventory
+NEGOTIATING_TIERS: frozenset[AccessTier] = frozenset(
+    {AccessTier.AGENCY, AccessTier.ADVERTISER}
+)
+
+# Tiers eligible for volume discounts on large impression requests
+VOLUME_DISCOUNT_TIERS: frozenset[AccessTier] = frozenset(
+    {AccessTier.AGENCY, AccessTier.ADVERTISER}
+)
+
+
 class DealType(str, Enum):
     """Programmatic deal types."""
 
@@ -89,14 +108,16 @@ class BuyerIdentity(BaseModel):
         Returns:
             Discount percentage (0-15) based on tier.
         """
+        return TIER_DISCOUNTS[self.get_access_tier()]
+
+    def get_tier_and_discount(self) -> tuple[AccessTier, float]:
+        """Get the access tier and its discount with a single tier lookup.
+
+        Returns:
+            Tuple of (access tier, discount percentage).
+        """
         tier = self.get_access_tier()
-        discounts = {
-            AccessTier.PUBLIC: 0.0,
-            AccessTier.SEAT: 5.0,
-            AccessTier.AGENCY: 10.0,
-            AccessTier.ADVERTISER: 15.0,
-        }
-        return discounts[tier]
+        return tier, TIER_DISCOUNTS[tier]
 
     def to_header_dict(self) -> dict[str, str]:
         """Convert identity to HTTP headers for API calls.
@@ -182,8 +203,7 @@ class BuyerContext(BaseModel):
         Returns:
             True if negotiation is available at this tier.
         """
-        tier = self.get_access_tier()
-        return tier in (AccessTier.AGENCY, AccessTier.ADVERTISER)
+        return self.get_access_tier() in NEGOTIATING_TIERS
 
     def can_access_premium_inventory(self) -> bool:
         """Check if buyer has access to premium inventory.
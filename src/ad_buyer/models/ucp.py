@@ -11,10 +11,22 @@ Transport: HTTPS JSON with Content-Type: application/vnd.ucp.embedding+json; v=1
 """
 
 from datetime import datetime
+from decimal import ROUND_HALF_EVEN, Decimal
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+_TENTH = Decimal("0.1")
+
+
+def percentage_tenths(percentage: float) -> int:
+    """Round a percentage to whole tenths exactly as ``f"{percentage:.1f}"`` does.
+
+    The float converts to Decimal exactly, so halves are decided on the stored
+    binary value, not on the inexact product ``percentage * 10``.
+    """
+    return int(Decimal(percentage).quantize(_TENTH, rounding=ROUND_HALF_EVEN).scaleb(1))
 
 
 class EmbeddingType(str, Enum):
@@ -395,3 +407,14 @@ class CoverageEstimate(BaseModel):
     )
 
     model_config = {"populate_by_name": True}
+
+    _coverage_tenths: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Round the coverage to tenths once, when the estimate is built."""
+        self._coverage_tenths = percentage_tenths(self.coverage_percentage)
+
+    @property
+    def coverage_tenths(self) -> int:
+        """Coverage in tenths of a percent, for one-decimal display."""
+        return self._coverage_tenths
@@ -0,0 +1,8 @@
+# Author: Green Mountain Systems AI Inc.
+# Donated to IAB Tech Lab
+
+"""Runtime helpers shared across the ad buyer system."""
+
+from .loop import get_loop, run_sync
+
+__all__ = ["get_loop", "run_sync"]
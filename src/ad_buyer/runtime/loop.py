@@ -0,0 +1,49 @@
+# Author: Green Mountain Systems AI Inc.
+# Donated to IAB Tech Lab
+
+"""Persistent background event loop for synchronous tool entry points.
+
+crewai calls a tool's synchronous ``_run``. Running each call through
+``asyncio.run`` creates and tears down a new event loop every time, which
+discards pooled HTTP connections and fails outright when the caller is
+already inside a running loop. Instead, coroutines are submitted to a
+single long-lived loop running in a daemon thread.
+"""
+
+import asyncio
+import threading
+from collections.abc import Coroutine
+from typing import Any, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background loop, starting it on first use."""
+    global _loop
+    if _loop is None:
+        with _lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="ad-buyer-loop",
+                    daemon=True,
+                ).start()
+                _loop = loop
+    return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the background loop and wait for its result.
+
+    Args:
+        coro: Coroutine to execute
+
+    Returns:
+        The coroutine's return value
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result()
@@ -7,6 +7,7 @@ from .audience import (
     AudienceDiscoveryTool,
     AudienceMatchingTool,
     CoverageEstimationTool,
+    PlanAudienceTool,
 )
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "AudienceDiscoveryTool",
     "AudienceMatchingTool",
     "CoverageEstimationTool",
+    "PlanAudienceTool",
 ]
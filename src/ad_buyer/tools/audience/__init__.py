@@ -4,15 +4,18 @@
 """Audience planning tools for the Ad Buyer System.
 
 These tools enable audience discovery, matching, and coverage estimation
-using the IAB Tech Lab User Context Protocol (UCP).
+using the IAB Tech Lab User Context Protocol (UCP). PlanAudienceTool combines
+all three into a single call.
 """
 
 from .audience_discovery import AudienceDiscoveryTool
 from .audience_matching import AudienceMatchingTool
+from .audience_planning import PlanAudienceTool
 from .coverage_estimation import CoverageEstimationTool
 
 __all__ = [
     "AudienceDiscoveryTool",
     "AudienceMatchingTool",
     "CoverageEstimationTool",
+    "PlanAudienceTool",
 ]
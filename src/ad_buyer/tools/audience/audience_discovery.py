@@ -3,14 +3,184 @@
 
 """Audience Discovery Tool - Discover available audience signals from sellers."""
 
-import asyncio
-from typing import Any, Optional, Type
+from collections import defaultdict
+from collections.abc import Iterator, Sequence
+from typing import Any, Optional
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from ...clients.ucp_client import UCPClient
 from ...models.ucp import AudienceCapability, SignalType
+from ...runtime import run_sync
+from .mock_data import MockCapability
+
+# Mock capabilities returned when a seller advertises none
+_MOCK_CAPABILITIES: tuple[MockCapability, ...] = (
+    MockCapability(
+        capability_id="cap_demo_age",
+        name="Age Demographics",
+        description="Age-based targeting using modeled data",
+        signal_type=SignalType.IDENTITY,
+        coverage_percentage=75.0,
+        available_segments=("18-24", "25-34", "35-44", "45-54", "55+"),
+        taxonomy="IAB-1.0",
+        ucp_compatible=True,
+        embedding_dimension=512,
+    ),
+    MockCapability(
+        capability_id="cap_demo_gender",
+        name="Gender Demographics",
+        description="Gender-based targeting using modeled data",
+        signal_type=SignalType.IDENTITY,
+        coverage_percentage=70.0,
+        available_segments=("male", "female"),
+        taxonomy="IAB-1.0",
+        ucp_compatible=True,
+        embedding_dimension=512,
+    ),
+    MockCapability(
+        capability_id="cap_ctx_categories",
+        name="Content Categories",
+        description="IAB content category targeting",
+        signal_type=SignalType.CONTEXTUAL,
+        coverage_percentage=95.0,
+        available_segments=("IAB1", "IAB2", "IAB3", "IAB4", "IAB5"),
+        taxonomy="IAB-2.2",
+        ucp_compatible=True,
+        embedding_dimension=512,
+    ),
+    MockCapability(
+        capability_id="cap_ctx_keywords",
+        name="Keyword Targeting",
+        description="Content keyword targeting",
+        signal_type=SignalType.CONTEXTUAL,
+        coverage_percentage=90.0,
+        available_segments=(),
+        ucp_compatible=True,
+        embedding_dimension=512,
+    ),
+    MockCapability(
+        capability_id="cap_int_purchase",
+        name="Purchase Intent",
+        description="In-market purchase intent signals",
+        signal_type=SignalType.REINFORCEMENT,
+        coverage_percentage=45.0,
+        available_segments=("auto", "travel", "finance", "retail"),
+        taxonomy="custom",
+        ucp_compatible=True,
+        embedding_dimension=512,
+    ),
+    MockCapability(
+        capability_id="cap_int_converters",
+        name="Past Converters",
+        description="Users who previously converted",
+        signal_type=SignalType.REINFORCEMENT,
+        coverage_percentage=15.0,
+        available_segments=("converters_30d", "converters_90d"),
+        taxonomy="custom",
+        ucp_compatible=True,
+        embedding_dimension=512,
+    ),
+)
+
+# Enum member -> value, so grouping avoids the .value descriptor per capability
+_SIGNAL_NAME: dict[SignalType, str] = {member: member.value for member in SignalType}
+
+# Common spellings -> enum member, so filtering rarely needs to lowercase input
+_STR_TO_SIGNAL: dict[str, SignalType] = {
+    spelling: member
+    for member in SignalType
+    for spelling in (member.value, member.value.upper(), member.value.title())
+}
+
+
+def _parse_signal_type(value: str) -> Optional[SignalType]:
+    """Resolve a case-insensitive signal type name, or None if unknown."""
+    return _STR_TO_SIGNAL.get(value) or _STR_TO_SIGNAL.get(value.lower())
+
+
+def filter_capabilities(
+    capabilities: Sequence[AudienceCapability | MockCapability],
+    signal_types: Optional[list[str]],
+    min_coverage: Optional[float],
+) -> list[AudienceCapability | MockCapability]:
+    """Filter by signal type and minimum coverage in a single pass."""
+    valid_types = frozenset(
+        signal
+        for signal in map(_parse_signal_type, signal_types or ())
+        if signal is not None
+    )
+    coverage_floor = min_coverage if min_coverage is not None else -1.0
+    return [
+        cap for cap in capabilities
+        if (not valid_types or cap.signal_type in valid_types)
+        and cap.coverage_percentage >= coverage_floor
+    ]
+
+
+def mock_capabilities() -> list[MockCapability]:
+    """Return mock capabilities for demonstration."""
+    return list(_MOCK_CAPABILITIES)
+
+
+def format_capabilities(
+    capabilities: Sequence[AudienceCapability | MockCapability],
+) -> str:
+    """Format capabilities as human-readable output."""
+    return "".join(_iter_capabilities(capabilities))
+
+
+def _iter_capabilities(
+    capabilities: Sequence[AudienceCapability | MockCapability],
+) -> Iterator[str]:
+    """Yield the capability listing as human-readable chunks."""
+    if not capabilities:
+        yield "No audience capabilities found matching your criteria."
+        return
+
+    # Group by signal type, accumulating summary totals in the same pass
+    by_signal_type: defaultdict[
+        str, list[AudienceCapability | MockCapability]
+    ] = defaultdict(list)
+    ucp_count = 0
+    coverage_sum = 0.0
+    for cap in capabilities:
+        by_signal_type[_SIGNAL_NAME[cap.signal_type]].append(cap)
+        ucp_count += cap.ucp_compatible
+        coverage_sum += cap.coverage_percentage
+
+    yield f"Found {len(capabilities)} audience capabilities:\n\n"
+
+    for signal_type, caps in sorted(by_signal_type.items()):
+        yield f"## {signal_type.upper()} SIGNALS\n"
+
+        for cap in caps:
+            ucp_status = "UCP" if cap.ucp_compatible else "NO-UCP"
+            yield (
+                f"\n**{cap.name}** [{ucp_status}]\n"
+                f"   ID: {cap.capability_id}\n"
+                f"   Coverage: {cap.coverage_percentage:.0f}%\n"
+            )
+            if cap.description:
+                yield f"   Description: {cap.description}\n"
+            if cap.available_segments:
+                more = len(cap.available_segments) - 5
+                yield f"   Segments: {', '.join(cap.available_segments[:5])}"
+                if more > 0:
+                    yield f" (+{more} more)"
+                yield "\n"
+
+        yield "\n"
+
+    # Summary
+    avg_coverage = coverage_sum / len(capabilities)
+
+    yield (
+        "---\n"
+        f"Summary: {ucp_count}/{len(capabilities)} UCP-compatible, "
+        f"avg coverage: {avg_coverage:.0f}%"
+    )
 
 
 class AudienceDiscoveryInput(BaseModel):
@@ -43,7 +213,7 @@ class AudienceDiscoveryTool(BaseTool):
     Returns a list of audience signals the seller can provide, including
     coverage percentages and UCP compatibility status. Use this to understand
     what targeting options are available before planning audiences."""
-    args_schema: Type[BaseModel] = AudienceDiscoveryInput
+    args_schema: type[BaseModel] = AudienceDiscoveryInput
 
     def _run(
         self,
@@ -52,7 +222,7 @@ class AudienceDiscoveryTool(BaseTool):
         min_coverage: Optional[float] = None,
     ) -> str:
         """Execute the audience discovery."""
-        return asyncio.run(
+        return run_sync(
             self._arun(seller_endpoint, signal_types, min_coverage)
         )
 
@@ -74,143 +244,8 @@ class AudienceDiscoveryTool(BaseTool):
 
         if not capabilities:
             # Return mock capabilities for demonstration
-            capabilities = self._get_mock_capabilities()
-
-        # Filter by signal type if specified
-        if signal_types:
-            valid_types = set()
-            for st in signal_types:
-                try:
-                    valid_types.add(SignalType(st.lower()))
-                except ValueError:
-                    pass
-
-            if valid_types:
-                capabilities = [
-                    cap for cap in capabilities
-                    if cap.signal_type in valid_types
-                ]
-
-        # Filter by minimum coverage
-        if min_coverage is not None:
-            capabilities = [
-                cap for cap in capabilities
-                if cap.coverage_percentage >= min_coverage
-            ]
-
-        return self._format_results(capabilities)
-
-    def _get_mock_capabilities(self) -> list[AudienceCapability]:
-        """Return mock capabilities for demonstration."""
-        return [
-            AudienceCapability(
-                capability_id="cap_demo_age",
-                name="Age Demographics",
-                description="Age-based targeting using modeled data",
-                signal_type=SignalType.IDENTITY,
-                coverage_percentage=75.0,
-                available_segments=["18-24", "25-34", "35-44", "45-54", "55+"],
-                taxonomy="IAB-1.0",
-                ucp_compatible=True,
-                embedding_dimension=512,
-            ),
-            AudienceCapability(
-                capability_id="cap_demo_gender",
-                name="Gender Demographics",
-                description="Gender-based targeting using modeled data",
-                signal_type=SignalType.IDENTITY,
-                coverage_percentage=70.0,
-                available_segments=["male", "female"],
-                taxonomy="IAB-1.0",
-                ucp_compatible=True,
-                embedding_dimension=512,
-            ),
-            AudienceCapability(
-                capability_id="cap_ctx_categories",
-                name="Content Categories",
-                description="IAB content category targeting",
-                signal_type=SignalType.CONTEXTUAL,
-                coverage_percentage=95.0,
-                available_segments=["IAB1", "IAB2", "IAB3", "IAB4", "IAB5"],
-                taxonomy="IAB-2.2",
-                ucp_compatible=True,
-                embedding_dimension=512,
-            ),
-            AudienceCapability(
-                capability_id="cap_ctx_keywords",
-                name="Keyword Targeting",
-                description="Content keyword targeting",
-                signal_type=SignalType.CONTEXTUAL,
-                coverage_percentage=90.0,
-                available_segments=[],
-                ucp_compatible=True,
-                embedding_dimension=512,
-            ),
-            AudienceCapability(
-                capability_id="cap_int_purchase",
-                name="Purchase Intent",
-                description="In-market purchase intent signals",
-                signal_type=SignalType.REINFORCEMENT,
-                coverage_percentage=45.0,
-                available_segments=["auto", "travel", "finance", "retail"],
-                taxonomy="custom",
-                ucp_compatible=True,
-                embedding_dimension=512,
-            ),
-            AudienceCapability(
-                capability_id="cap_int_converters",
-                name="Past Converters",
-                description="Users who previously converted",
-                signal_type=SignalType.REINFORCEMENT,
-                coverage_percentage=15.0,
-                available_segments=["converters_30d", "converters_90d"],
-                taxonomy="custom",
-                ucp_compatible=True,
-                embedding_dimension=512,
-            ),
-        ]
-
-    def _format_results(self, capabilities: list[AudienceCapability]) -> str:
-        """Format capabilities as human-readable output."""
-        if not capabilities:
-            return "No audience capabilities found matching your criteria."
-
-        # Group by signal type
-        by_signal_type: dict[str, list[AudienceCapability]] = {}
-        for cap in capabilities:
-            signal = cap.signal_type.value
-            if signal not in by_signal_type:
-                by_signal_type[signal] = []
-            by_signal_type[signal].append(cap)
-
-        output = f"Found {len(capabilities)} audience capabilities:\n\n"
-
-        for signal_type, caps in sorted(by_signal_type.items()):
-            output += f"## {signal_type.upper()} SIGNALS\n"
-
-            for cap in caps:
-                ucp_status = "UCP" if cap.ucp_compatible else "NO-UCP"
-                output += f"\n**{cap.name}** [{ucp_status}]\n"
-                output += f"   ID: {cap.capability_id}\n"
-                output += f"   Coverage: {cap.coverage_percentage:.0f}%\n"
-                if cap.description:
-                    output += f"   Description: {cap.description}\n"
-                if cap.available_segments:
-                    segments_preview = cap.available_segments[:5]
-                    more = len(cap.available_segments) - 5
-                    output += f"   Segments: {', '.join(segments_preview)}"
-                    if more > 0:
-                        output += f" (+{more} more)"
-                    output += "\n"
-
-            output += "\n"
-
-        # Summary
-        ucp_count = sum(1 for cap in capabilities if cap.ucp_compatible)
-        avg_coverage = sum(cap.coverage_percentage for cap in capabilities) / len(capabilities)
-
-        output += "---\n"
-        output += f"Summary: {ucp_count}/{len(capabilities)} UCP-compatible, "
-        output += f"avg coverage: {avg_coverage:.0f}%"
-
-        return output
+            capabilities = mock_capabilities()
+
+        capabilities = filter_capabilities(capabilities, signal_types, min_coverage)
+
+        return format_capabilities(capabilities)
@@ -3,14 +3,160 @@
 
 """Audience Matching Tool - Match campaign audiences to inventory via UCP."""
 
-import asyncio
-from typing import Any, Optional, Type
+from bisect import bisect_right
+from collections.abc import Iterator
+from typing import Any, Optional
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from ...clients.ucp_client import UCPClient
-from ...models.ucp import UCPConsent
+from ...models.ucp import AudienceValidationResult, UCPConsent
+from ...runtime import run_sync
+from .mock_data import MockValidation
+
+# Score -> label lookups: a score at or above THRESH[i] maps to LABEL[i + 1]
+_QUALITY_THRESH = (0.3, 0.5, 0.7)
+_QUALITY_LABEL = ("POOR", "WEAK", "MODERATE", "STRONG")
+
+# Mock validation (status, targeting compatible) by score band
+_MOCK_STATUS_THRESH = (0.5, 0.7)
+_MOCK_STATUS = (
+    ("partial_match", False),
+    ("partial_match", True),
+    ("valid", True),
+)
+
+
+def mock_validation(requirements: dict[str, Any]) -> MockValidation:
+    """Return mock validation for demonstration."""
+    # Simulate different match levels based on requirements complexity
+    has_demographics = "demographics" in requirements
+    has_interests = "interests" in requirements
+    has_behaviors = "behaviors" in requirements
+
+    # Base score
+    score = 0.6
+
+    # Contextual signals (interests) have highest coverage
+    if has_interests and not has_demographics and not has_behaviors:
+        score = 0.85
+
+    # Demographics have good coverage
+    if has_demographics:
+        score = 0.72
+
+    # Behavioral targeting has lower coverage
+    if has_behaviors:
+        score = max(0.45, score - 0.15)
+
+    # Determine status
+    status, compatible = _MOCK_STATUS[bisect_right(_MOCK_STATUS_THRESH, score)]
+
+    gaps: tuple[str, ...] = ()
+    alternatives: tuple[dict[str, Any], ...] = ()
+    if has_behaviors:
+        gaps = ("behavioral_targeting",)
+        alternatives = ({
+            "gap": "behavioral_targeting",
+            "suggestion": "Use contextual signals with frequency capping as proxy",
+        },)
+
+    return MockValidation(
+        validation_status=status,
+        overall_coverage_percentage=score * 100,
+        matched_capabilities=(
+            "cap_ctx_categories",
+            "cap_ctx_keywords",
+        ) + (("cap_demo_age", "cap_demo_gender") if has_demographics else ()),
+        gaps=gaps,
+        alternatives=alternatives,
+        ucp_similarity_score=score,
+        targeting_compatible=compatible,
+        estimated_reach=int(1000000 * score),
+        validation_notes=(
+            f"UCP similarity: {score:.2f}",
+            f"Coverage: {score * 100:.1f}%",
+        ),
+    )
+
+
+def format_match_result(
+    requirements: dict[str, Any],
+    validation: AudienceValidationResult | MockValidation,
+) -> str:
+    """Format the matching result as human-readable output."""
+    return "".join(_iter_match_result(requirements, validation))
+
+
+def _iter_match_result(
+    requirements: dict[str, Any],
+    validation: AudienceValidationResult | MockValidation,
+) -> Iterator[str]:
+    """Yield the matching result as human-readable chunks."""
+    yield "## Audience Match Results\n\n"
+
+    # Requirements summary
+    yield "**Target Audience:**\n"
+    if "demographics" in requirements:
+        yield f"   Demographics: {requirements['demographics']}\n"
+    if "interests" in requirements:
+        yield f"   Interests: {', '.join(requirements['interests'])}\n"
+    if "behaviors" in requirements:
+        yield f"   Behaviors: {', '.join(requirements['behaviors'])}\n"
+    if "geography" in requirements:
+        yield f"   Geography: {requirements['geography']}\n"
+    yield "\n"
+
+    # Match score
+    score = validation.ucp_similarity_score or 0
+    status = validation.validation_status
+
+    match_quality = _QUALITY_LABEL[bisect_right(_QUALITY_THRESH, score)]
+
+    yield (
+        f"**Match Quality: {match_quality}**\n"
+        f"   UCP Similarity Score: {score:.2f}\n"
+        f"   Status: {status}\n"
+        f"   Coverage: {validation.overall_coverage_percentage:.1f}%\n"
+        f"   Targeting Compatible: {'Yes' if validation.targeting_compatible else 'No'}\n"
+    )
+
+    if validation.estimated_reach:
+        yield f"   Estimated Reach: {validation.estimated_reach:,} impressions\n"
+    yield "\n"
+
+    # Matched capabilities
+    if validation.matched_capabilities:
+        yield f"**Matched Capabilities ({len(validation.matched_capabilities)}):**\n"
+        for cap in validation.matched_capabilities:
+            yield f"   - {cap}\n"
+        yield "\n"
+
+    # Gaps and alternatives
+    if validation.gaps:
+        yield "**Gaps Identified:**\n"
+        for gap in validation.gaps:
+            yield f"   - {gap}\n"
+        yield "\n"
+
+    if validation.alternatives:
+        yield "**Suggested Alternatives:**\n"
+        for alt in validation.alternatives:
+            yield f"   - {alt.get('gap', 'Unknown')}: {alt.get('suggestion', '')}\n"
+        yield "\n"
+
+    # Recommendation
+    yield "---\n**Recommendation:** "
+
+    if validation.targeting_compatible and score >= 0.7:
+        yield "Proceed with targeting - strong match with high coverage."
+    elif validation.targeting_compatible:
+        yield "Proceed with caution - partial match may limit reach."
+    elif validation.gaps:
+        yield "Consider alternatives - some requirements cannot be met."
+    else:
+        yield "Re-evaluate targeting - poor match with inventory."
 
 
 class AudienceMatchingInput(BaseModel):
@@ -54,7 +200,7 @@ class AudienceMatchingTool(BaseTool):
     using UCP embedding exchange. Returns a similarity score (0-1) indicating
     how well the seller's inventory matches the target audience, along with
     matched capabilities and any gaps identified."""
-    args_schema: Type[BaseModel] = AudienceMatchingInput
+    args_schema: type[BaseModel] = AudienceMatchingInput
 
     def _run(
         self,
@@ -66,7 +212,7 @@ class AudienceMatchingTool(BaseTool):
         exclusions: Optional[list[str]] = None,
     ) -> str:
         """Execute the audience matching."""
-        return asyncio.run(
+        return run_sync(
             self._arun(
                 seller_endpoint,
                 demographics,
@@ -120,148 +266,8 @@ class AudienceMatchingTool(BaseTool):
             )
         except Exception as e:
             # Return mock result for demonstration
-            validation = self._get_mock_validation(requirements)
+            validation = mock_validation(requirements)
         finally:
             await client.close()
 
-        return self._format_result(requirements, validation)
-
-    def _get_mock_validation(self, requirements: dict[str, Any]) -> Any:
-        """Return mock validation for demonstration."""
-        from ...models.ucp import AudienceValidationResult
-
-        # Simulate different match levels based on requirements complexity
-        has_demographics = "demographics" in requirements
-        has_interests = "interests" in requirements
-        has_behaviors = "behaviors" in requirements
-
-        # Base score
-        score = 0.6
-
-        # Contextual signals (interests) have highest coverage
-        if has_interests and not has_demographics and not has_behaviors:
-            score = 0.85
-
-        # Demographics have good coverage
-        if has_demographics:
-            score = 0.72
-
-        # Behavioral targeting has lower coverage
-        if has_behaviors:
-            score = max(0.45, score - 0.15)
-
-        # Determine status
-        if score >= 0.7:
-            status = "valid"
-            compatible = True
-        elif score >= 0.5:
-            status = "partial_match"
-            compatible = True
-        else:
-            status = "partial_match"
-            compatible = False
-
-        gaps = []
-        alternatives = []
-        if has_behaviors:
-            gaps.append("behavioral_targeting")
-            alternatives.append({
-                "gap": "behavioral_targeting",
-                "suggestion": "Use contextual signals with frequency capping as proxy",
-            })
-
-        return AudienceValidationResult(
-            validation_status=status,
-            overall_coverage_percentage=score * 100,
-            matched_capabilities=[
-                "cap_ctx_categories",
-                "cap_ctx_keywords",
-            ] + (["cap_demo_age", "cap_demo_gender"] if has_demographics else []),
-            gaps=gaps,
-            alternatives=alternatives,
-            ucp_similarity_score=score,
-            targeting_compatible=compatible,
-            estimated_reach=int(1000000 * score),
-            validation_notes=[
-                f"UCP similarity: {score:.2f}",
-                f"Coverage: {score * 100:.1f}%",
-            ],
-        )
-
-    def _format_result(
-        self,
-        requirements: dict[str, Any],
-        validation: Any,
-    ) -> str:
-        """Format the matching result as human-readable output."""
-        output = "## Audience Match Results\n\n"
-
-        # Requirements summary
-        output += "**Target Audience:**\n"
-        if "demographics" in requirements:
-            output += f"   Demographics: {requirements['demographics']}\n"
-        if "interests" in requirements:
-            output += f"   Interests: {', '.join(requirements['interests'])}\n"
-        if "behaviors" in requirements:
-            output += f"   Behaviors: {', '.join(requirements['behaviors'])}\n"
-        if "geography" in requirements:
-            output += f"   Geography: {requirements['geography']}\n"
-        output += "\n"
-
-        # Match score
-        score = validation.ucp_similarity_score or 0
-        status = validation.validation_status
-
-        if score >= 0.7:
-            match_quality = "STRONG"
-        elif score >= 0.5:
-            match_quality = "MODERATE"
-        elif score >= 0.3:
-            match_quality = "WEAK"
-        else:
-            match_quality = "POOR"
-
-        output += f"**Match Quality: {match_quality}**\n"
-        output += f"   UCP Similarity Score: {score:.2f}\n"
-        output += f"   Status: {status}\n"
-        output += f"   Coverage: {validation.overall_coverage_percentage:.1f}%\n"
-        output += f"   Targeting Compatible: {'Yes' if validation.targeting_compatible else 'No'}\n"
-
-        if validation.estimated_reach:
-            output += f"   Estimated Reach: {validation.estimated_reach:,} impressions\n"
-        output += "\n"
-
-        # Matched capabilities
-        if validation.matched_capabilities:
-            output += f"**Matched Capabilities ({len(validation.matched_capabilities)}):**\n"
-            for cap in validation.matched_capabilities:
-                output += f"   - {cap}\n"
-            output += "\n"
-
-        # Gaps and alternatives
-        if validation.gaps:
-            output += "**Gaps Identified:**\n"
-            for gap in validation.gaps:
-                output += f"   - {gap}\n"
-            output += "\n"
-
-        if validation.alternatives:
-            output += "**Suggested Alternatives:**\n"
-            for alt in validation.alternatives:
-                output += f"   - {alt.get('gap', 'Unknown')}: {alt.get('suggestion', '')}\n"
-            output += "\n"
-
-        # Recommendation
-        output += "---\n"
-        output += "**Recommendation:** "
-
-        if validation.targeting_compatible and score >= 0.7:
-            output += "Proceed with targeting - strong match with high coverage."
-        elif validation.targeting_compatible:
-            output += "Proceed with caution - partial match may limit reach."
-        elif validation.gaps:
-            output += "Consider alternatives - some requirements cannot be met."
-        else:
-            output += "Re-evaluate targeting - poor match with inventory."
-
-        return output
+        return format_match_result(requirements, validation)
@@ -0,0 +1,196 @@
+# Author: Green Mountain Systems AI Inc.
+# Donated to IAB Tech Lab
+
+"""Audience Planning Tool - Discover, match and estimate coverage in one call."""
+
+import asyncio
+from typing import Any, Optional
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+from ...clients.ucp_client import UCPClient
+from ...models.ucp import UCPConsent
+from ...runtime import run_sync
+from .audience_discovery import filter_capabilities, format_capabilities, mock_capabilities
+from .audience_matching import format_match_result, mock_validation
+from .coverage_estimation import calculate_coverage, format_coverage
+
+
+class PlanAudienceInput(BaseModel):
+    """Input schema for audience planning tool."""
+
+    seller_endpoint: str = Field(
+        description="Seller's UCP exchange endpoint URL"
+    )
+    capabilities_endpoint: Optional[str] = Field(
+        default=None,
+        description="Seller's capability discovery endpoint URL (defaults to seller_endpoint)",
+    )
+    demographics: Optional[dict[str, Any]] = Field(
+        default=None,
+        description="Demographic targeting (age, gender, income, etc.)",
+    )
+    interests: Optional[list[str]] = Field(
+        default=None,
+        description="Interest-based targeting categories",
+    )
+    behaviors: Optional[list[str]] = Field(
+        default=None,
+        description="Behavioral targeting segments",
+    )
+    geography: Optional[str] = Field(
+        default=None,
+        description="Geographic targeting (country code)",
+    )
+    exclusions: Optional[list[str]] = Field(
+        default=None,
+        description="Audience segments to exclude",
+    )
+    signal_types: Optional[list[str]] = Field(
+        default=None,
+        description="Filter capabilities by signal types: identity, contextual, reinforcement",
+    )
+    min_coverage: Optional[float] = Field(
+        default=None,
+        ge=0,
+        le=100,
+        description="Minimum coverage percentage for listed capabilities",
+    )
+    channel: Optional[str] = Field(
+        default=None,
+        description="Specific channel to estimate (display, video, ctv, mobile_app)",
+    )
+    total_impressions: Optional[int] = Field(
+        default=10000000,
+        ge=0,
+        description="Total available impressions to estimate against",
+    )
+
+
+class PlanAudienceTool(BaseTool):
+    """Plan an audience against a seller in a single step.
+
+    Runs capability discovery and UCP audience validation against the seller
+    concurrently, estimates coverage for the same targeting, and renders all
+    three results together. Equivalent to calling the discovery, matching and
+    coverage tools back-to-back, with one client and one event-loop entry.
+    """
+
+    name: str = "plan_audience"
+    description: str = """Plan campaign audience targeting against a seller in one call.
+    Discovers the seller's audience capabilities, matches the audience requirements
+    via UCP embedding exchange, and estimates coverage for the targeting. Use this
+    instead of calling discover_audience_capabilities, match_audience_to_inventory
+    and estimate_audience_coverage separately for the same seller."""
+    args_schema: type[BaseModel] = PlanAudienceInput
+
+    def _run(
+        self,
+        seller_endpoint: str,
+        capabilities_endpoint: Optional[str] = None,
+        demographics: Optional[dict[str, Any]] = None,
+        interests: Optional[list[str]] = None,
+        behaviors: Optional[list[str]] = None,
+        geography: Optional[str] = None,
+        exclusions: Optional[list[str]] = None,
+        signal_types: Optional[list[str]] = None,
+        min_coverage: Optional[float] = None,
+        channel: Optional[str] = None,
+        total_impressions: Optional[int] = 10000000,
+    ) -> str:
+        """Execute the audience planning."""
+        return run_sync(
+            self._arun(
+                seller_endpoint,
+                capabilities_endpoint,
+                demographics,
+                interests,
+                behaviors,
+                geography,
+                exclusions,
+                signal_types,
+                min_coverage,
+                channel,
+                total_impressions,
+            )
+        )
+
+    async def _arun(
+        self,
+        seller_endpoint: str,
+        capabilities_endpoint: Optional[str] = None,
+        demographics: Optional[dict[str, Any]] = None,
+        interests: Optional[list[str]] = None,
+        behaviors: Optional[list[str]] = None,
+        geography: Optional[str] = None,
+        exclusions: Optional[list[str]] = None,
+        signal_types: Optional[list[str]] = None,
+        min_coverage: Optional[float] = None,
+        channel: Optional[str] = None,
+        total_impressions: Optional[int] = 10000000,
+    ) -> str:
+        """Async implementation of audience planning."""
+        # Build audience requirements
+        requirements = {}
+        if demographics:
+            requirements["demographics"] = demographics
+        if interests:
+            requirements["interests"] = interests
+        if behaviors:
+            requirements["behaviors"] = behaviors
+        if geography:
+            requirements["geography"] = geography
+        if exclusions:
+            requirements["exclusions"] = exclusions
+
+        if not requirements:
+            return (
+                "Error: No audience requirements specified. Please provide at least "
+                "one of: demographics, interests, behaviors, geography."
+            )
+
+        consent = UCPConsent(
+            framework="IAB-TCFv2",
+            permissible_uses=["personalization", "measurement"],
+            ttl_seconds=3600,
+        )
+
+        client = UCPClient()
+
+        try:
+            capabilities, validation = await asyncio.gather(
+                client.discover_capabilities(capabilities_endpoint or seller_endpoint),
+                client.validate_audience_with_seller(
+                    audience_requirements=requirements,
+                    seller_endpoint=seller_endpoint,
+                    consent=consent,
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            await client.close()
+
+        # Fall back to mock data for demonstration, as the individual tools do
+        if isinstance(capabilities, BaseException) or not capabilities:
+            capabilities = mock_capabilities()
+        if isinstance(validation, BaseException):
+            validation = mock_validation(requirements)
+
+        capabilities = filter_capabilities(capabilities, signal_types, min_coverage)
+
+        # Coverage is estimated for the targeting dimensions only
+        targeting = {k: v for k, v in requirements.items() if k != "exclusions"}
+        estimates = calculate_coverage(
+            targeting,
+            channel,
+            total_impressions or 10000000,
+        )
+
+        return "\n\n".join(
+            (
+                "# Audience Plan\n\n" + format_capabilities(capabilities),
+                format_match_result(requirements, validation),
+                format_coverage(estimates, targeting, channel),
+            )
+        )
@@ -3,13 +3,200 @@
 
 """Coverage Estimation Tool - Estimate audience coverage for targeting."""
 
-import asyncio
-from typing import Any, Optional, Type
+import json
+import math
+from collections.abc import Callable, Iterator
+from hashlib import blake2b
+from typing import Any, Optional
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from ...models.ucp import CoverageEstimate
+from ...models.ucp import CoverageEstimate, percentage_tenths
+from ...runtime import run_sync
+
+# Base coverage factors by targeting type
+_COVERAGE_FACTORS: tuple[tuple[str, float], ...] = (
+    ("demographics", 0.75),  # 75% of inventory has demo data
+    ("interests", 0.90),  # 90% has contextual signals
+    ("behaviors", 0.40),  # 40% has behavioral data
+    ("geography", 0.95),  # 95% has geo data
+    ("device", 0.98),  # 98% has device data
+    ("time_of_day", 1.0),  # 100% supports dayparting
+)
+
+# Channel-specific modifiers
+_CHANNEL_MODIFIERS: dict[str, float] = {
+    "display": 1.0,
+    "video": 0.85,  # Less video inventory
+    "ctv": 0.60,  # CTV is more limited
+    "mobile_app": 0.70,  # App inventory varies
+}
+
+# Coverage thresholds for the per-channel indicator, highest first
+_COVERAGE_INDICATORS: tuple[tuple[float, str], ...] = (
+    (70, "[HIGH]"),
+    (40, "[MED]"),
+    (float("-inf"), "[LOW]"),
+)
+
+
+def _format_tenths(tenths: int) -> str:
+    """Render a non-negative count of tenths as a one-decimal number."""
+    return f"{tenths // 10}.{tenths % 10}"
+
+
+def _join_values(values: Any) -> str:
+    """Join a sequence of targeting values for display."""
+    return ", ".join(map(str, values))
+
+
+# Display formatters for targeting values by exact type; anything else uses str()
+_TARGETING_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    list: _join_values,
+    tuple: _join_values,
+}
+
+
+def calculate_coverage(
+    targeting: dict[str, Any],
+    channel: Optional[str],
+    total_impressions: int,
+) -> list[CoverageEstimate]:
+    """Calculate coverage estimates for targeting."""
+    # Calculate base coverage
+    active_factors = []
+    limiting = []
+
+    for targeting_type, factor in _COVERAGE_FACTORS:
+        if targeting.get(targeting_type):
+            active_factors.append(factor)
+            if factor < 0.7:
+                limiting.append(f"{targeting_type} ({factor*100:.0f}% coverage)")
+
+    # Multiply factors (assuming independence); no specific targeting
+    # means 100% coverage
+    base_coverage = math.prod(active_factors, start=1.0)
+
+    # Apply channel modifier
+    if channel and channel in _CHANNEL_MODIFIERS:
+        base_coverage *= _CHANNEL_MODIFIERS[channel]
+        channels = [channel]
+    else:
+        channels = list(_CHANNEL_MODIFIERS.keys())
+
+    # Stable across processes, unlike hash(), so keys can be cached
+    canonical = json.dumps(
+        targeting, sort_keys=True, separators=(",", ":"), default=str
+    )
+    key_suffix = blake2b(canonical.encode(), digest_size=2).hexdigest()
+
+    # Determine confidence based on complexity (same for every channel)
+    if len(active_factors) <= 1:
+        confidence = "high"
+    elif len(active_factors) <= 3:
+        confidence = "medium"
+    else:
+        confidence = "low"
+
+    # Generate estimates per channel
+    estimates = []
+    for ch in channels:
+        ch_coverage = base_coverage * _CHANNEL_MODIFIERS.get(ch, 1.0)
+        estimates.append(
+            CoverageEstimate(
+                targeting_key=f"{ch}_{key_suffix}",
+                estimated_impressions=int(total_impressions * ch_coverage),
+                coverage_percentage=ch_coverage * 100,
+                confidence_level=confidence,
+                limiting_factors=limiting if ch_coverage < 0.5 else [],
+                channel=ch,
+            )
+        )
+
+    return estimates
+
+
+def format_coverage(
+    estimates: list[CoverageEstimate],
+    targeting: dict[str, Any],
+    channel: Optional[str],
+) -> str:
+    """Format estimates as human-readable output."""
+    return "".join(_iter_coverage(estimates, targeting, channel))
+
+
+def _iter_coverage(
+    estimates: list[CoverageEstimate],
+    targeting: dict[str, Any],
+    channel: Optional[str],
+) -> Iterator[str]:
+    """Yield the coverage estimates as human-readable chunks."""
+    yield "## Audience Coverage Estimates\n\n"
+
+    # Targeting summary
+    yield "**Targeting Applied:**\n"
+    for key, value in targeting.items():
+        if value:
+            fmt = _TARGETING_FORMATTERS.get(type(value), str)
+            yield f"   {key}: {fmt(value)}\n"
+    yield "\n"
+
+    # Coverage by channel
+    yield "**Coverage by Channel:**\n\n"
+
+    for estimate in sorted(estimates, key=lambda x: x.coverage_percentage, reverse=True):
+        ch = estimate.channel or "unknown"
+        coverage = estimate.coverage_percentage
+        impressions = estimate.estimated_impressions
+        confidence = estimate.confidence_level
+
+        # Visual indicator
+        indicator = next(
+            tag for threshold, tag in _COVERAGE_INDICATORS if coverage >= threshold
+        )
+
+        yield (
+            f"**{ch.upper()}** {indicator}\n"
+            f"   Coverage: {_format_tenths(estimate.coverage_tenths)}%\n"
+            f"   Est. Impressions: {impressions:,}\n"
+            f"   Confidence: {confidence}\n"
+        )
+
+        if estimate.limiting_factors:
+            yield f"   Limiting Factors: {', '.join(estimate.limiting_factors)}\n"
+
+        yield "\n"
+
+    # Overall summary
+    if estimates:
+        coverage_sum = 0.0
+        total_reach = 0
+        all_limiting: set[str] = set()
+        for e in estimates:
+            coverage_sum += e.coverage_percentage
+            total_reach += e.estimated_impressions
+            all_limiting.update(e.limiting_factors)
+        avg_coverage = coverage_sum / len(estimates)
+
+        yield (
+            "---\n"
+            f"**Overall:** Avg coverage {_format_tenths(percentage_tenths(avg_coverage))}%, "
+            f"total reach {total_reach:,} impressions\n\n"
+        )
+
+        # Recommendations
+        yield "**Recommendations:**\n"
+
+        if avg_coverage >= 70:
+            yield "- Coverage is strong - targeting is scalable\n"
+        elif avg_coverage >= 40:
+            yield "- Coverage is moderate - consider broadening targeting for more scale\n"
+        else:
+            yield "- Coverage is limited - review targeting constraints\n"
+
+        if all_limiting:
+            yield f"- Main constraints: {', '.join(all_limiting)}\n"
 
 
 class CoverageEstimationInput(BaseModel):
@@ -41,7 +228,7 @@ class CoverageEstimationTool(BaseTool):
     Returns estimated impressions, coverage percentage, and factors that
     may limit reach. Use this to understand potential scale before committing
     to a targeting strategy."""
-    args_schema: Type[BaseModel] = CoverageEstimationInput
+    args_schema: type[BaseModel] = CoverageEstimationInput
 
     def _run(
         self,
@@ -50,7 +237,7 @@ class CoverageEstimationTool(BaseTool):
         total_impressions: Optional[int] = 10000000,
     ) -> str:
         """Execute the coverage estimation."""
-        return asyncio.run(
+        return run_sync(
             self._arun(targeting, channel, total_impressions)
         )
 
@@ -65,166 +252,10 @@ class CoverageEstimationTool(BaseTool):
             return "Error: No targeting specification provided."
 
         # Calculate coverage based on targeting complexity
-        estimates = self._calculate_coverage(
+        estimates = calculate_coverage(
             targeting,
             channel,
             total_impressions or 10000000,
         )
 
-        return self._format_results(estimates, targeting, channel)
-
-    def _calculate_coverage(
-        self,
-        targeting: dict[str, Any],
-        channel: Optional[str],
-        total_impressions: int,
-    ) -> list[CoverageEstimate]:
-        """Calculate coverage estimates for targeting."""
-        estimates = []
-
-        # Base coverage factors by targeting type
-        coverage_factors = {
-            "demographics": 0.75,  # 75% of inventory has demo data
-            "interests": 0.90,  # 90% has contextual signals
-            "behaviors": 0.40,  # 40% has behavioral data
-            "geography": 0.95,  # 95% has geo data
-            "device": 0.98,  # 98% has device data
-            "time_of_day": 1.0,  # 100% supports dayparting
-        }
-
-        # Channel-specific modifiers
-        channel_modifiers = {
-            "display": 1.0,
-            "video": 0.85,  # Less video inventory
-            "ctv": 0.60,  # CTV is more limited
-            "mobile_app": 0.70,  # App inventory varies
-        }
-
-        # Calculate base coverage
-        active_factors = []
-        limiting = []
-
-        for targeting_type, factor in coverage_factors.items():
-            if targeting_type in targeting and targeting[targeting_type]:
-                active_factors.append(factor)
-                if factor < 0.7:
-                    limiting.append(f"{targeting_type} ({factor*100:.0f}% coverage)")
-
-        if not active_factors:
-            # No specific targeting = 100% coverage
-            base_coverage = 1.0
-        else:
-            # Multiply factors (assuming independence)
-            base_coverage = 1.0
-            for factor in active_factors:
-                base_coverage *= factor
-
-        # Apply channel modifier
-        if channel and channel in channel_modifiers:
-            base_coverage *= channel_modifiers[channel]
-            channels = [channel]
-        else:
-            channels = list(channel_modifiers.keys())
-
-        # Generate estimates per channel
-        for ch in channels:
-            ch_modifier = channel_modifiers.get(ch, 1.0)
-            ch_coverage = base_coverage * ch_modifier
-
-            # Determine confidence based on complexity
-            if len(active_factors) <= 1:
-                confidence = "high"
-            elif len(active_factors) <= 3:
-                confidence = "medium"
-            else:
-                confidence = "low"
-
-            estimates.append(
-                CoverageEstimate(
-                    targeting_key=f"{ch}_{hash(str(targeting)) % 10000:04d}",
-                    estimated_impressions=int(total_impressions * ch_coverage),
-                    coverage_percentage=ch_coverage * 100,
-                    confidence_level=confidence,
-                    limiting_factors=limiting if ch_coverage < 0.5 else [],
-                    channel=ch,
-                )
-            )
-
-        return estimates
-
-    def _format_results(
-        self,
-        estimates: list[CoverageEstimate],
-        targeting: dict[str, Any],
-        channel: Optional[str],
-    ) -> str:
-        """Format estimates as human-readable output."""
-        output = "## Audience Coverage Estimates\n\n"
-
-        # Targeting summary
-        output += "**Targeting Applied:**\n"
-        for key, value in targeting.items():
-            if value:
-                if isinstance(value, list):
-                    output += f"   {key}: {', '.join(str(v) for v in value)}\n"
-                elif isinstance(value, dict):
-                    output += f"   {key}: {value}\n"
-                else:
-                    output += f"   {key}: {value}\n"
-        output += "\n"
-
-        # Coverage by channel
-        output += "**Coverage by Channel:**\n\n"
-
-        for estimate in sorted(estimates, key=lambda x: x.coverage_percentage, reverse=True):
-            ch = estimate.channel or "unknown"
-            coverage = estimate.coverage_percentage
-            impressions = estimate.estimated_impressions
-            confidence = estimate.confidence_level
-
-            # Visual indicator
-            if coverage >= 70:
-                indicator = "[HIGH]"
-            elif coverage >= 40:
-                indicator = "[MED]"
-            else:
-                indicator = "[LOW]"
-
-            output += f"**{ch.upper()}** {indicator}\n"
-            output += f"   Coverage: {coverage:.1f}%\n"
-            output += f"   Est. Impressions: {impressions:,}\n"
-            output += f"   Confidence: {confidence}\n"
-
-            if estimate.limiting_factors:
-                output += f"   Limiting Factors: {', '.join(estimate.limiting_factors)}\n"
-
-            output += "\n"
-
-        # Overall summary
-        if estimates:
-            avg_coverage = sum(e.coverage_percentage for e in estimates) / len(estimates)
-            total_reach = sum(e.estimated_impressions for e in estimates)
-
-            output += "---\n"
-            output += f"**Overall:** Avg coverage {avg_coverage:.1f}%, "
-            output += f"total reach {total_reach:,} impressions\n\n"
-
-            # Recommendations
-            output += "**Recommendations:**\n"
-
-            if avg_coverage >= 70:
-                output += "- Coverage is strong - targeting is scalable\n"
-            elif avg_coverage >= 40:
-                output += "- Coverage is moderate - consider broadening targeting for more scale\n"
-            else:
-                output += "- Coverage is limited - review targeting constraints\n"
-
-            # Find limiting factors
-            all_limiting = set()
-            for e in estimates:
-                all_limiting.update(e.limiting_factors)
-
-            if all_limiting:
-                output += f"- Main constraints: {', '.join(all_limiting)}\n"
-
-        return output
+        return format_coverage(estimates, targeting, channel)
@@ -0,0 +1,44 @@
+# Author: Green Mountain Systems AI Inc.
+# Donated to IAB Tech Lab
+
+"""Lightweight mock audience data used when sellers return nothing.
+
+These mirror the attribute names of the pydantic ``AudienceCapability`` and
+``AudienceValidationResult`` models so the tool formatters can render either.
+Real seller responses still go through the pydantic models in ``UCPClient``.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from ...models.ucp import SignalType
+
+
+@dataclass(slots=True, frozen=True)
+class MockCapability:
+    """Mock audience capability offered by a seller."""
+
+    capability_id: str
+    name: str
+    signal_type: SignalType
+    coverage_percentage: float = 0.0
+    description: Optional[str] = None
+    available_segments: tuple[str, ...] = ()
+    taxonomy: Optional[str] = None
+    ucp_compatible: bool = True
+    embedding_dimension: Optional[int] = None
+
+
+@dataclass(slots=True, frozen=True)
+class MockValidation:
+    """Mock result of validating audience requirements against a seller."""
+
+    validation_status: str
+    overall_coverage_percentage: float = 0.0
+    matched_capabilities: tuple[str, ...] = ()
+    gaps: tuple[str, ...] = ()
+    alternatives: tuple[dict[str, Any], ...] = ()
+    ucp_similarity_score: Optional[float] = None
+    targeting_compatible: bool = False
+    estimated_reach: Optional[int] = None
+    validation_notes: tuple[str, ...] = ()
@@ -0,0 +1,35 @@
+# Author: Green Mountain Systems AI Inc.
+# Donated to IAB Tech Lab
+
+"""Base class for tools backed by the OpenDirect client."""
+
+from abc import abstractmethod
+from typing import Any
+
+from crewai.tools import BaseTool
+
+from ..clients.opendirect_client import OpenDirectClient
+from ..runtime import run_sync
+
+
+class OpenDirectTool(BaseTool):
+    """CrewAI tool that calls the OpenDirect API.
+
+    Subclasses implement ``_arun``; the synchronous entry point CrewAI uses
+    runs it on the shared background event loop.
+    """
+
+    _client: OpenDirectClient
+
+    def __init__(self, client: OpenDirectClient, **kwargs: Any):
+        """Initialize with OpenDirect client."""
+        super().__init__(**kwargs)
+        self._client = client
+
+    def _run(self, *args: Any, **kwargs: Any) -> str:
+        """Synchronous wrapper for the async implementation."""
+        return run_sync(self._arun(*args, **kwargs))
+
+    @abstractmethod
+    async def _arun(self, *args: Any, **kwargs: Any) -> str:
+        """Run the tool against the OpenDirect API."""
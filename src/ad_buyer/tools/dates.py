@@ -0,0 +1,25 @@
+# Author: Green Mountain Systems AI Inc.
+# Donated to IAB Tech Lab
+
+"""Flight date parsing shared by the OpenDirect tools."""
+
+from datetime import datetime
+
+
+def parse_ymd(value: str) -> datetime:
+    """Parse a YYYY-MM-DD tool argument into the datetime OpenDirect models use.
+
+    ``datetime.fromisoformat`` is kept deliberately: it parses date-only
+    strings faster than ``date.fromisoformat`` followed by
+    ``datetime.combine``.
+
+    Args:
+        value: Date string in YYYY-MM-DD format
+
+    Returns:
+        Datetime at midnight on the given date.
+
+    Raises:
+        ValueError: If the string is not a valid ISO date.
+    """
+    return datetime.fromisoformat(value)
@@ -5,10 +5,11 @@
 
 from .discover_inventory import DiscoverInventoryTool
 from .get_pricing import GetPricingTool
-from .request_deal import RequestDealTool
+from .request_deal import DealRequestError, RequestDealTool
 
 __all__ = [
     "DiscoverInventoryTool",
     "GetPricingTool",
     "RequestDealTool",
+    "DealRequestError",
 ]
@@ -4,13 +4,36 @@
 """Inventory discovery tool for DSP workflows."""
 
 import asyncio
+from collections.abc import Iterable, Iterator
 from typing import Any, Optional
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from ...clients.unified_client import Protocol, UnifiedClient
-from ...models.buyer_identity import BuyerContext
+from ...models.buyer_identity import (
+    NEGOTIATING_TIERS,
+    TIER_DISCOUNTS,
+    BuyerContext,
+)
+from ...runtime import run_sync
+from .products import PRODUCT_FIELD_KEYS, normalize_product
+
+_RULE = "-" * 50
+
+# Result size above which formatting moves off the event loop thread
+_OFFLOAD_MIN_PRODUCTS = 200
+
+_PRODUCT_TMPL = (
+    "{i}. {name}\n"
+    "   Product ID: {product_id}\n"
+    "   Publisher: {publisher}\n"
+    "   Channel: {channel}\n"
+    "   CPM: {price}\n"
+    "   Available: {impressions}\n"
+    "   Targeting: {targeting}\n"
+    "\n"
+)
 
 
 class DiscoverInventoryInput(BaseModel):
@@ -102,7 +125,7 @@ Returns:
         publisher: Optional[str] = None,
     ) -> str:
         """Synchronous wrapper for async discovery."""
-        return asyncio.run(
+        return run_sync(
             self._arun(
                 query=query,
                 channel=channel,
@@ -137,6 +160,9 @@ Returns:
             if publisher:
                 filters["publisher"] = publisher
 
+            # Push predicates to the seller rather than fetching the full catalog
+            has_predicates = bool(filters)
+
             # Add identity context to filters
             identity_context = self._buyer_context.identity.to_context_dict()
             filters["buyer_context"] = identity_context
@@ -145,14 +171,29 @@ Returns:
             if query:
                 result = await self._client.search_products(
                     query=query,
-                    filters=filters if filters else None,
+                    filters=filters,
+                    fields=PRODUCT_FIELD_KEYS,
+                )
+            elif has_predicates:
+                result = await self._client.list_products(
+                    filters=filters,
+                    fields=PRODUCT_FIELD_KEYS,
                 )
             else:
-                result = await self._client.list_products()
+                result = await self._client.list_products(fields=PRODUCT_FIELD_KEYS)
 
             if not result.success:
                 return f"Error discovering inventory: {result.error}"
 
+            # Large catalogs are formatted on a worker thread so the loop
+            # stays responsive for other in-flight tool calls
+            if (
+                isinstance(result.data, list)
+                and len(result.data) >= _OFFLOAD_MIN_PRODUCTS
+            ):
+                return await asyncio.to_thread(
+                    self._format_results, result.data, identity_context
+                )
             return self._format_results(result.data, identity_context)
 
         except Exception as e:
@@ -164,59 +205,108 @@ Returns:
         identity_context: dict,
     ) -> str:
         """Format discovery results with tier information."""
+        return "".join(self._iter_results(products, identity_context))
+
+    def _iter_results(
+        self,
+        products: Any,
+        identity_context: dict,
+    ) -> Iterator[str]:
+        """Yield discovery results as header, per-product blocks and footer."""
         if not products:
-            return "No inventory found matching your criteria."
+            yield "No inventory found matching your criteria."
+            return
+
+        # Accept a single product (dict or text) or any iterable of products,
+        # normalizing in the one pass that materializes the list
+        if isinstance(products, (dict, str)) or not isinstance(products, Iterable):
+            products = (products,)
+        product_list = [
+            normalize_product(product) if isinstance(product, dict) else product
+            for product in products
+        ]
+        if not product_list:
+            yield "No inventory found matching your criteria."
+            return
 
         tier = identity_context.get("access_tier", "public")
-        discount = self._buyer_context.identity.get_discount_percentage()
+        discount = TIER_DISCOUNTS.get(tier, 0.0)
 
-        output_lines = [
-            f"Inventory Discovery Results",
-            f"Access Tier: {tier.upper()} ({discount}% discount)",
-            "-" * 50,
-            "",
-        ]
+        yield (
+            f"Inventory Discovery Results\n"
+            f"Access Tier: {tier.upper()} ({discount}% discount)\n"
+            f"{_RULE}\n\n"
+        )
+
+        # Specialise once for the common all-dicts-with-numeric-price shape
+        if all(
+            isinstance(product, dict) and isinstance(product.get("base_price"), (int, float))
+            for product in product_list
+        ):
+            yield from self._render_priced_products(product_list, discount)
+        else:
+            yield from self._render_products(product_list, discount)
 
-        # Handle both list and dict formats
-        product_list = products if isinstance(products, list) else [products]
+        yield f"{_RULE}\nTotal products found: {len(product_list)}"
 
+        # Premium access and negotiation are both granted by the same tiers
+        if tier in NEGOTIATING_TIERS:
+            yield "\nPremium inventory access: ENABLED"
+            yield "\nPrice negotiation: AVAILABLE"
+
+    def _render_priced_products(
+        self,
+        product_list: list[dict],
+        discount: float,
+    ) -> Iterator[str]:
+        """Render normalized products that all have a numeric base price."""
+        discount_factor = 1 - discount / 100
+        price_tmpl = "${tiered:.2f} (was ${base:.2f})" if discount > 0 else "${base:.2f}"
+        for i, product in enumerate(product_list, 1):
+            base_price = product["base_price"]
+            impressions = product.get("impressions", "N/A")
+            targeting = product.get("targeting", [])
+
+            yield _PRODUCT_TMPL.format(
+                i=i,
+                name=product.get("name", "Unknown Product"),
+                product_id=product.get("id", "Unknown"),
+                publisher=product.get("publisher", "Unknown"),
+                channel=product.get("channel", "N/A"),
+                price=price_tmpl.format(base=base_price, tiered=base_price * discount_factor),
+                impressions=f"{impressions:,}" if isinstance(impressions, int) else impressions,
+                targeting=", ".join(targeting) if targeting else "Standard",
+            )
+
+    def _render_products(
+        self,
+        product_list: list[Any],
+        discount: float,
+    ) -> Iterator[str]:
+        """Render products of any shape, checking each entry's types."""
+        discount_factor = 1 - discount / 100
         for i, product in enumerate(product_list, 1):
             if isinstance(product, dict):
-                product_id = product.get("id", "Unknown")
-                name = product.get("name", "Unknown Product")
-                publisher = product.get("publisherId", product.get("publisher", "Unknown"))
-                base_price = product.get("basePrice", product.get("price", 0))
-                channel = product.get("channel", product.get("deliveryType", "N/A"))
-                impressions = product.get("availableImpressions", product.get("available_impressions", "N/A"))
-                targeting = product.get("targeting", product.get("availableTargeting", []))
+                base_price = product.get("base_price", 0)
+                impressions = product.get("impressions", "N/A")
+                targeting = product.get("targeting", [])
 
                 # Calculate tiered price
                 if isinstance(base_price, (int, float)) and discount > 0:
-                    tiered_price = base_price * (1 - discount / 100)
+                    tiered_price = base_price * discount_factor
                     price_display = f"${tiered_price:.2f} (was ${base_price:.2f})"
                 else:
                     price_display = f"${base_price:.2f}" if isinstance(base_price, (int, float)) else str(base_price)
 
-                output_lines.extend([
-                    f"{i}. {name}",
-                    f"   Product ID: {product_id}",
-                    f"   Publisher: {publisher}",
-                    f"   Channel: {channel}",
-                    f"   CPM: {price_display}",
-                    f"   Available: {impressions:,}" if isinstance(impressions, int) else f"   Available: {impressions}",
-                    f"   Targeting: {', '.join(targeting) if targeting else 'Standard'}",
-                    "",
-                ])
+                yield _PRODUCT_TMPL.format(
+                    i=i,
+                    name=product.get("name", "Unknown Product"),
+                    product_id=product.get("id", "Unknown"),
+                    publisher=product.get("publisher", "Unknown"),
+                    channel=product.get("channel", "N/A"),
+                    price=price_display,
+                    impressions=f"{impressions:,}" if isinstance(impressions, int) else impressions,
+                    targeting=", ".join(targeting) if targeting else "Standard",
+                )
             else:
-                output_lines.append(f"{i}. {product}")
-                output_lines.append("")
-
-        output_lines.append("-" * 50)
-        output_lines.append(f"Total products found: {len(product_list)}")
-
-        if self._buyer_context.can_access_premium_inventory():
-            output_lines.append("Premium inventory access: ENABLED")
-        if self._buyer_context.can_negotiate():
-            output_lines.append("Price negotiation: AVAILABLE")
-
-        return "\n".join(output_lines)
+                yield f"{i}. {product}\n\n"
@@ -10,16 +10,31 @@ from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from ...clients.unified_client import Protocol, UnifiedClient
-from ...models.buyer_identity import AccessTier, BuyerContext, DealType
+from ...models.buyer_identity import (
+    NEGOTIATING_TIERS,
+    VOLUME_DISCOUNT_TIERS,
+    AccessTier,
+    BuyerContext,
+    DealType,
+)
+from ...runtime import run_sync
+from .products import normalize_product
+
+_DOUBLE_RULE = "=" * 50
+_RULE = "-" * 20
 
 
 class GetPricingInput(BaseModel):
     """Input schema for pricing tool."""
 
-    product_id: str = Field(
-        ...,
+    product_id: Optional[str] = Field(
+        default=None,
         description="Product ID to get pricing for",
     )
+    product_ids: Optional[list[str]] = Field(
+        default=None,
+        description="Several product IDs to price in one call (used instead of product_id)",
+    )
     volume: Optional[int] = Field(
         default=None,
         description="Requested impression volume (may unlock volume discounts)",
@@ -59,6 +74,7 @@ Pricing is based on revealed buyer identity (seat, agency, advertiser).
 
 Args:
     product_id: Product ID to get pricing for
+    product_ids: Several product IDs to price in one call
     volume: Requested impressions (may unlock volume discounts)
     deal_type: Deal type ('PG', 'PD', 'PA')
     flight_start: Start date (YYYY-MM-DD)
@@ -89,47 +105,101 @@ Returns:
 
     def _run(
         self,
-        product_id: str,
+        product_id: Optional[str] = None,
         volume: Optional[int] = None,
         deal_type: Optional[str] = None,
         flight_start: Optional[str] = None,
         flight_end: Optional[str] = None,
+        product_ids: Optional[list[str]] = None,
     ) -> str:
         """Synchronous wrapper for async pricing."""
-        return asyncio.run(
+        return run_sync(
             self._arun(
                 product_id=product_id,
                 volume=volume,
                 deal_type=deal_type,
                 flight_start=flight_start,
                 flight_end=flight_end,
+                product_ids=product_ids,
             )
         )
 
     async def _arun(
         self,
-        product_id: str,
+        product_id: Optional[str] = None,
         volume: Optional[int] = None,
         deal_type: Optional[str] = None,
         flight_start: Optional[str] = None,
         flight_end: Optional[str] = None,
+        product_ids: Optional[list[str]] = None,
     ) -> str:
-        """Get tier-specific pricing for the product."""
+        """Get tier-specific pricing for one or more products."""
+        if product_ids:
+            return await self._price_many(
+                product_ids, volume, deal_type, flight_start, flight_end
+            )
+        if not product_id:
+            return "Error getting pricing: product_id or product_ids is required."
+
         try:
             # Get product details
             result = await self._client.get_product(product_id)
+            return self._price_result(
+                product_id, result, volume, deal_type, flight_start, flight_end
+            )
+
+        except Exception as e:
+            return f"Error getting pricing: {e}"
 
-            if not result.success:
-                return f"Error getting pricing: {result.error}"
+    async def _price_many(
+        self,
+        product_ids: list[str],
+        volume: Optional[int],
+        deal_type: Optional[str],
+        flight_start: Optional[str],
+        flight_end: Optional[str],
+    ) -> str:
+        """Fetch several products concurrently and price each one."""
+        product_ids = list(dict.fromkeys(product_ids))
+        results = await asyncio.gather(
+            *(self._client.get_product(pid) for pid in product_ids),
+            return_exceptions=True,
+        )
 
-            product = result.data
-            if not product:
-                return f"Product {product_id} not found."
+        sections = []
+        for pid, result in zip(product_ids, results):
+            if isinstance(result, Exception):
+                sections.append(f"Error getting pricing for {pid}: {result}")
+                continue
+            try:
+                sections.append(
+                    self._price_result(
+                        pid, result, volume, deal_type, flight_start, flight_end
+                    )
+                )
+            except Exception as e:
+                sections.append(f"Error getting pricing for {pid}: {e}")
+
+        return "\n\n".join(sections)
+
+    def _price_result(
+        self,
+        product_id: str,
+        result: Any,
+        volume: Optional[int],
+        deal_type: Optional[str],
+        flight_start: Optional[str],
+        flight_end: Optional[str],
+    ) -> str:
+        """Turn a get_product result into pricing output or an error message."""
+        if not result.success:
+            return f"Error getting pricing: {result.error}"
 
-            return self._format_pricing(product, volume, deal_type, flight_start, flight_end)
+        product = result.data
+        if not product:
+            return f"Product {product_id} not found."
 
-        except Exception as e:
-            return f"Error getting pricing: {e}"
+        return self._format_pricing(product, volume, deal_type, flight_start, flight_end)
 
     def _format_pricing(
         self,
@@ -140,102 +210,85 @@ Returns:
         flight_end: Optional[str],
     ) -> str:
         """Format pricing response with tier calculations."""
-        tier = self._buyer_context.identity.get_access_tier()
-        discount = self._buyer_context.identity.get_discount_percentage()
+        tier, discount = self._buyer_context.identity.get_tier_and_discount()
 
         # Extract product info
+        product = normalize_product(product)
         product_id = product.get("id", "Unknown")
         name = product.get("name", "Unknown Product")
-        base_price = product.get("basePrice", product.get("price", 0))
-        publisher = product.get("publisherId", product.get("publisher", "Unknown"))
-        rate_type = product.get("rateType", "CPM")
-
-        # Calculate tiered price
-        if isinstance(base_price, (int, float)):
-            tiered_price = base_price * (1 - discount / 100)
-        else:
-            tiered_price = 0
+        base_price = product.get("base_price", 0)
+        publisher = product.get("publisher", "Unknown")
+        rate_type = product.get("rate_type", "CPM")
 
-        # Volume discount (additional 5% for 5M+, 10% for 10M+ impressions)
+        # Volume discount (additional 5% for 5M+, 10% for 10M+ impressions),
+        # compounded on the tier discount
         volume_discount = 0
-        if volume and tier in (AccessTier.AGENCY, AccessTier.ADVERTISER):
+        if volume and tier in VOLUME_DISCOUNT_TIERS:
             if volume >= 10_000_000:
                 volume_discount = 10.0
             elif volume >= 5_000_000:
                 volume_discount = 5.0
-
-        if volume_discount > 0:
-            final_price = tiered_price * (1 - volume_discount / 100)
+        if isinstance(base_price, (int, float)):
+            tiered_price = base_price * (1 - discount / 100)
         else:
-            final_price = tiered_price
+            tiered_price = 0
+        final_price = tiered_price * (1 - volume_discount / 100)
 
         # Build output
-        output_lines = [
-            f"Pricing for: {name}",
-            f"Product ID: {product_id}",
-            f"Publisher: {publisher}",
-            "=" * 50,
-            "",
-            "Your Access Tier",
-            "-" * 20,
-            f"Tier: {tier.value.upper()}",
-            f"Tier Discount: {discount}%",
+        if isinstance(base_price, (int, float)):
+            base_line = f"Base {rate_type}: ${base_price:.2f}"
+        else:
+            base_line = f"Base {rate_type}: {base_price}"
+
+        parts = [
+            f"Pricing for: {name}\n"
+            f"Product ID: {product_id}\n"
+            f"Publisher: {publisher}\n"
+            f"{_DOUBLE_RULE}\n"
+            "\n"
+            "Your Access Tier\n"
+            f"{_RULE}\n"
+            f"Tier: {tier.value.upper()}\n"
+            f"Tier Discount: {discount}%"
         ]
 
         if volume_discount > 0:
-            output_lines.append(f"Volume Discount: {volume_discount}%")
+            parts.append(f"\nVolume Discount: {volume_discount}%")
 
-        output_lines.extend([
-            "",
-            "Pricing Breakdown",
-            "-" * 20,
-            f"Base {rate_type}: ${base_price:.2f}" if isinstance(base_price, (int, float)) else f"Base {rate_type}: {base_price}",
-        ])
+        parts.append(f"\n\nPricing Breakdown\n{_RULE}\n{base_line}")
 
         if discount > 0:
-            output_lines.append(f"After Tier Discount: ${tiered_price:.2f}")
+            parts.append(f"\nAfter Tier Discount: ${tiered_price:.2f}")
 
         if volume_discount > 0:
-            output_lines.append(f"After Volume Discount: ${final_price:.2f}")
+            parts.append(f"\nAfter Volume Discount: ${final_price:.2f}")
 
-        output_lines.extend([
-            "",
-            f"Final {rate_type}: ${final_price:.2f}",
-        ])
+        parts.append(f"\n\nFinal {rate_type}: ${final_price:.2f}")
 
         # Cost projection if volume provided
         if volume:
             total_cost = (final_price / 1000) * volume
-            output_lines.extend([
-                "",
-                "Cost Projection",
-                "-" * 20,
-                f"Impressions: {volume:,}",
-                f"Estimated Cost: ${total_cost:,.2f}",
-            ])
+            parts.append(
+                "\n\nCost Projection\n"
+                f"{_RULE}\n"
+                f"Impressions: {volume:,}\n"
+                f"Estimated Cost: ${total_cost:,.2f}"
+            )
 
         # Deal type information
-        output_lines.extend([
-            "",
-            "Available Deal Types",
-            "-" * 20,
-        ])
-
         deal_options = self._get_deal_options(tier, final_price, deal_type)
-        for deal_opt in deal_options:
-            output_lines.append(deal_opt)
+        parts.append(f"\n\nAvailable Deal Types\n{_RULE}\n" + "\n".join(deal_options))
 
         # Negotiation availability
-        if self._buyer_context.can_negotiate():
-            output_lines.extend([
-                "",
-                "Negotiation",
-                "-" * 20,
-                "Price negotiation is available at your tier.",
-                "Contact seller or use request_deal tool with target_cpm parameter.",
-            ])
-
-        return "\n".join(output_lines)
+        if tier in NEGOTIATING_TIERS:
+            parts.append(
+                "\n\nNegotiation\n"
+                f"{_RULE}\n"
+                "Price negotiation is available at your tier.\n"
+                "Contact seller or use request_deal tool with target_cpm parameter."
+            )
+
+        return "".join(parts)
 
     def _get_deal_options(
         self,
@@ -0,0 +1,45 @@
+# Author: Green Mountain Systems AI Inc.
+# Donated to IAB Tech Lab
+
+"""Seller product field normalization shared by the DSP tools."""
+
+from typing import Any
+
+# Canonical field -> seller keys in priority order
+_PRODUCT_FIELDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("id", ("id",)),
+    ("name", ("name",)),
+    ("publisher", ("publisherId", "publisher")),
+    ("channel", ("channel", "deliveryType")),
+    ("base_price", ("basePrice", "price")),
+    ("impressions", ("availableImpressions", "available_impressions")),
+    ("targeting", ("targeting", "availableTargeting")),
+    ("rate_type", ("rateType",)),
+)
+
+# Every seller key the DSP tools read, for sellers that support projection
+PRODUCT_FIELD_KEYS: tuple[str, ...] = tuple(
+    key for _, keys in _PRODUCT_FIELDS for key in keys
+)
+
+
+def normalize_product(product: dict[str, Any]) -> dict[str, Any]:
+    """Map a seller product dict onto canonical field names.
+
+    Each canonical field takes the first seller key present, so callers do a
+    single ``.get(field, default)`` instead of chained fallbacks. Fields with
+    no matching key are omitted.
+
+    Args:
+        product: Product dict as returned by the seller
+
+    Returns:
+        Dict keyed by canonical field name.
+    """
+    normalized = {}
+    for field, keys in _PRODUCT_FIELDS:
+        for key in keys:
+            if key in product:
+                normalized[field] = product[key]
+                break
+    return normalized
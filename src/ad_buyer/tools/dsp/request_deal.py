@@ -3,7 +3,6 @@
 
 """Deal ID request tool for DSP workflows."""
 
-import asyncio
 import hashlib
 from datetime import datetime, timedelta
 from typing import Any, Optional
@@ -13,12 +12,43 @@ from pydantic import BaseModel, Field
 
 from ...clients.unified_client import Protocol, UnifiedClient
 from ...models.buyer_identity import (
+    NEGOTIATING_TIERS,
+    VOLUME_DISCOUNT_TIERS,
     AccessTier,
     BuyerContext,
     DealRequest,
     DealResponse,
     DealType,
 )
+from ...runtime import run_sync
+from .products import normalize_product
+
+_DOUBLE_RULE = "=" * 60
+_RULE = "-" * 30
+
+# Default flight length and how long a deal offer stays open
+_DEFAULT_FLIGHT = timedelta(days=30)
+_OFFER_VALIDITY = timedelta(days=7)
+
+_DEAL_TYPES = {deal_type.value: deal_type for deal_type in DealType}
+_DEAL_TYPE_NAMES = {
+    DealType.PROGRAMMATIC_GUARANTEED: "Programmatic Guaranteed (PG)",
+    DealType.PREFERRED_DEAL: "Preferred Deal (PD)",
+    DealType.PRIVATE_AUCTION: "Private Auction (PA)",
+}
+
+# DSP activation paths, formatted with the deal ID
+_ACTIVATION_TEMPLATES = {
+    "ttd": "The Trade Desk > Inventory > Private Marketplace > Add Deal ID: {deal_id}",
+    "dv360": "Display & Video 360 > Inventory > My Inventory > New > Deal ID: {deal_id}",
+    "amazon": "Amazon DSP > Private Marketplace > Deals > Add Deal: {deal_id}",
+    "xandr": "Xandr > Inventory > Deals > Create Deal with ID: {deal_id}",
+    "yahoo": "Yahoo DSP > Inventory > Private Marketplace > Enter Deal ID: {deal_id}",
+}
+
+
+class DealRequestError(Exception):
+    """Raised when a deal request is rejected before a Deal ID is issued."""
 
 
 class RequestDealInput(BaseModel):
@@ -112,7 +142,7 @@ Returns:
         target_cpm: Optional[float] = None,
     ) -> str:
         """Synchronous wrapper for async deal request."""
-        return asyncio.run(
+        return run_sync(
             self._arun(
                 product_id=product_id,
                 deal_type=deal_type,
@@ -134,45 +164,76 @@ Returns:
     ) -> str:
         """Request a deal ID from the seller."""
         try:
-            # Validate deal type
-            try:
-                deal_type_enum = DealType(deal_type.upper())
-            except ValueError:
-                return f"Invalid deal type '{deal_type}'. Use 'PG', 'PD', or 'PA'."
-
-            # Validate PG requirements
-            if deal_type_enum == DealType.PROGRAMMATIC_GUARANTEED and not impressions:
-                return "Programmatic Guaranteed (PG) deals require an impressions volume."
-
-            # Check negotiation eligibility
-            tier = self._buyer_context.identity.get_access_tier()
-            if target_cpm and not self._buyer_context.can_negotiate():
-                return f"Price negotiation requires Agency or Advertiser tier (current: {tier.value})"
-
-            # Get product details first
-            product_result = await self._client.get_product(product_id)
-            if not product_result.success:
-                return f"Error getting product: {product_result.error}"
-
-            product = product_result.data
-            if not product:
-                return f"Product {product_id} not found."
-
-            # Calculate pricing
-            deal_response = self._create_deal_response(
-                product=product,
-                deal_type=deal_type_enum,
+            deal_response = await self.request_deal(
+                product_id=product_id,
+                deal_type=deal_type,
                 impressions=impressions,
                 flight_start=flight_start,
                 flight_end=flight_end,
                 target_cpm=target_cpm,
             )
-
             return self._format_deal_response(deal_response)
 
+        except DealRequestError as e:
+            return str(e)
         except Exception as e:
             return f"Error requesting deal: {e}"
 
+    async def request_deal(
+        self,
+        product_id: str,
+        deal_type: str = "PD",
+        impressions: Optional[int] = None,
+        flight_start: Optional[str] = None,
+        flight_end: Optional[str] = None,
+        target_cpm: Optional[float] = None,
+    ) -> DealResponse:
+        """Request a deal ID and return it as a structured response.
+
+        Programmatic callers use this instead of ``_arun`` to read deal
+        fields directly rather than parsing the formatted text.
+
+        Raises:
+            DealRequestError: If the request is invalid for this buyer or the
+                product cannot be retrieved.
+        """
+        # Validate deal type
+        deal_type_enum = _DEAL_TYPES.get(deal_type.upper())
+        if deal_type_enum is None:
+            raise DealRequestError(f"Invalid deal type '{deal_type}'. Use 'PG', 'PD', or 'PA'.")
+
+        # Validate PG requirements
+        if deal_type_enum == DealType.PROGRAMMATIC_GUARANTEED and not impressions:
+            raise DealRequestError(
+                "Programmatic Guaranteed (PG) deals require an impressions volume."
+            )
+
+        # Check negotiation eligibility
+        tier = self._buyer_context.identity.get_access_tier()
+        if target_cpm and tier not in NEGOTIATING_TIERS:
+            raise DealRequestError(
+                f"Price negotiation requires Agency or Advertiser tier (current: {tier.value})"
+            )
+
+        # Get product details first
+        product_result = await self._client.get_product(product_id)
+        if not product_result.success:
+            raise DealRequestError(f"Error getting product: {product_result.error}")
+
+        product = product_result.data
+        if not product:
+            raise DealRequestError(f"Product {product_id} not found.")
+
+        # Calculate pricing
+        return self._create_deal_response(
+            product=product,
+            deal_type=deal_type_enum,
+            impressions=impressions,
+            flight_start=flight_start,
+            flight_end=flight_end,
+            target_cpm=target_cpm,
+        )
+
     def _create_deal_response(
         self,
         product: dict,
@@ -183,10 +244,12 @@ Returns:
         target_cpm: Optional[float],
     ) -> DealResponse:
         """Create a deal response with calculated pricing."""
+        now = datetime.now()
+
         # Get tier and base price
-        tier = self._buyer_context.identity.get_access_tier()
-        discount = self._buyer_context.identity.get_discount_percentage()
-        base_price = product.get("basePrice", product.get("price", 20.0))
+        tier, discount = self._buyer_context.identity.get_tier_and_discount()
+        product = normalize_product(product)
+        base_price = product.get("base_price", 20.0)
 
         if not isinstance(base_price, (int, float)):
             base_price = 20.0
@@ -195,7 +258,7 @@ Returns:
         tiered_price = base_price * (1 - discount / 100)
 
         # Apply volume discount for agency/advertiser
-        if impressions and tier in (AccessTier.AGENCY, AccessTier.ADVERTISER):
+        if impressions and tier in VOLUME_DISCOUNT_TIERS:
             if impressions >= 10_000_000:
                 tiered_price *= 0.90  # 10% volume discount
             elif impressions >= 5_000_000:
@@ -203,7 +266,7 @@ Returns:
 
         # Handle negotiation
         final_price = tiered_price
-        if target_cpm and self._buyer_context.can_negotiate():
+        if target_cpm and tier in NEGOTIATING_TIERS:
             # Simple negotiation: accept if within 10% of floor
             floor_price = tiered_price * 0.90
             if target_cpm >= floor_price:
@@ -213,21 +276,18 @@ Returns:
                 final_price = floor_price
 
         # Generate Deal ID
-        deal_id = self._generate_deal_id(product.get("id", "unknown"), tier)
+        deal_id = self._generate_deal_id(product.get("id", "unknown"), tier, now)
 
         # Set default flight dates if not provided
         if not flight_start:
-            flight_start = datetime.now().strftime("%Y-%m-%d")
+            flight_start = now.strftime("%Y-%m-%d")
         if not flight_end:
-            flight_end = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
+            flight_end = (now + _DEFAULT_FLIGHT).strftime("%Y-%m-%d")
 
         # Activation instructions
         activation_instructions = {
-            "ttd": f"The Trade Desk > Inventory > Private Marketplace > Add Deal ID: {deal_id}",
-            "dv360": f"Display & Video 360 > Inventory > My Inventory > New > Deal ID: {deal_id}",
-            "amazon": f"Amazon DSP > Private Marketplace > Deals > Add Deal: {deal_id}",
-            "xandr": f"Xandr > Inventory > Deals > Create Deal with ID: {deal_id}",
-            "yahoo": f"Yahoo DSP > Inventory > Private Marketplace > Enter Deal ID: {deal_id}",
+            platform: template.format(deal_id=deal_id)
+            for platform, template in _ACTIVATION_TEMPLATES.items()
         }
 
         return DealResponse(
@@ -243,74 +303,66 @@ Returns:
             flight_start=flight_start,
             flight_end=flight_end,
             activation_instructions=activation_instructions,
-            expires_at=(datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d"),
+            expires_at=(now + _OFFER_VALIDITY).strftime("%Y-%m-%d"),
         )
 
-    def _generate_deal_id(self, product_id: str, tier: AccessTier) -> str:
+    def _generate_deal_id(
+        self,
+        product_id: str,
+        tier: AccessTier,
+        now: Optional[datetime] = None,
+    ) -> str:
         """Generate a unique Deal ID."""
         # Create a semi-random but reproducible deal ID
-        timestamp = datetime.now().strftime("%Y%m%d%H%M")
+        timestamp = (now or datetime.now()).strftime("%Y%m%d%H%M")
         identity = self._buyer_context.identity
         seed = f"{product_id}-{identity.agency_id or identity.seat_id or 'public'}-{timestamp}"
-        hash_suffix = hashlib.md5(seed.encode()).hexdigest()[:8].upper()
+        hash_suffix = hashlib.blake2b(seed.encode(), digest_size=4).hexdigest().upper()
         return f"DEAL-{hash_suffix}"
 
     def _format_deal_response(self, deal: DealResponse) -> str:
         """Format deal response for output."""
-        deal_type_names = {
-            DealType.PROGRAMMATIC_GUARANTEED: "Programmatic Guaranteed (PG)",
-            DealType.PREFERRED_DEAL: "Preferred Deal (PD)",
-            DealType.PRIVATE_AUCTION: "Private Auction (PA)",
-        }
-
-        output_lines = [
-            "=" * 60,
-            "DEAL CREATED SUCCESSFULLY",
-            "=" * 60,
-            "",
-            f"Deal ID: {deal.deal_id}",
-            "",
-            "Deal Details",
-            "-" * 30,
-            f"Product: {deal.product_name}",
-            f"Product ID: {deal.product_id}",
-            f"Deal Type: {deal_type_names.get(deal.deal_type, deal.deal_type.value)}",
-            f"Flight: {deal.flight_start} to {deal.flight_end}",
-        ]
-
+        impressions_line = f"\nImpressions: {deal.impressions:,}" if deal.impressions else ""
+        total_line = ""
         if deal.impressions:
-            output_lines.append(f"Impressions: {deal.impressions:,}")
+            total_cost = (deal.price / 1000) * deal.impressions
+            total_line = f"\nEstimated Total: ${total_cost:,.2f}"
 
-        output_lines.extend([
-            "",
-            "Pricing",
-            "-" * 30,
-            f"Original CPM: ${deal.original_price:.2f}",
-            f"Your Tier: {deal.access_tier.value.upper()} ({deal.discount_applied}% discount)",
-            f"Final CPM: ${deal.price:.2f}",
-        ])
+        instructions = "".join(
+            f"\n• {platform.upper()}: {instruction}"
+            for platform, instruction in deal.activation_instructions.items()
+        )
 
-        if deal.impressions:
-            total_cost = (deal.price / 1000) * deal.impressions
-            output_lines.append(f"Estimated Total: ${total_cost:,.2f}")
-
-        output_lines.extend([
-            "",
-            "Activation Instructions",
-            "-" * 30,
-        ])
-
-        for platform, instruction in deal.activation_instructions.items():
-            output_lines.append(f"• {platform.upper()}: {instruction}")
-
-        output_lines.extend([
-            "",
-            "-" * 30,
-            f"Deal expires: {deal.expires_at}",
-            "",
-            "Copy the Deal ID above and enter it in your DSP's",
-            "Private Marketplace or Inventory section.",
-            "=" * 60,
-        ])
-
-        return "\n".join(output_lines)
+        return (
+            f"{_DOUBLE_RULE}\n"
+            "DEAL CREATED SUCCESSFULLY\n"
+            f"{_DOUBLE_RULE}\n"
+            "\n"
+            f"Deal ID: {deal.deal_id}\n"
+            "\n"
+            "Deal Details\n"
+            f"{_RULE}\n"
+            f"Product: {deal.product_name}\n"
+            f"Product ID: {deal.product_id}\n"
+            f"Deal Type: {_DEAL_TYPE_NAMES.get(deal.deal_type, deal.deal_type.value)}\n"
+            f"Flight: {deal.flight_start} to {deal.flight_end}"
+            f"{impressions_line}\n"
+            "\n"
+            "Pricing\n"
+            f"{_RULE}\n"
+            f"Original CPM: ${deal.original_price:.2f}\n"
+            f"Your Tier: {deal.access_tier.value.upper()} ({deal.discount_applied}% discount)\n"
+            f"Final CPM: ${deal.price:.2f}"
+            f"{total_line}\n"
+            "\n"
+            "Activation Instructions\n"
+            f"{_RULE}"
+            f"{instructions}\n"
+            "\n"
+            f"{_RULE}\n"
+            f"Deal expires: {deal.expires_at}\n"
+            "\n"
+            "Copy the Deal ID above and enter it in your DSP's\n"
+            "Private Marketplace or Inventory section.\n"
+            f"{_DOUBLE_RULE}"
+        )
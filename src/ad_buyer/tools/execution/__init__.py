@@ -4,6 +4,19 @@
 """Execution tools for order and line management."""
 
 from .order_management import CreateOrderTool
-from .line_management import CreateLineTool, ReserveLineTool, BookLineTool
+from .line_management import (
+    CreateLineTool,
+    CreateLinesBulkTool,
+    ReserveLineTool,
+    BookLineTool,
+    ReserveAndBookLineTool,
+)
 
-__all__ = ["CreateOrderTool", "CreateLineTool", "ReserveLineTool", "BookLineTool"]
+__all__ = [
+    "CreateOrderTool",
+    "CreateLineTool",
+    "CreateLinesBulkTool",
+    "ReserveLineTool",
+    "BookLineTool",
+    "ReserveAndBookLineTool",
+]
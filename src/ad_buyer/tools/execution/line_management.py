@@ -4,14 +4,72 @@
 """Line item management tools for booking inventory."""
 
 import asyncio
-from datetime import datetime
+from collections.abc import Callable
 from typing import Any, Optional
 
-from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from ...clients.opendirect_client import OpenDirectClient
 from ...models.opendirect import Line, RateType
+from ..base import OpenDirectTool
+from ..dates import parse_ymd
+
+# Maximum concurrent create requests issued by the bulk line tool
+_BULK_CREATE_CONCURRENCY = 8
+
+_RATE_TYPES: dict[str, RateType] = {rt.value: rt for rt in RateType}
+_RATE_TYPE_NAMES = ", ".join(_RATE_TYPES)
+
+_LINE_CREATED_TEMPLATE = """
+Line Item Created Successfully!
+
+Line ID: {line.id}
+Name: {line.name}
+Status: {line.booking_status.value}
+Product ID: {product_id}
+Order ID: {order_id}
+Flight: {start_date} to {end_date}
+
+Pricing:
+  Rate Type: {line.rate_type.value}
+  Rate: ${line.rate:.2f}
+  Quantity: {line.quantity:,}
+  Estimated Cost: ${estimated_cost:,.2f}
+
+Next steps:
+  - To reserve this inventory, use the reserve_line_item tool
+  - To book this line (make it live), use the book_line_item tool
+"""
+
+
+# Line cost from (quantity, rate) per rate type. Quantity counts impressions
+# for CPM/CPMV, clicks for CPC and days for CPD; a flat rate is the cost.
+_LINE_COST: dict[RateType, Callable[[int, float], float]] = {
+    RateType.CPM: lambda quantity, rate: quantity / 1000 * rate,
+    RateType.CPMV: lambda quantity, rate: quantity / 1000 * rate,
+    RateType.CPC: lambda quantity, rate: quantity * rate,
+    RateType.CPD: lambda quantity, rate: quantity * rate,
+    RateType.FLAT_RATE: lambda quantity, rate: rate,
+}
+
+
+def _estimated_cost(line: Line) -> float:
+    """Estimate the total cost of a line from its rate type, rate and quantity."""
+    return _LINE_COST[line.rate_type](line.quantity, line.rate)
+
+
+def _booked_cost(line: Line) -> float:
+    """Get the total cost of a booked line, estimating it from the rate if unset."""
+    return line.cost or _estimated_cost(line)
+
+
+def _entry_label(entry: Any, index: int) -> str:
+    """Name a bulk line entry for the report, even if it failed validation."""
+    name = entry.get("line_name") if isinstance(entry, dict) else getattr(entry, "line_name", None)
+    return str(name) if name else f"Line {index}"
+
+
+class _LineStepError(Exception):
+    """Raised when one step of reserving and booking a line fails."""
 
 
 class CreateLineInput(BaseModel):
@@ -20,7 +78,7 @@ class CreateLineInput(BaseModel):
     account_id: str = Field(..., description="Account ID")
     order_id: str = Field(..., description="Order ID to add line to")
     product_id: str = Field(..., description="Product ID to book")
-    line_name: str = Field(..., description="Name for the line item")
+    line_name: str = Field(..., description="Name for the line item", max_length=200)
     start_date: str = Field(..., description="Line start date (YYYY-MM-DD)")
     end_date: str = Field(..., description="Line end date (YYYY-MM-DD)")
     rate_type: str = Field(
@@ -34,8 +92,10 @@ class CreateLineInput(BaseModel):
         description="Targeting parameters (geo, demographic, etc.)",
     )
 
+    model_config = {"defer_build": True}
 
-class CreateLineTool(BaseTool):
+
+class CreateLineTool(OpenDirectTool):
     """Create a line item within an order to book specific inventory."""
 
     name: str = "create_line_item"
@@ -59,41 +119,6 @@ Returns:
     Line item confirmation with ID and booking status."""
 
     args_schema: type[BaseModel] = CreateLineInput
-    _client: OpenDirectClient
-
-    def __init__(self, client: OpenDirectClient, **kwargs: Any):
-        """Initialize with OpenDirect client."""
-        super().__init__(**kwargs)
-        self._client = client
-
-    def _run(
-        self,
-        account_id: str,
-        order_id: str,
-        product_id: str,
-        line_name: str,
-        start_date: str,
-        end_date: str,
-        rate_type: str = "CPM",
-        rate: float = 0,
-        quantity: int = 0,
-        targeting: Optional[dict[str, Any]] = None,
-    ) -> str:
-        """Synchronous wrapper for async line creation."""
-        return asyncio.run(
-            self._arun(
-                account_id=account_id,
-                order_id=order_id,
-                product_id=product_id,
-                line_name=line_name,
-                start_date=start_date,
-                end_date=end_date,
-                rate_type=rate_type,
-                rate=rate,
-                quantity=quantity,
-                targeting=targeting,
-            )
-        )
 
     async def _arun(
         self,
@@ -111,17 +136,17 @@ Returns:
         """Create a new line item."""
         try:
             # Parse dates
-            start_dt = datetime.fromisoformat(start_date)
-            end_dt = datetime.fromisoformat(end_date)
+            start_dt = parse_ymd(start_date)
+            end_dt = parse_ymd(end_date)
 
             # Parse rate type
-            try:
-                rt = RateType(rate_type)
-            except ValueError:
-                return f"Invalid rate type: {rate_type}. Valid options: CPM, CPMV, CPC, CPD, FlatRate"
+            rt = _RATE_TYPES.get(rate_type)
+            if rt is None:
+                return f"Invalid rate type: {rate_type}. Valid options: {_RATE_TYPE_NAMES}"
 
-            # Build line
-            line = Line(
+            # Build line. Arguments were validated against CreateLineInput,
+            # which covers every Line constraint, so skip re-validation.
+            line = Line.model_construct(
                 order_id=order_id,
                 product_id=product_id,
                 name=line_name,
@@ -136,31 +161,14 @@ Returns:
             # Create line
             result = await self._client.create_line(account_id, order_id, line)
 
-            # Calculate estimated cost
-            estimated_cost = 0.0
-            if result.rate_type == RateType.CPM:
-                estimated_cost = (result.quantity / 1000) * result.rate
-
-            return f"""
-Line Item Created Successfully!
-
-Line ID: {result.id}
-Name: {result.name}
-Status: {result.booking_status.value}
-Product ID: {product_id}
-Order ID: {order_id}
-Flight: {start_date} to {end_date}
-
-Pricing:
-  Rate Type: {result.rate_type.value}
-  Rate: ${result.rate:.2f}
-  Quantity: {result.quantity:,}
-  Estimated Cost: ${estimated_cost:,.2f}
-
-Next steps:
-  - To reserve this inventory, use the reserve_line_item tool
-  - To book this line (make it live), use the book_line_item tool
-"""
+            return _LINE_CREATED_TEMPLATE.format(
+                line=result,
+                product_id=product_id,
+                order_id=order_id,
+                start_date=start_date,
+                end_date=end_date,
+                estimated_cost=_estimated_cost(result),
+            )
 
         except ValueError as e:
             return f"Error parsing dates: {e}. Please use YYYY-MM-DD format."
@@ -168,6 +176,91 @@ Next steps:
             return f"Error creating line: {e}"
 
 
+class CreateLinesBulkInput(BaseModel):
+    """Input schema for creating several line items at once."""
+
+    lines: list[CreateLineInput] = Field(
+        ...,
+        description="Line items to create",
+        min_length=1,
+    )
+
+    model_config = {"defer_build": True}
+
+
+class CreateLinesBulkTool(OpenDirectTool):
+    """Create several line items concurrently."""
+
+    name: str = "create_line_items_bulk"
+    description: str = """Create several line items in one call. Each entry takes the
+same fields as create_line_item. Lines are created concurrently, so use this
+instead of calling create_line_item repeatedly when building out a campaign.
+
+Args:
+    lines: Line items to create, each with account_id, order_id, product_id,
+        line_name, start_date, end_date, rate_type, rate, quantity and
+        targeting (optional)
+
+Returns:
+    Per-line confirmation with ID and booking status, plus a summary."""
+
+    args_schema: type[BaseModel] = CreateLinesBulkInput
+
+    async def _arun(self, lines: list[Any]) -> str:
+        """Create the line items, at most _BULK_CREATE_CONCURRENCY at a time."""
+        semaphore = asyncio.Semaphore(_BULK_CREATE_CONCURRENCY)
+
+        async def create(entry: Any) -> tuple[CreateLineInput, Line]:
+            # Validated per entry so one malformed line does not fail the batch
+            spec = CreateLineInput.model_validate(entry)
+            rate_type = _RATE_TYPES.get(spec.rate_type)
+            if rate_type is None:
+                raise ValueError(
+                    f"Invalid rate type: {spec.rate_type}. Valid options: {_RATE_TYPE_NAMES}"
+                )
+            line = Line.model_construct(
+                order_id=spec.order_id,
+                product_id=spec.product_id,
+                name=spec.line_name,
+                start_date=parse_ymd(spec.start_date),
+                end_date=parse_ymd(spec.end_date),
+                rate_type=rate_type,
+                rate=spec.rate,
+                quantity=spec.quantity,
+                targeting=spec.targeting,
+            )
+            async with semaphore:
+                return spec, await self._client.create_line(spec.account_id, spec.order_id, line)
+
+        results = await asyncio.gather(
+            *(create(entry) for entry in lines),
+            return_exceptions=True,
+        )
+
+        sections = ["\nLine Item Creation Results\n"]
+        created = 0
+        for index, (entry, result) in enumerate(zip(lines, results), 1):
+            if isinstance(result, BaseException):
+                message = str(result) or type(result).__name__
+                sections.append(
+                    f"\n{_entry_label(entry, index)}: Error creating line: {message}\n"
+                )
+                continue
+
+            spec, line = result
+            created += 1
+            sections.append(
+                f"\n{spec.line_name}: {line.booking_status.value}\n"
+                f"  Line ID: {line.id}\n"
+                f"  Product ID: {spec.product_id}\n"
+                f"  Rate: ${line.rate:.2f} {line.rate_type.value}\n"
+                f"  Quantity: {line.quantity:,}\n"
+            )
+
+        sections.append(f"\nCreated {created} of {len(lines)} lines\n")
+        return "".join(sections)
+
+
 class ReserveLineInput(BaseModel):
     """Input schema for reserving a line."""
 
@@ -175,8 +268,10 @@ class ReserveLineInput(BaseModel):
     order_id: str = Field(..., description="Order ID")
     line_id: str = Field(..., description="Line ID to reserve")
 
+    model_config = {"defer_build": True}
+
 
-class ReserveLineTool(BaseTool):
+class ReserveLineTool(OpenDirectTool):
     """Reserve inventory for a line item."""
 
     name: str = "reserve_line_item"
@@ -193,27 +288,6 @@ Returns:
     Updated line status confirmation."""
 
     args_schema: type[BaseModel] = ReserveLineInput
-    _client: OpenDirectClient
-
-    def __init__(self, client: OpenDirectClient, **kwargs: Any):
-        """Initialize with OpenDirect client."""
-        super().__init__(**kwargs)
-        self._client = client
-
-    def _run(
-        self,
-        account_id: str,
-        order_id: str,
-        line_id: str,
-    ) -> str:
-        """Synchronous wrapper for async reserve."""
-        return asyncio.run(
-            self._arun(
-                account_id=account_id,
-                order_id=order_id,
-                line_id=line_id,
-            )
-        )
 
     async def _arun(
         self,
@@ -246,8 +320,10 @@ class BookLineInput(BaseModel):
     order_id: str = Field(..., description="Order ID")
     line_id: str = Field(..., description="Line ID to book")
 
+    model_config = {"defer_build": True}
+
 
-class BookLineTool(BaseTool):
+class BookLineTool(OpenDirectTool):
     """Confirm booking for a line item."""
 
     name: str = "book_line_item"
@@ -264,27 +340,6 @@ Returns:
     Booking confirmation with guaranteed impressions and cost."""
 
     args_schema: type[BaseModel] = BookLineInput
-    _client: OpenDirectClient
-
-    def __init__(self, client: OpenDirectClient, **kwargs: Any):
-        """Initialize with OpenDirect client."""
-        super().__init__(**kwargs)
-        self._client = client
-
-    def _run(
-        self,
-        account_id: str,
-        order_id: str,
-        line_id: str,
-    ) -> str:
-        """Synchronous wrapper for async book."""
-        return asyncio.run(
-            self._arun(
-                account_id=account_id,
-                order_id=order_id,
-                line_id=line_id,
-            )
-        )
 
     async def _arun(
         self,
@@ -295,13 +350,7 @@ Returns:
         """Book the line item."""
         try:
             result = await self._client.book_line(account_id, order_id, line_id)
-
-            # Calculate cost
-            cost = 0.0
-            if result.cost:
-                cost = result.cost
-            elif result.rate_type == RateType.CPM:
-                cost = (result.quantity / 1000) * result.rate
+            cost = _booked_cost(result)
 
             return f"""
 Line Item Booked Successfully!
@@ -316,3 +365,90 @@ The line item is now confirmed and will deliver during the flight dates.
 
         except Exception as e:
             return f"Error booking line: {e}"
+
+
+class ReserveAndBookLineInput(BaseModel):
+    """Input schema for reserving and booking lines in one step."""
+
+    account_id: str = Field(..., description="Account ID")
+    order_id: str = Field(..., description="Order ID")
+    line_ids: list[str] = Field(
+        ...,
+        description="Line IDs to reserve and book",
+        min_length=1,
+    )
+
+    model_config = {"defer_build": True}
+
+
+class ReserveAndBookLineTool(OpenDirectTool):
+    """Reserve and confirm booking for one or more line items."""
+
+    name: str = "reserve_and_book_line_items"
+    description: str = """Reserve inventory and confirm booking for one or more line
+items in a single step, taking each from Draft through Reserved to Booked.
+Lines are processed concurrently. Use this instead of calling reserve_line_item
+and book_line_item back-to-back when the booking should go ahead immediately.
+
+Args:
+    account_id: Account ID
+    order_id: Order ID
+    line_ids: Line IDs to reserve and book
+
+Returns:
+    Booking confirmation per line with guaranteed impressions and cost."""
+
+    args_schema: type[BaseModel] = ReserveAndBookLineInput
+
+    async def _arun(
+        self,
+        account_id: str,
+        order_id: str,
+        line_ids: list[str],
+    ) -> str:
+        """Reserve then book each line, running lines concurrently."""
+        results = await asyncio.gather(
+            *(self._reserve_and_book(account_id, order_id, line_id) for line_id in line_ids),
+            return_exceptions=True,
+        )
+
+        sections = ["\nLine Item Booking Results\n"]
+        booked = 0
+        total_cost = 0.0
+        for line_id, result in zip(line_ids, results):
+            if isinstance(result, BaseException):
+                # Cancellation escapes the per-step wrapping and has no message
+                message = str(result) or f"Error reserving or booking line: {type(result).__name__}"
+                sections.append(f"\n{line_id}: {message}\n")
+                continue
+
+            cost = _booked_cost(result)
+            booked += 1
+            total_cost += cost
+            sections.append(
+                f"\n{line_id}: {result.booking_status.value}\n"
+                f"  Guaranteed Impressions: {result.quantity:,}\n"
+                f"  Total Cost: ${cost:,.2f}\n"
+            )
+
+        sections.append(
+            f"\nBooked {booked} of {len(line_ids)} lines, total cost ${total_cost:,.2f}\n"
+        )
+        return "".join(sections)
+
+    async def _reserve_and_book(self, account_id: str, order_id: str, line_id: str) -> Line:
+        """Reserve a line and book it once the reservation succeeds.
+
+        Raises:
+            _LineStepError: If either step fails, naming the step that failed
+        """
+        try:
+            await self._client.reserve_line(account_id, order_id, line_id)
+        except Exception as e:
+            raise _LineStepError(f"Error reserving line: {e}") from e
+        try:
+            return await self._client.book_line(account_id, order_id, line_id)
+        except Exception as e:
+            raise _LineStepError(
+                f"Error booking line: {e} (the line is still reserved)"
+            ) from e
@@ -3,15 +3,13 @@
 
 """Order management tool for creating advertising orders."""
 
-import asyncio
-from datetime import datetime
-from typing import Any
+from typing import Optional
 
-from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from ...clients.opendirect_client import OpenDirectClient
 from ...models.opendirect import Order
+from ..base import OpenDirectTool
+from ..dates import parse_ymd
 
 
 class CreateOrderInput(BaseModel):
@@ -24,6 +22,7 @@ class CreateOrderInput(BaseModel):
     order_name: str = Field(
         ...,
         description="Name/title for the order",
+        max_length=100,
     )
     brand_id: str = Field(
         ...,
@@ -46,13 +45,15 @@ class CreateOrderInput(BaseModel):
         default="USD",
         description="Budget currency (ISO-4217)",
     )
-    publisher_id: str | None = Field(
+    publisher_id: Optional[str] = Field(
         default=None,
         description="Target publisher ID (optional)",
     )
 
+    model_config = {"defer_build": True}
 
-class CreateOrderTool(BaseTool):
+
+class CreateOrderTool(OpenDirectTool):
     """Create a new advertising order (IO) in OpenDirect."""
 
     name: str = "create_advertising_order"
@@ -74,37 +75,6 @@ Returns:
     Order confirmation with ID and status."""
 
     args_schema: type[BaseModel] = CreateOrderInput
-    _client: OpenDirectClient
-
-    def __init__(self, client: OpenDirectClient, **kwargs: Any):
-        """Initialize with OpenDirect client."""
-        super().__init__(**kwargs)
-        self._client = client
-
-    def _run(
-        self,
-        account_id: str,
-        order_name: str,
-        brand_id: str,
-        start_date: str,
-        end_date: str,
-        budget: float,
-        currency: str = "USD",
-        publisher_id: str | None = None,
-    ) -> str:
-        """Synchronous wrapper for async order creation."""
-        return asyncio.run(
-            self._arun(
-                account_id=account_id,
-                order_name=order_name,
-                brand_id=brand_id,
-                start_date=start_date,
-                end_date=end_date,
-                budget=budget,
-                currency=currency,
-                publisher_id=publisher_id,
-            )
-        )
 
     async def _arun(
         self,
@@ -115,16 +85,17 @@ Returns:
         end_date: str,
         budget: float,
         currency: str = "USD",
-        publisher_id: str | None = None,
+        publisher_id: Optional[str] = None,
     ) -> str:
         """Create a new advertising order."""
         try:
             # Parse dates
-            start_dt = datetime.fromisoformat(start_date)
-            end_dt = datetime.fromisoformat(end_date)
+            start_dt = parse_ymd(start_date)
+            end_dt = parse_ymd(end_date)
 
-            # Build order
-            order = Order(
+            # Build order. Arguments were validated against CreateOrderInput,
+            # which covers every Order constraint, so skip re-validation.
+            order = Order.model_construct(
                 name=order_name,
                 account_id=account_id,
                 brand_id=brand_id,
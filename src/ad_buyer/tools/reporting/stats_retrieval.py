@@ -3,13 +3,52 @@
 
 """Stats retrieval tool for performance reporting."""
 
-import asyncio
-from typing import Any
+from typing import Optional
 
-from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from ...clients.opendirect_client import OpenDirectClient
+from ..base import OpenDirectTool
+
+# Indexed by 1 + over-delivering - under-delivering
+_PACING_HEALTH = ("Under-delivering", "On track", "Over-delivering")
+
+# Indexed by whether the condition in the analysis holds
+_PERFORMANCE_NOTES = ("Campaign may need optimization.", "Campaign is performing well.")
+_PACING_NOTES = ("Consider adjusting pacing.", "Budget pacing is on track.")
+
+
+def _fmt_pct(value: Optional[float], precision: int = 1) -> str:
+    """Format an optional percentage, or "N/A" when it is not reported."""
+    return "N/A" if value is None else f"{value:.{precision}f}%"
+
+
+_STATS_TEMPLATE = """
+Performance Statistics for Line {line_id}
+
+Delivery Metrics:
+  Impressions Delivered: {stats.impressions_delivered:,}
+  Target Impressions: {stats.target_impressions:,}
+  Delivery Rate: {stats.delivery_rate:.1f}%
+  Pacing Status: {pacing_str}
+  Pacing Health: {pacing_health}
+
+Spend:
+  Amount Spent: ${stats.amount_spent:,.2f}
+  Budget: ${stats.budget:,.2f}
+  Budget Utilization: {stats.budget_utilization:.1f}%
+
+Performance:
+  Effective CPM: ${stats.effective_cpm:.2f}
+  Video Completion Rate: {vcr_str}
+  Viewability: {viewability_str}
+  Click-Through Rate: {ctr_str}
+
+Last Updated: {last_updated_str}
+
+Analysis:
+  {performance_note}
+  {pacing_note}
+"""
 
 
 class GetStatsInput(BaseModel):
@@ -19,8 +58,10 @@ class GetStatsInput(BaseModel):
     order_id: str = Field(..., description="Order ID")
     line_id: str = Field(..., description="Line ID to get stats for")
 
+    model_config = {"defer_build": True}
 
-class GetStatsTool(BaseTool):
+
+class GetStatsTool(OpenDirectTool):
     """Retrieve performance statistics for a line item."""
 
     name: str = "get_line_statistics"
@@ -36,27 +77,6 @@ Returns:
     Performance statistics with delivery metrics, spend, and performance indicators."""
 
     args_schema: type[BaseModel] = GetStatsInput
-    _client: OpenDirectClient
-
-    def __init__(self, client: OpenDirectClient, **kwargs: Any):
-        """Initialize with OpenDirect client."""
-        super().__init__(**kwargs)
-        self._client = client
-
-    def _run(
-        self,
-        account_id: str,
-        order_id: str,
-        line_id: str,
-    ) -> str:
-        """Synchronous wrapper for async stats retrieval."""
-        return asyncio.run(
-            self._arun(
-                account_id=account_id,
-                order_id=order_id,
-                line_id=line_id,
-            )
-        )
 
     async def _arun(
         self,
@@ -69,50 +89,34 @@ Returns:
             stats = await self._client.get_line_stats(account_id, order_id, line_id)
 
             # Format optional fields
-            vcr_str = f"{stats.vcr:.1f}%" if stats.vcr is not None else "N/A"
-            viewability_str = (
-                f"{stats.viewability:.1f}%" if stats.viewability is not None else "N/A"
-            )
-            ctr_str = f"{stats.ctr:.3f}%" if stats.ctr is not None else "N/A"
+            vcr_str = _fmt_pct(stats.vcr)
+            viewability_str = _fmt_pct(stats.viewability)
+            ctr_str = _fmt_pct(stats.ctr, precision=3)
             pacing_str = stats.pacing_status or "N/A"
             last_updated_str = (
                 stats.last_updated.isoformat() if stats.last_updated else "N/A"
             )
 
-            # Determine pacing health
-            pacing_health = "On track"
-            if stats.delivery_rate < stats.budget_utilization * 0.8:
-                pacing_health = "Under-delivering"
-            elif stats.delivery_rate > stats.budget_utilization * 1.2:
-                pacing_health = "Over-delivering"
-
-            return f"""
-Performance Statistics for Line {line_id}
+            # Determine pacing health. Utilization is non-negative, so a line
+            # can't be under- and over-delivering at once.
+            delivery = stats.delivery_rate
+            utilization = stats.budget_utilization
+            pacing_health = _PACING_HEALTH[
+                1 + (delivery > utilization * 1.2) - (delivery < utilization * 0.8)
+            ]
 
-Delivery Metrics:
-  Impressions Delivered: {stats.impressions_delivered:,}
-  Target Impressions: {stats.target_impressions:,}
-  Delivery Rate: {stats.delivery_rate:.1f}%
-  Pacing Status: {pacing_str}
-  Pacing Health: {pacing_health}
-
-Spend:
-  Amount Spent: ${stats.amount_spent:,.2f}
-  Budget: ${stats.budget:,.2f}
-  Budget Utilization: {stats.budget_utilization:.1f}%
-
-Performance:
-  Effective CPM: ${stats.effective_cpm:.2f}
-  Video Completion Rate: {vcr_str}
-  Viewability: {viewability_str}
-  Click-Through Rate: {ctr_str}
-
-Last Updated: {last_updated_str}
-
-Analysis:
-  {"Campaign is performing well." if stats.delivery_rate >= 80 else "Campaign may need optimization."}
-  {"Budget pacing is on track." if abs(stats.delivery_rate - stats.budget_utilization) < 10 else "Consider adjusting pacing."}
-"""
+            return _STATS_TEMPLATE.format(
+                line_id=line_id,
+                stats=stats,
+                pacing_str=pacing_str,
+                pacing_health=pacing_health,
+                vcr_str=vcr_str,
+                viewability_str=viewability_str,
+                ctr_str=ctr_str,
+                last_updated_str=last_updated_str,
+                performance_note=_PERFORMANCE_NOTES[delivery >= 80],
+                pacing_note=_PACING_NOTES[abs(delivery - utilization) < 10],
+            )
 
         except Exception as e:
             return f"Error retrieving stats: {e}"
@@ -1,9 +1,32 @@
 # Author: Green Mountain Systems AI Inc.
 # Donated to IAB Tech Lab
 
-"""Research tools for inventory discovery."""
+"""Research tools for inventory discovery.
 
-from .product_search import ProductSearchTool
-from .avails_check import AvailsCheckTool
+Tools are imported on first access, so importing one tool module (as the CLI
+does with ``product_search``) does not load the others.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .avails_check import AvailsCheckTool
+    from .product_search import ProductSearchTool
+
+_TOOL_MODULES = {
+    "ProductSearchTool": ".product_search",
+    "AvailsCheckTool": ".avails_check",
+}
 
 __all__ = ["ProductSearchTool", "AvailsCheckTool"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a research tool on first access."""
+    module = _TOOL_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    tool = getattr(import_module(module, __name__), name)
+    globals()[name] = tool
+    return tool
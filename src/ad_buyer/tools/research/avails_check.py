@@ -3,15 +3,32 @@
 
 """Availability check tool for inventory pricing."""
 
-import asyncio
-from datetime import datetime
 from typing import Any, Optional
 
-from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from ...clients.opendirect_client import OpenDirectClient
 from ...models.opendirect import AvailsRequest
+from ..base import OpenDirectTool
+from ..dates import parse_ymd
+
+_AVAILS_TEMPLATE = """
+Availability Check Results for Product {product_id}
+
+Flight Dates: {start_date} to {end_date}
+
+Inventory:
+  Available Impressions: {avails.available_impressions:,}
+  Guaranteed Impressions: {guaranteed_str}
+  Delivery Confidence: {confidence_str}
+
+Pricing:
+  Estimated CPM: ${avails.estimated_cpm:.2f}
+  Total Cost: ${avails.total_cost:,.2f}
+
+Targeting Available: {targeting_str}
+
+Recommendation: {recommendation}
+"""
 
 
 class AvailsCheckInput(BaseModel):
@@ -38,8 +55,10 @@ class AvailsCheckInput(BaseModel):
         description="Total budget in USD",
     )
 
+    model_config = {"defer_build": True}
+
 
-class AvailsCheckTool(BaseTool):
+class AvailsCheckTool(OpenDirectTool):
     """Check real-time availability and pricing for a specific advertising product."""
 
     name: str = "check_inventory_availability"
@@ -58,31 +77,6 @@ Returns:
     Availability details including impressions, pricing, and delivery confidence."""
 
     args_schema: type[BaseModel] = AvailsCheckInput
-    _client: OpenDirectClient
-
-    def __init__(self, client: OpenDirectClient, **kwargs: Any):
-        """Initialize with OpenDirect client."""
-        super().__init__(**kwargs)
-        self._client = client
-
-    def _run(
-        self,
-        product_id: str,
-        start_date: str,
-        end_date: str,
-        impressions: Optional[int] = None,
-        budget: Optional[float] = None,
-    ) -> str:
-        """Synchronous wrapper for async avails check."""
-        return asyncio.run(
-            self._arun(
-                product_id=product_id,
-                start_date=start_date,
-                end_date=end_date,
-                impressions=impressions,
-                budget=budget,
-            )
-        )
 
     async def _arun(
         self,
@@ -95,11 +89,12 @@ Returns:
         """Check availability for the specified product."""
         try:
             # Parse dates
-            start_dt = datetime.fromisoformat(start_date)
-            end_dt = datetime.fromisoformat(end_date)
+            start_dt = parse_ymd(start_date)
+            end_dt = parse_ymd(end_date)
 
-            # Build request
-            request = AvailsRequest(
+            # Build request from arguments already validated against
+            # AvailsCheckInput
+            request = AvailsRequest.model_construct(
                 product_id=product_id,
                 start_date=start_dt,
                 end_date=end_dt,
@@ -141,21 +136,19 @@ Returns:
             else "N/A"
         )
 
-        return f"""
-Availability Check Results for Product {product_id}
-
-Flight Dates: {start_date} to {end_date}
-
-Inventory:
-  Available Impressions: {avails.available_impressions:,}
-  Guaranteed Impressions: {guaranteed_str}
-  Delivery Confidence: {confidence_str}
-
-Pricing:
-  Estimated CPM: ${avails.estimated_cpm:.2f}
-  Total Cost: ${avails.total_cost:,.2f}
-
-Targeting Available: {targeting_str}
+        recommendation = (
+            "Good to book"
+            if avails.delivery_confidence and avails.delivery_confidence >= 80
+            else "Consider alternatives or reduce volume"
+        )
 
-Recommendation: {"Good to book" if avails.delivery_confidence and avails.delivery_confidence >= 80 else "Consider alternatives or reduce volume"}
-"""
+        return _AVAILS_TEMPLATE.format(
+            product_id=product_id,
+            start_date=start_date,
+            end_date=end_date,
+            avails=avails,
+            guaranteed_str=guaranteed_str,
+            confidence_str=confidence_str,
+            targeting_str=targeting_str,
+            recommendation=recommendation,
+        )
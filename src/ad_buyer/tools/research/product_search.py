@@ -3,13 +3,13 @@
 
 """Product search tool for inventory discovery."""
 
-import asyncio
+import math
+from itertools import islice
 from typing import Any, Optional
 
-from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from ...clients.opendirect_client import OpenDirectClient
+from ..base import OpenDirectTool
 
 
 class ProductSearchInput(BaseModel):
@@ -50,8 +50,10 @@ class ProductSearchInput(BaseModel):
         le=50,
     )
 
+    model_config = {"defer_build": True}
 
-class ProductSearchTool(BaseTool):
+
+class ProductSearchTool(OpenDirectTool):
     """Search for advertising products/inventory across publishers."""
 
     name: str = "search_advertising_products"
@@ -73,37 +75,6 @@ Returns:
     Formatted list of matching products with pricing and capabilities."""
 
     args_schema: type[BaseModel] = ProductSearchInput
-    _client: OpenDirectClient
-
-    def __init__(self, client: OpenDirectClient, **kwargs: Any):
-        """Initialize with OpenDirect client."""
-        super().__init__(**kwargs)
-        self._client = client
-
-    def _run(
-        self,
-        channel: Optional[str] = None,
-        format: Optional[str] = None,
-        min_price: Optional[float] = None,
-        max_price: Optional[float] = None,
-        publisher_ids: Optional[list[str]] = None,
-        targeting_capabilities: Optional[list[str]] = None,
-        delivery_type: Optional[str] = None,
-        limit: int = 10,
-    ) -> str:
-        """Synchronous wrapper for async search."""
-        return asyncio.run(
-            self._arun(
-                channel=channel,
-                format=format,
-                min_price=min_price,
-                max_price=max_price,
-                publisher_ids=publisher_ids,
-                targeting_capabilities=targeting_capabilities,
-                delivery_type=delivery_type,
-                limit=limit,
-            )
-        )
 
     async def _arun(
         self,
@@ -139,14 +110,11 @@ Returns:
         except Exception as e:
             return f"Error searching products: {e}"
 
-        # Filter by price client-side if needed
-        if min_price is not None:
-            products = [p for p in products if p.base_price >= min_price]
-        if max_price is not None:
-            products = [p for p in products if p.base_price <= max_price]
-
-        # Limit results
-        products = products[:limit]
+        # Filter by price client-side and limit in one pass, stopping once
+        # enough products match
+        low = min_price if min_price is not None else -math.inf
+        high = max_price if max_price is not None else math.inf
+        products = list(islice((p for p in products if low <= p.base_price <= high), limit))
 
         return self._format_results(products)
 
@@ -155,7 +123,7 @@ Returns:
         if not products:
             return "No products found matching the search criteria."
 
-        output = f"Found {len(products)} matching products:\n\n"
+        parts = [f"Found {len(products)} matching products:\n\n"]
 
         for i, p in enumerate(products, 1):
             targeting_str = "N/A"
@@ -165,18 +133,20 @@ Returns:
                     targeting_str = ", ".join(capabilities)
 
             avail_str = f"{p.available_impressions:,}" if p.available_impressions else "N/A"
+            channel = getattr(p, "channel", "N/A")
+            ad_format = getattr(p, "ad_format", "N/A")
 
-            output += f"""
+            parts.append(f"""
 {i}. {p.name}
    Product ID: {p.id}
    Publisher ID: {p.publisher_id}
-   Channel: {getattr(p, 'channel', 'N/A')}
-   Format: {getattr(p, 'ad_format', 'N/A')}
+   Channel: {channel}
+   Format: {ad_format}
    Base CPM: ${p.base_price:.2f}
    Rate Type: {p.rate_type.value}
    Delivery Type: {p.delivery_type.value}
    Available Impressions: {avail_str}
    Targeting: {targeting_str}
    ---
-"""
-        return output
+""")
+        return "".join(parts)
@@ -1,56 +1,81 @@
 # Author: Green Mountain Systems AI Inc.
 # Donated to IAB Tech Lab
 
-"""Pytest configuration and fixtures."""
+"""Pytest configuration and fixtures.
+
+Sample payloads are built once at import and returned read-only, so tests
+cannot leak changes into each other. Tests that need to modify a payload
+should copy it into a plain dict first, e.g. ``{**sample_product, "id": "x"}``.
+"""
+
+import os
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
+from typing import Any
 
 import pytest
 
+_SAMPLE_CAMPAIGN_BRIEF: Mapping[str, Any] = MappingProxyType({
+    "name": "Test Campaign",
+    "objectives": ("brand awareness", "reach"),
+    "budget": 50000,
+    "start_date": "2025-02-01",
+    "end_date": "2025-02-28",
+    "target_audience": MappingProxyType({
+        "age": "25-54",
+        "gender": "all",
+        "geo": ("US",),
+    }),
+    "kpis": MappingProxyType({
+        "viewability": 70,
+    }),
+})
+
+_SAMPLE_PRODUCT: Mapping[str, Any] = MappingProxyType({
+    "id": "prod_123",
+    "publisherId": "pub_abc",
+    "name": "Homepage Banner",
+    "currency": "USD",
+    "basePrice": 15.00,
+    "rateType": "CPM",
+    "deliveryType": "Guaranteed",
+    "availableImpressions": 1000000,
+})
+
+_SAMPLE_ORDER: Mapping[str, Any] = MappingProxyType({
+    "id": "order_456",
+    "name": "Test Order",
+    "accountId": "acct_789",
+    "budget": 25000,
+    "currency": "USD",
+    "startDate": "2025-02-01T00:00:00Z",
+    "endDate": "2025-02-28T23:59:59Z",
+    "orderStatus": "PENDING",
+})
+
+
+@pytest.fixture(scope="session", autouse=True)
+def anthropic_api_key() -> Iterator[None]:
+    """Provide a dummy API key for the session; agents validate it on creation."""
+    with pytest.MonkeyPatch.context() as mp:
+        if not os.environ.get("ANTHROPIC_API_KEY"):
+            mp.setenv("ANTHROPIC_API_KEY", "test-key-for-unit-tests")
+        yield
 
-@pytest.fixture
-def sample_campaign_brief() -> dict:
+
+@pytest.fixture(scope="session")
+def sample_campaign_brief() -> Mapping[str, Any]:
     """Sample campaign brief for testing."""
-    return {
-        "name": "Test Campaign",
-        "objectives": ["brand awareness", "reach"],
-        "budget": 50000,
-        "start_date": "2025-02-01",
-        "end_date": "2025-02-28",
-        "target_audience": {
-            "age": "25-54",
-            "gender": "all",
-            "geo": ["US"],
-        },
-        "kpis": {
-            "viewability": 70,
-        },
-    }
-
-
-@pytest.fixture
-def sample_product() -> dict:
+    return _SAMPLE_CAMPAIGN_BRIEF
+
+
+@pytest.fixture(scope="session")
+def sample_product() -> Mapping[str, Any]:
     """Sample product for testing."""
-    return {
-        "id": "prod_123",
-        "publisherId": "pub_abc",
-        "name": "Homepage Banner",
-        "currency": "USD",
-        "basePrice": 15.00,
-        "rateType": "CPM",
-        "deliveryType": "Guaranteed",
-        "availableImpressions": 1000000,
-    }
-
-
-@pytest.fixture
-def sample_order() -> dict:
+    return _SAMPLE_PRODUCT
+
+
+@pytest.fixture(scope="session")
+def sample_order() -> Mapping[str, Any]:
     """Sample order for testing."""
-    return {
-        "id": "order_456",
-        "name": "Test Order",
-        "accountId": "acct_789",
-        "budget": 25000,
-        "currency": "USD",
-        "startDate": "2025-02-01T00:00:00Z",
-        "endDate": "2025-02-28T23:59:59Z",
-        "orderStatus": "PENDING",
-    }
+    return _SAMPLE_ORDER
@@ -0,0 +1,182 @@
+# Author: Green Mountain Systems AI Inc.
+# Donated to IAB Tech Lab
+
+"""Tests for audience planning tools."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ad_buyer.models.ucp import AudienceValidationResult
+from ad_buyer.tools.audience import (
+    AudienceDiscoveryTool,
+    PlanAudienceTool,
+)
+from ad_buyer.tools.audience.audience_matching import format_match_result, mock_validation
+from ad_buyer.tools.audience.coverage_estimation import calculate_coverage
+
+
+@pytest.fixture
+def discovery_tool():
+    """Create a discovery tool whose seller returns no capabilities (mock data)."""
+    tool = AudienceDiscoveryTool()
+    with patch(
+        "ad_buyer.tools.audience.audience_discovery.UCPClient.discover_capabilities",
+        new_callable=AsyncMock,
+        return_value=[],
+    ):
+        yield tool
+
+
+class TestAudienceDiscoveryTool:
+    """Tests for AudienceDiscoveryTool."""
+
+    async def test_discover_returns_all_mock_capabilities(self, discovery_tool):
+        """Without filters every mock capability should be listed."""
+        result = await discovery_tool._arun(seller_endpoint="http://seller.test/caps")
+
+        assert "Found 6 audience capabilities" in result
+        assert "## IDENTITY SIGNALS" in result
+        assert "## CONTEXTUAL SIGNALS" in result
+        assert "## REINFORCEMENT SIGNALS" in result
+
+    async def test_filter_by_signal_type(self, discovery_tool):
+        """Signal type filtering should be case-insensitive."""
+        result = await discovery_tool._arun(
+            seller_endpoint="http://seller.test/caps",
+            signal_types=["Contextual"],
+        )
+
+        assert "Found 2 audience capabilities" in result
+        assert "## IDENTITY SIGNALS" not in result
+
+    async def test_unknown_signal_types_are_ignored(self, discovery_tool):
+        """Unknown signal types alone should not filter anything out."""
+        result = await discovery_tool._arun(
+            seller_endpoint="http://seller.test/caps",
+            signal_types=["psychographic"],
+        )
+
+        assert "Found 6 audience capabilities" in result
+
+    async def test_filter_by_signal_type_and_min_coverage(self, discovery_tool):
+        """Signal type and coverage filters should combine."""
+        result = await discovery_tool._arun(
+            seller_endpoint="http://seller.test/caps",
+            signal_types=["identity", "reinforcement"],
+            min_coverage=50,
+        )
+
+        assert "Found 2 audience capabilities" in result
+        assert "Age Demographics" in result
+        assert "Gender Demographics" in result
+        assert "Purchase Intent" not in result
+
+    def test_sync_run_uses_background_loop(self, discovery_tool):
+        """The synchronous entry point should work outside any event loop."""
+        result = discovery_tool._run(seller_endpoint="http://seller.test/caps")
+
+        assert "Found 6 audience capabilities" in result
+
+
+class TestCoverageEstimationTool:
+    """Tests for CoverageEstimationTool."""
+
+    def test_targeting_key_is_stable_and_order_independent(self):
+        """Targeting keys should not depend on hash seed or dict order."""
+        first = calculate_coverage(
+            {"demographics": {"age": "25-34"}, "interests": ["sports"]},
+            "ctv",
+            1_000_000,
+        )
+        second = calculate_coverage(
+            {"interests": ["sports"], "demographics": {"age": "25-34"}},
+            "ctv",
+            1_000_000,
+        )
+
+        assert first[0].targeting_key == second[0].targeting_key
+        assert first[0].targeting_key.startswith("ctv_")
+        assert len(first[0].targeting_key) == len("ctv_") + 4
+
+
+class TestAudienceMatchingTool:
+    """Tests for AudienceMatchingTool."""
+
+    @pytest.mark.parametrize(
+        ("score", "quality"),
+        [(0.7, "STRONG"), (0.69, "MODERATE"), (0.5, "MODERATE"), (0.3, "WEAK"), (0.1, "POOR")],
+    )
+    def test_match_quality_thresholds(self, score, quality):
+        """Scores at a threshold should fall into the higher band."""
+        validation = AudienceValidationResult(
+            validation_status="valid",
+            ucp_similarity_score=score,
+            targeting_compatible=True,
+        )
+        result = format_match_result({"interests": ["sports"]}, validation)
+
+        assert f"**Match Quality: {quality}**" in result
+
+    def test_mock_validation_status(self):
+        """Mock validation should derive status from the simulated score."""
+        interests_only = mock_validation({"interests": ["sports"]})
+        behaviors = mock_validation({"behaviors": ["auto_intenders"]})
+
+        assert interests_only.validation_status == "valid"
+        assert interests_only.targeting_compatible is True
+        assert behaviors.validation_status == "partial_match"
+        assert behaviors.targeting_compatible is False
+
+
+class TestPlanAudienceTool:
+    """Tests for PlanAudienceTool."""
+
+    async def test_plan_combines_all_sections(self):
+        """One call should render discovery, matching and coverage output."""
+        with patch(
+            "ad_buyer.tools.audience.audience_planning.UCPClient.discover_capabilities",
+            new_callable=AsyncMock,
+            return_value=[],
+        ), patch(
+            "ad_buyer.tools.audience.audience_planning.UCPClient.validate_audience_with_seller",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("seller unavailable"),
+        ) as validate:
+            result = await PlanAudienceTool()._arun(
+                seller_endpoint="http://seller.test/ucp",
+                interests=["sports"],
+                signal_types=["contextual"],
+                channel="ctv",
+            )
+
+        validate.assert_awaited_once()
+        assert "Found 2 audience capabilities" in result
+        assert "**Match Quality: STRONG**" in result
+        assert "**CTV**" in result
+
+    async def test_plan_falls_back_when_discovery_is_cancelled(self):
+        """A cancelled discovery should fall back to mock capabilities."""
+        with patch(
+            "ad_buyer.tools.audience.audience_planning.UCPClient.discover_capabilities",
+            new_callable=AsyncMock,
+            side_effect=asyncio.CancelledError,
+        ), patch(
+            "ad_buyer.tools.audience.audience_planning.UCPClient.validate_audience_with_seller",
+            new_callable=AsyncMock,
+            side_effect=asyncio.CancelledError,
+        ):
+            result = await PlanAudienceTool()._arun(
+                seller_endpoint="http://seller.test/ucp",
+                interests=["sports"],
+            )
+
+        assert "audience capabilities" in result
+        assert "**Match Quality:" in result
+
+    async def test_plan_requires_audience(self):
+        """Planning without requirements should return an error."""
+        result = await PlanAudienceTool()._arun(seller_endpoint="http://seller.test/ucp")
+
+        assert result.startswith("Error:")
@@ -15,47 +15,104 @@ from ad_buyer.models.buyer_identity import (
 )
 
 
+@pytest.fixture(scope="module")
+def seat_identity():
+    """Seat-tier identity, shared read-only across the module."""
+    return BuyerIdentity(seat_id="ttd-seat-123")
+
+
+@pytest.fixture(scope="module")
+def agency_identity():
+    """Agency-tier identity, shared read-only across the module."""
+    return BuyerIdentity(agency_id="omnicom-456", agency_name="OMD")
+
+
+@pytest.fixture(scope="module")
+def advertiser_identity():
+    """Advertiser-tier identity, shared read-only across the module."""
+    return BuyerIdentity(agency_id="omnicom-456", advertiser_id="coca-cola-789")
+
+
+@pytest.fixture(scope="module")
+def full_identity():
+    """Identity with every field set, shared read-only across the module."""
+    return BuyerIdentity(
+        seat_id="ttd-seat-123",
+        seat_name="The Trade Desk",
+        agency_id="omnicom-456",
+        agency_name="OMD",
+        agency_holding_company="Omnicom",
+        advertiser_id="coca-cola-789",
+        advertiser_name="Coca-Cola",
+        advertiser_industry="CPG",
+    )
+
+
+@pytest.fixture(scope="module")
+def deal_response():
+    """Fully populated deal response, shared read-only across the module."""
+    return DealResponse(
+        deal_id="DEAL-A1B2C3D4",
+        product_id="prod_123",
+        product_name="Premium CTV Package",
+        deal_type=DealType.PREFERRED_DEAL,
+        price=17.00,
+        original_price=20.00,
+        discount_applied=15.0,
+        access_tier=AccessTier.ADVERTISER,
+        impressions=5_000_000,
+        flight_start="2026-02-01",
+        flight_end="2026-02-28",
+        activation_instructions={
+            "ttd": "Enter Deal ID in TTD > Inventory > PMP",
+            "dv360": "Enter Deal ID in DV360 > Inventory > My Inventory",
+        },
+        expires_at="2026-01-25",
+    )
+
+
 class TestBuyerIdentity:
     """Tests for BuyerIdentity model."""
 
-    def test_empty_identity_is_public_tier(self):
-        """Empty identity should be public tier."""
-        identity = BuyerIdentity()
-        assert identity.get_access_tier() == AccessTier.PUBLIC
-        assert identity.get_discount_percentage() == 0.0
-
-    def test_seat_id_only_is_seat_tier(self):
-        """Seat ID only should be seat tier with 5% discount."""
-        identity = BuyerIdentity(
-            seat_id="ttd-seat-123",
-            seat_name="The Trade Desk",
-        )
-        assert identity.get_access_tier() == AccessTier.SEAT
-        assert identity.get_discount_percentage() == 5.0
-
-    def test_agency_id_is_agency_tier(self):
-        """Agency ID should be agency tier with 10% discount."""
-        identity = BuyerIdentity(
-            seat_id="ttd-seat-123",
-            agency_id="omnicom-456",
-            agency_name="OMD",
-            agency_holding_company="Omnicom",
-        )
-        assert identity.get_access_tier() == AccessTier.AGENCY
-        assert identity.get_discount_percentage() == 10.0
-
-    def test_advertiser_id_is_advertiser_tier(self):
-        """Advertiser ID should be advertiser tier with 15% discount."""
-        identity = BuyerIdentity(
-            seat_id="ttd-seat-123",
-            agency_id="omnicom-456",
-            agency_name="OMD",
-            advertiser_id="coca-cola-789",
-            advertiser_name="Coca-Cola",
-            advertiser_industry="CPG",
-        )
-        assert identity.get_access_tier() == AccessTier.ADVERTISER
-        assert identity.get_discount_percentage() == 15.0
+    @pytest.mark.parametrize(
+        "fields, tier, discount",
+        [
+            ({}, AccessTier.PUBLIC, 0.0),
+            (
+                {"seat_id": "ttd-seat-123", "seat_name": "The Trade Desk"},
+                AccessTier.SEAT,
+                5.0,
+            ),
+            (
+                {
+                    "seat_id": "ttd-seat-123",
+                    "agency_id": "omnicom-456",
+                    "agency_name": "OMD",
+                    "agency_holding_company": "Omnicom",
+                },
+                AccessTier.AGENCY,
+                10.0,
+            ),
+            (
+                {
+                    "seat_id": "ttd-seat-123",
+                    "agency_id": "omnicom-456",
+                    "agency_name": "OMD",
+                    "advertiser_id": "coca-cola-789",
+                    "advertiser_name": "Coca-Cola",
+                    "advertiser_industry": "CPG",
+                },
+                AccessTier.ADVERTISER,
+                15.0,
+            ),
+        ],
+        ids=["public", "seat", "agency", "advertiser"],
+    )
+    def test_identity_tier_and_discount(self, fields, tier, discount):
+        """Each identity level maps to its access tier and discount."""
+        identity = BuyerIdentity(**fields)
+        assert identity.get_access_tier() == tier
+        assert identity.get_discount_percentage() == discount
 
     def test_advertiser_without_agency_is_still_advertiser_tier(self):
         """Advertiser ID without agency should still be advertiser tier."""
@@ -65,19 +122,17 @@ class TestBuyerIdentity:
         )
         assert identity.get_access_tier() == AccessTier.ADVERTISER
 
-    def test_to_header_dict_includes_all_fields(self):
-        """to_header_dict should include all non-null identity fields."""
-        identity = BuyerIdentity(
-            seat_id="ttd-seat-123",
-            seat_name="The Trade Desk",
-            agency_id="omnicom-456",
-            agency_name="OMD",
-            agency_holding_company="Omnicom",
-            advertiser_id="coca-cola-789",
-            advertiser_name="Coca-Cola",
-            advertiser_industry="CPG",
+    def test_tier_and_discount_match_individual_lookups(self):
+        """Combined lookup should agree with the separate getters."""
+        identity = BuyerIdentity(seat_id="ttd-seat-123", agency_id="omnicom-456")
+        assert identity.get_tier_and_discount() == (
+            identity.get_access_tier(),
+            identity.get_discount_percentage(),
         )
-        headers = identity.to_header_dict()
+
+    def test_to_header_dict_includes_all_fields(self, full_identity):
+        """to_header_dict should include all non-null identity fields."""
+        headers = full_identity.to_header_dict()
 
         assert headers["X-DSP-Seat-ID"] == "ttd-seat-123"
         assert headers["X-DSP-Seat-Name"] == "The Trade Desk"
@@ -105,6 +160,14 @@ class TestBuyerIdentity:
         assert context["agency_id"] == "omnicom-456"
         assert context["access_tier"] == "agency"
 
+    def test_to_context_dict_is_plain_json(self):
+        """to_context_dict values should be plain strings, not enums."""
+        identity = BuyerIdentity(seat_id="ttd-seat-123", agency_id="omnicom-456")
+        context = identity.to_context_dict()
+
+        assert type(context["access_tier"]) is str
+        assert all(type(v) in (str, type(None)) for v in context.values())
+
 
 class TestBuyerContext:
     """Tests for BuyerContext model."""
@@ -117,42 +180,28 @@ class TestBuyerContext:
         assert not context.can_negotiate()
         assert not context.can_access_premium_inventory()
 
-    def test_authenticated_context(self):
-        """Authenticated context with agency should have negotiation rights."""
-        identity = BuyerIdentity(
-            agency_id="omnicom-456",
-            agency_name="OMD",
-        )
+    @pytest.mark.parametrize(
+        "identity_fixture, tier, can_negotiate, can_access_premium",
+        [
+            ("seat_identity", AccessTier.SEAT, False, False),
+            ("agency_identity", AccessTier.AGENCY, True, True),
+            ("advertiser_identity", AccessTier.ADVERTISER, True, True),
+        ],
+        ids=["seat", "agency", "advertiser"],
+    )
+    def test_authenticated_context_access(
+        self, request, identity_fixture, tier, can_negotiate, can_access_premium
+    ):
+        """Authenticated context rights should follow the identity's tier."""
         context = BuyerContext(
-            identity=identity,
+            identity=request.getfixturevalue(identity_fixture),
             is_authenticated=True,
         )
 
-        assert context.get_access_tier() == AccessTier.AGENCY
+        assert context.get_access_tier() == tier
         assert context.is_authenticated
-        assert context.can_negotiate()
-        assert context.can_access_premium_inventory()
-
-    def test_seat_tier_cannot_negotiate(self):
-        """Seat tier should not have negotiation rights."""
-        identity = BuyerIdentity(seat_id="ttd-seat-123")
-        context = BuyerContext(identity=identity, is_authenticated=True)
-
-        assert context.get_access_tier() == AccessTier.SEAT
-        assert not context.can_negotiate()
-        assert not context.can_access_premium_inventory()
-
-    def test_advertiser_tier_has_all_access(self):
-        """Advertiser tier should have full access."""
-        identity = BuyerIdentity(
-            agency_id="omnicom-456",
-            advertiser_id="coca-cola-789",
-        )
-        context = BuyerContext(identity=identity, is_authenticated=True)
-
-        assert context.get_access_tier() == AccessTier.ADVERTISER
-        assert context.can_negotiate()
-        assert context.can_access_premium_inventory()
+        assert context.can_negotiate() is can_negotiate
+        assert context.can_access_premium_inventory() is can_access_premium
 
     def test_default_preferred_deal_types(self):
         """Default preferred deal type should be Preferred Deal."""
@@ -175,28 +224,46 @@ class TestBuyerContext:
 class TestDealType:
     """Tests for DealType enum."""
 
-    def test_deal_type_values(self):
+    @pytest.mark.parametrize(
+        "member, value",
+        [
+            (DealType.PROGRAMMATIC_GUARANTEED, "PG"),
+            (DealType.PREFERRED_DEAL, "PD"),
+            (DealType.PRIVATE_AUCTION, "PA"),
+        ],
+    )
+    def test_deal_type_values(self, member, value):
         """Deal type enum values should match spec."""
-        assert DealType.PROGRAMMATIC_GUARANTEED.value == "PG"
-        assert DealType.PREFERRED_DEAL.value == "PD"
-        assert DealType.PRIVATE_AUCTION.value == "PA"
-
-    def test_deal_type_from_string(self):
+        assert member.value == value
+
+    @pytest.mark.parametrize(
+        "value, member",
+        [
+            ("PG", DealType.PROGRAMMATIC_GUARANTEED),
+            ("PD", DealType.PREFERRED_DEAL),
+            ("PA", DealType.PRIVATE_AUCTION),
+        ],
+    )
+    def test_deal_type_from_string(self, value, member):
         """Deal types should be constructible from strings."""
-        assert DealType("PG") == DealType.PROGRAMMATIC_GUARANTEED
-        assert DealType("PD") == DealType.PREFERRED_DEAL
-        assert DealType("PA") == DealType.PRIVATE_AUCTION
+        assert DealType(value) == member
 
 
 class TestAccessTier:
     """Tests for AccessTier enum."""
 
-    def test_access_tier_values(self):
+    @pytest.mark.parametrize(
+        "member, value",
+        [
+            (AccessTier.PUBLIC, "public"),
+            (AccessTier.SEAT, "seat"),
+            (AccessTier.AGENCY, "agency"),
+            (AccessTier.ADVERTISER, "advertiser"),
+        ],
+    )
+    def test_access_tier_values(self, member, value):
         """Access tier enum values should match spec."""
-        assert AccessTier.PUBLIC.value == "public"
-        assert AccessTier.SEAT.value == "seat"
-        assert AccessTier.AGENCY.value == "agency"
-        assert AccessTier.ADVERTISER.value == "advertiser"
+        assert member.value == value
 
 
 class TestDealRequest:
@@ -231,59 +298,26 @@ class TestDealRequest:
 class TestDealResponse:
     """Tests for DealResponse model."""
 
-    def test_deal_response_creation(self):
+    def test_deal_response_creation(self, deal_response):
         """Test creating a DealResponse."""
-        response = DealResponse(
-            deal_id="DEAL-A1B2C3D4",
-            product_id="prod_123",
-            product_name="Premium CTV Package",
-            deal_type=DealType.PREFERRED_DEAL,
-            price=17.00,
-            original_price=20.00,
-            discount_applied=15.0,
-            access_tier=AccessTier.ADVERTISER,
-            impressions=5_000_000,
-            flight_start="2026-02-01",
-            flight_end="2026-02-28",
-            activation_instructions={
-                "ttd": "Enter Deal ID in TTD > Inventory > PMP",
-                "dv360": "Enter Deal ID in DV360 > Inventory > My Inventory",
-            },
-            expires_at="2026-01-25",
-        )
-
-        assert response.deal_id == "DEAL-A1B2C3D4"
-        assert response.price == 17.00
-        assert response.discount_applied == 15.0
-
-    def test_get_activation_for_platform_known(self):
+        assert deal_response.deal_id == "DEAL-A1B2C3D4"
+        assert deal_response.price == 17.00
+        assert deal_response.discount_applied == 15.0
+
+    @pytest.mark.parametrize(
+        "platform, expected",
+        [
+            ("TTD", "Enter Deal ID in TTD > Inventory > PMP"),
+            ("ttd", "Enter Deal ID in TTD > Inventory > PMP"),
+            ("DV360", "Enter Deal ID in DV360 > Inventory > My Inventory"),
+        ],
+    )
+    def test_get_activation_for_platform_known(self, deal_response, platform, expected):
         """Test getting activation instructions for known platform."""
-        response = DealResponse(
-            deal_id="DEAL-A1B2C3D4",
-            product_id="prod_123",
-            product_name="Test Product",
-            deal_type=DealType.PREFERRED_DEAL,
-            price=17.00,
-            access_tier=AccessTier.AGENCY,
-            activation_instructions={
-                "ttd": "Custom TTD instructions",
-            },
-        )
-
-        assert response.get_activation_for_platform("TTD") == "Custom TTD instructions"
-        assert response.get_activation_for_platform("ttd") == "Custom TTD instructions"
+        assert deal_response.get_activation_for_platform(platform) == expected
 
-    def test_get_activation_for_platform_unknown(self):
+    def test_get_activation_for_platform_unknown(self, deal_response):
         """Test getting activation instructions for unknown platform."""
-        response = DealResponse(
-            deal_id="DEAL-A1B2C3D4",
-            product_id="prod_123",
-            product_name="Test Product",
-            deal_type=DealType.PREFERRED_DEAL,
-            price=17.00,
-            access_tier=AccessTier.AGENCY,
-        )
-
-        instructions = response.get_activation_for_platform("NewDSP")
+        instructions = deal_response.get_activation_for_platform("NewDSP")
         assert "DEAL-A1B2C3D4" in instructions
         assert "NewDSP" in instructions
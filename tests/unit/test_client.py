@@ -3,29 +3,60 @@
 
 """Tests for OpenDirect client."""
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
 import httpx
 
 from ad_buyer.clients.opendirect_client import OpenDirectClient
 from ad_buyer.models.opendirect import Product, Order, Line, RateType, DeliveryType
 
+_BASE_PATH = "/api/v2.1"
+
+
+@pytest.fixture(scope="module")
+def seller():
+    """Canned seller responses keyed by (method, path), plus a request log."""
+    return SimpleNamespace(routes={}, requests=[])
+
+
+@pytest.fixture(scope="module")
+def shared_client(seller):
+    """Create one test client for the module, served by a mock transport."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seller.requests.append(request)
+        path = request.url.path.removeprefix(_BASE_PATH)
+        return httpx.Response(200, json=seller.routes[request.method, path])
+
+    return OpenDirectClient(
+        base_url="http://localhost:3000" + _BASE_PATH,
+        api_key="test_key",
+        transport=httpx.MockTransport(handler),
+    )
+
 
 class TestOpenDirectClient:
     """Tests for the OpenDirect HTTP client."""
 
     @pytest.fixture
-    def client(self):
-        """Create a test client."""
-        return OpenDirectClient(
-            base_url="http://localhost:3000/api/v2.1",
-            api_key="test_key",
-        )
+    def client(self, shared_client, seller):
+        """Return the shared client with no routes, requests or cached responses."""
+        seller.routes.clear()
+        seller.requests.clear()
+        shared_client.clear_cache()
+        return shared_client
 
     def test_client_initialization(self, client):
         """Test client initializes correctly."""
         assert client.base_url == "http://localhost:3000/api/v2.1"
 
+    def test_client_timeouts(self):
+        """Test connect timeout is capped while the request timeout is kept."""
+        client = OpenDirectClient(base_url="http://localhost:3000", timeout=30.0)
+        assert client._client.timeout.read == 30.0
+        assert client._client.timeout.connect == 5.0
+
     def test_client_headers_with_api_key(self):
         """Test headers are set correctly with API key."""
         client = OpenDirectClient(
@@ -45,11 +76,9 @@ class TestOpenDirectClient:
         headers = client._build_headers(None, "bearer_token")
         assert headers["Authorization"] == "Bearer bearer_token"
 
-    @pytest.mark.asyncio
-    async def test_list_products(self, client):
+    async def test_list_products(self, client, seller):
         """Test listing products."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        seller.routes["GET", "/products"] = {
             "products": [
                 {
                     "id": "prod_1",
@@ -62,22 +91,56 @@ class TestOpenDirectClient:
                 }
             ]
         }
-        mock_response.raise_for_status = MagicMock()
 
-        with patch.object(client._client, 'get', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
-            products = await client.list_products(skip=0, top=10)
+        products = await client.list_products(skip=0, top=10)
 
         assert len(products) == 1
         assert products[0].id == "prod_1"
         assert products[0].name == "Test Product"
-        mock_get.assert_called_once()
+        assert len(seller.requests) == 1
+
+    async def test_search_products_is_cached(self, client, seller):
+        """Test identical searches hit the seller once until inventory changes."""
+        seller.routes["POST", "/products/search"] = {
+            "products": [
+                {
+                    "id": "prod_1",
+                    "publisherId": "pub_1",
+                    "name": "Test Product",
+                    "currency": "USD",
+                    "basePrice": 15.00,
+                    "rateType": "CPM",
+                    "deliveryType": "Guaranteed",
+                }
+            ]
+        }
+        seller.routes["PATCH", "/accounts/acct_1/orders/order_1/lines/line_1"] = {
+            "id": "line_1",
+            "orderId": "order_1",
+            "productId": "prod_1",
+            "name": "Line",
+            "startDate": "2025-02-01T00:00:00Z",
+            "endDate": "2025-02-28T23:59:59Z",
+            "rateType": "CPM",
+            "rate": 15.00,
+            "quantity": 1000,
+            "bookingStatus": "Booked",
+        }
+
+        first = await client.search_products({"channel": "ctv", "targeting": ["geo"]})
+        second = await client.search_products({"targeting": ["geo"], "channel": "ctv"})
+        await client.search_products({"channel": "ctv"}, use_cache=False)
+
+        assert first == second
+        assert len(seller.requests) == 2
+
+        await client.book_line("acct_1", "order_1", "line_1")
+
+        assert not client._response_cache
 
-    @pytest.mark.asyncio
-    async def test_get_product(self, client):
+    async def test_get_product(self, client, seller):
         """Test getting a single product."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        seller.routes["GET", "/products/prod_123"] = {
             "id": "prod_123",
             "publisherId": "pub_abc",
             "name": "Homepage Banner",
@@ -86,23 +149,18 @@ class TestOpenDirectClient:
             "rateType": "CPM",
             "deliveryType": "PMP",
         }
-        mock_response.raise_for_status = MagicMock()
 
-        with patch.object(client._client, 'get', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_response
-            product = await client.get_product("prod_123")
+        product = await client.get_product("prod_123")
 
         assert product.id == "prod_123"
         assert product.base_price == 20.00
         assert product.delivery_type == DeliveryType.PMP
 
-    @pytest.mark.asyncio
-    async def test_create_order(self, client):
+    async def test_create_order(self, client, seller):
         """Test creating an order."""
         from datetime import datetime
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        seller.routes["POST", "/accounts/acct_123/orders"] = {
             "id": "order_new",
             "name": "Test Order",
             "accountId": "acct_123",
@@ -112,9 +170,8 @@ class TestOpenDirectClient:
             "endDate": "2025-02-28T23:59:59Z",
             "orderStatus": "PENDING",
         }
-        mock_response.raise_for_status = MagicMock()
 
-        order = Order(
+        order = Order.model_construct(
             name="Test Order",
             account_id="acct_123",
             budget=25000,
@@ -123,18 +180,14 @@ class TestOpenDirectClient:
             end_date=datetime(2025, 2, 28),
         )
 
-        with patch.object(client._client, 'post', new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = mock_response
-            result = await client.create_order("acct_123", order)
+        result = await client.create_order("acct_123", order)
 
         assert result.id == "order_new"
         assert result.name == "Test Order"
 
-    @pytest.mark.asyncio
-    async def test_book_line(self, client):
+    async def test_book_line(self, client, seller):
         """Test booking a line."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        seller.routes["PATCH", "/accounts/acct_123/orders/order_456/lines/line_123"] = {
             "id": "line_123",
             "orderId": "order_456",
             "productId": "prod_789",
@@ -146,16 +199,13 @@ class TestOpenDirectClient:
             "quantity": 500000,
             "bookingStatus": "Booked",
         }
-        mock_response.raise_for_status = MagicMock()
 
-        with patch.object(client._client, 'patch', new_callable=AsyncMock) as mock_patch:
-            mock_patch.return_value = mock_response
-            result = await client.book_line("acct_123", "order_456", "line_123")
+        result = await client.book_line("acct_123", "order_456", "line_123")
 
         assert result.id == "line_123"
         assert result.booking_status.value == "Booked"
+        assert seller.requests[0].url.params["action"] == "book"
 
-    @pytest.mark.asyncio
     async def test_client_context_manager(self):
         """Test client as async context manager."""
         async with OpenDirectClient(base_url="http://localhost:3000") as client:
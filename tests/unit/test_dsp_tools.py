@@ -3,22 +3,47 @@
 
 """Tests for DSP tools."""
 
+import asyncio
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from ad_buyer.clients.unified_client import UnifiedResult
 from ad_buyer.models.buyer_identity import (
     AccessTier,
     BuyerContext,
     BuyerIdentity,
+    DealResponse,
     DealType,
 )
-from ad_buyer.tools.dsp import DiscoverInventoryTool, GetPricingTool, RequestDealTool
-
-
-@pytest.fixture
-def mock_client():
-    """Create a mock UnifiedClient."""
+from ad_buyer.tools.dsp import (
+    DealRequestError,
+    DiscoverInventoryTool,
+    GetPricingTool,
+    RequestDealTool,
+)
+from ad_buyer.tools.dsp.products import normalize_product
+
+# Buyer context fixture, final CPM on a $20 base and tier discount percentage
+TIER_PRICING = [
+    ("public_context", "$20.00", "0.0"),
+    ("agency_context", "$18.00", "10.0"),
+    ("advertiser_context", "$17.00", "15.0"),
+]
+
+CTV_PRODUCT_DATA = {
+    "id": "ctv_premium_001",
+    "name": "Premium CTV Package",
+    "basePrice": 22.00,
+    "publisherId": "streaming_pub",
+    "channel": "ctv",
+}
+
+
+@pytest.fixture(scope="module")
+def shared_mock_client():
+    """Create a mock UnifiedClient once for the module."""
     client = MagicMock()
     client.search_products = AsyncMock()
     client.list_products = AsyncMock()
@@ -27,52 +52,72 @@ def mock_client():
 
 
 @pytest.fixture
+def mock_client(shared_mock_client):
+    """Return the shared mock UnifiedClient with calls and responses cleared."""
+    shared_mock_client.reset_mock(return_value=True, side_effect=True)
+    return shared_mock_client
+
+
+@pytest.fixture(scope="module")
 def public_context():
-    """Create a public tier buyer context."""
+    """Create a public tier buyer context, shared read-only across the module."""
     return BuyerContext()
 
 
-@pytest.fixture
+# The tools only read these contexts and the identity models have their own
+# tests, so the tiered contexts are built without validation
+@pytest.fixture(scope="module")
 def agency_context():
-    """Create an agency tier buyer context."""
-    identity = BuyerIdentity(
+    """Create an agency tier buyer context, shared read-only across the module."""
+    identity = BuyerIdentity.model_construct(
         seat_id="ttd-seat-123",
         agency_id="omnicom-456",
         agency_name="OMD",
     )
-    return BuyerContext(identity=identity, is_authenticated=True)
+    return BuyerContext.model_construct(identity=identity, is_authenticated=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def advertiser_context():
-    """Create an advertiser tier buyer context."""
-    identity = BuyerIdentity(
+    """Create an advertiser tier buyer context, shared read-only across the module."""
+    identity = BuyerIdentity.model_construct(
         seat_id="ttd-seat-123",
         agency_id="omnicom-456",
         agency_name="OMD",
         advertiser_id="coca-cola-789",
         advertiser_name="Coca-Cola",
     )
-    return BuyerContext(identity=identity, is_authenticated=True)
+    return BuyerContext.model_construct(identity=identity, is_authenticated=True)
 
 
-class TestDiscoverInventoryTool:
-    """Tests for DiscoverInventoryTool."""
+class TestToolCreation:
+    """Tests for the name and description every DSP tool exposes."""
 
-    def test_tool_creation(self, mock_client, agency_context):
+    @pytest.mark.parametrize(
+        ("tool_cls", "name", "description"),
+        [
+            (DiscoverInventoryTool, "discover_inventory", "inventory"),
+            (GetPricingTool, "get_pricing", "pricing"),
+            (RequestDealTool, "request_deal", "deal"),
+        ],
+    )
+    def test_tool_creation(self, mock_client, agency_context, tool_cls, name, description):
         """Test creating the tool."""
-        tool = DiscoverInventoryTool(
+        tool = tool_cls(
             client=mock_client,
             buyer_context=agency_context,
         )
 
-        assert tool.name == "discover_inventory"
-        assert "inventory" in tool.description.lower()
+        assert tool.name == name
+        assert description in tool.description.lower()
+
+
+class TestDiscoverInventoryTool:
+    """Tests for DiscoverInventoryTool."""
 
-    @pytest.mark.asyncio
     async def test_discover_with_query(self, mock_client, agency_context):
         """Test discovery with query."""
-        mock_client.search_products.return_value = MagicMock(
+        mock_client.search_products.return_value = UnifiedResult(
             success=True,
             data=[
                 {
@@ -95,10 +140,9 @@ class TestDiscoverInventoryTool:
         assert "CTV Premium" in result
         assert "AGENCY" in result.upper() or "10" in result
 
-    @pytest.mark.asyncio
     async def test_discover_without_query(self, mock_client, public_context):
         """Test discovery without query lists all products."""
-        mock_client.list_products.return_value = MagicMock(
+        mock_client.list_products.return_value = UnifiedResult(
             success=True,
             data=[
                 {"id": "prod_1", "name": "Product 1", "basePrice": 20.00},
@@ -116,10 +160,86 @@ class TestDiscoverInventoryTool:
         assert "Product 1" in result
         assert "Product 2" in result
 
-    @pytest.mark.asyncio
+    async def test_discover_large_catalog(self, mock_client, public_context):
+        """Test large result sets are formatted off the event loop."""
+        mock_client.list_products.return_value = UnifiedResult(
+            success=True,
+            data=[
+                {"id": f"prod_{i}", "name": f"Product {i}", "basePrice": 20.00}
+                for i in range(500)
+            ],
+        )
+
+        tool = DiscoverInventoryTool(
+            client=mock_client,
+            buyer_context=public_context,
+        )
+
+        with patch(
+            "ad_buyer.tools.dsp.discover_inventory.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as to_thread:
+            result = await tool._arun()
+
+        to_thread.assert_called_once()
+        assert "500. Product 499" in result
+
+    def test_format_results_accepts_iterables(self, mock_client, public_context):
+        """Test formatting consumes any iterable of products."""
+        tool = DiscoverInventoryTool(
+            client=mock_client,
+            buyer_context=public_context,
+        )
+        context = public_context.identity.to_context_dict()
+
+        result = tool._format_results(
+            ({"id": f"prod_{i}", "name": f"Product {i}", "basePrice": 20.00} for i in range(3)),
+            context,
+        )
+        empty = tool._format_results(iter(()), context)
+
+        assert "3. Product 2" in result
+        assert "Total products found: 3" in result
+        assert empty == "No inventory found matching your criteria."
+
+    async def test_discover_filters_sent_to_seller(self, mock_client, public_context):
+        """Test filters without a query are pushed to the seller."""
+        mock_client.list_products.return_value = UnifiedResult(
+            success=True,
+            data=[{"id": "prod_1", "name": "CTV Product", "basePrice": 20.00}],
+        )
+
+        tool = DiscoverInventoryTool(
+            client=mock_client,
+            buyer_context=public_context,
+        )
+
+        await tool._arun(channel="ctv", max_cpm=25.0)
+
+        filters = mock_client.list_products.call_args.kwargs["filters"]
+        assert filters["channel"] == "ctv"
+        assert filters["maxPrice"] == 25.0
+        assert filters["buyer_context"]["access_tier"] == "public"
+
+    async def test_sync_run_inside_event_loop(self, mock_client, public_context):
+        """Test the sync wrapper works even when called from a running loop."""
+        mock_client.list_products.return_value = UnifiedResult(
+            success=True,
+            data=[{"id": "prod_1", "name": "Product 1", "basePrice": 20.00}],
+        )
+
+        tool = DiscoverInventoryTool(
+            client=mock_client,
+            buyer_context=public_context,
+        )
+
+        result = tool._run()
+
+        assert "Product 1" in result
+
     async def test_discover_shows_tier_discount(self, mock_client, advertiser_context):
         """Test that discovery shows tier-specific discount."""
-        mock_client.search_products.return_value = MagicMock(
+        mock_client.search_products.return_value = UnifiedResult(
             success=True,
             data=[{"id": "prod_1", "name": "Test", "basePrice": 20.00}],
         )
@@ -134,10 +254,9 @@ class TestDiscoverInventoryTool:
         # Should show 15% discount for advertiser tier
         assert "15%" in result or "ADVERTISER" in result.upper()
 
-    @pytest.mark.asyncio
     async def test_discover_error_handling(self, mock_client, agency_context):
         """Test error handling in discovery."""
-        mock_client.search_products.return_value = MagicMock(
+        mock_client.search_products.return_value = UnifiedResult(
             success=False,
             error="Connection failed",
         )
@@ -155,20 +274,12 @@ class TestDiscoverInventoryTool:
 class TestGetPricingTool:
     """Tests for GetPricingTool."""
 
-    def test_tool_creation(self, mock_client, agency_context):
-        """Test creating the tool."""
-        tool = GetPricingTool(
-            client=mock_client,
-            buyer_context=agency_context,
-        )
-
-        assert tool.name == "get_pricing"
-        assert "pricing" in tool.description.lower()
-
-    @pytest.mark.asyncio
-    async def test_get_pricing_calculates_tier_discount(self, mock_client, agency_context):
-        """Test that pricing calculates tier discount correctly."""
-        mock_client.get_product.return_value = MagicMock(
+    @pytest.mark.parametrize("context_fixture, final_price, discount", TIER_PRICING)
+    async def test_get_pricing_calculates_tier_discount(
+        self, request, mock_client, context_fixture, final_price, discount
+    ):
+        """Test that pricing applies each tier's discount to the base price."""
+        mock_client.get_product.return_value = UnifiedResult(
             success=True,
             data={
                 "id": "prod_1",
@@ -180,19 +291,17 @@ class TestGetPricingTool:
 
         tool = GetPricingTool(
             client=mock_client,
-            buyer_context=agency_context,
+            buyer_context=request.getfixturevalue(context_fixture),
         )
 
         result = await tool._arun(product_id="prod_1")
 
-        # Agency tier gets 10% discount: $20 * 0.90 = $18
-        assert "$18.00" in result
-        assert "10" in result
+        assert f"Tier Discount: {discount}%" in result
+        assert f"Final CPM: {final_price}" in result
 
-    @pytest.mark.asyncio
     async def test_get_pricing_volume_discount(self, mock_client, advertiser_context):
         """Test volume discount for high-volume requests."""
-        mock_client.get_product.return_value = MagicMock(
+        mock_client.get_product.return_value = UnifiedResult(
             success=True,
             data={
                 "id": "prod_1",
@@ -213,10 +322,31 @@ class TestGetPricingTool:
         # Base: $20, after tier: $17, after volume: $15.30
         assert "Volume Discount" in result or "volume" in result.lower()
 
-    @pytest.mark.asyncio
+    async def test_get_pricing_multiple_products(self, mock_client, agency_context):
+        """Test pricing several products fetches them concurrently in one call."""
+        products = {
+            "prod_1": {"id": "prod_1", "name": "Product One", "basePrice": 20.00},
+            "prod_2": {"id": "prod_2", "name": "Product Two", "basePrice": 30.00},
+        }
+        mock_client.get_product.side_effect = lambda pid: UnifiedResult(
+            success=True, data=products.get(pid)
+        )
+
+        tool = GetPricingTool(
+            client=mock_client,
+            buyer_context=agency_context,
+        )
+
+        result = await tool._arun(product_ids=["prod_1", "prod_2", "missing"])
+
+        assert mock_client.get_product.await_count == 3
+        assert "$18.00" in result
+        assert "$27.00" in result
+        assert "Product missing not found." in result
+
     async def test_get_pricing_shows_deal_types(self, mock_client, agency_context):
         """Test that pricing shows available deal types."""
-        mock_client.get_product.return_value = MagicMock(
+        mock_client.get_product.return_value = UnifiedResult(
             success=True,
             data={"id": "prod_1", "name": "Test", "basePrice": 20.00},
         )
@@ -232,10 +362,9 @@ class TestGetPricingTool:
         assert "PD" in result or "Preferred Deal" in result
         assert "PA" in result or "Private Auction" in result
 
-    @pytest.mark.asyncio
     async def test_get_pricing_product_not_found(self, mock_client, agency_context):
         """Test handling of product not found."""
-        mock_client.get_product.return_value = MagicMock(
+        mock_client.get_product.return_value = UnifiedResult(
             success=False,
             error="Product not found",
         )
@@ -253,20 +382,24 @@ class TestGetPricingTool:
 class TestRequestDealTool:
     """Tests for RequestDealTool."""
 
-    def test_tool_creation(self, mock_client, agency_context):
-        """Test creating the tool."""
+    def test_deal_id_is_reproducible(self, mock_client, agency_context):
+        """Deal IDs should be stable for the same product, buyer and minute."""
         tool = RequestDealTool(
             client=mock_client,
             buyer_context=agency_context,
         )
+        now = datetime(2025, 1, 1, 12, 0)
 
-        assert tool.name == "request_deal"
-        assert "Deal ID" in tool.description or "deal" in tool.description.lower()
+        deal_id = tool._generate_deal_id("prod_1", AccessTier.AGENCY, now)
+
+        assert deal_id == tool._generate_deal_id("prod_1", AccessTier.AGENCY, now)
+        assert deal_id != tool._generate_deal_id("prod_2", AccessTier.AGENCY, now)
+        assert deal_id.startswith("DEAL-")
+        assert len(deal_id) == len("DEAL-") + 8
 
-    @pytest.mark.asyncio
     async def test_request_deal_creates_deal_id(self, mock_client, agency_context):
         """Test that deal request creates a Deal ID."""
-        mock_client.get_product.return_value = MagicMock(
+        mock_client.get_product.return_value = UnifiedResult(
             success=True,
             data={
                 "id": "prod_1",
@@ -289,10 +422,9 @@ class TestRequestDealTool:
         assert "DEAL-" in result
         assert "Test Product" in result
 
-    @pytest.mark.asyncio
     async def test_request_deal_includes_activation_instructions(self, mock_client, agency_context):
         """Test that deal includes DSP activation instructions."""
-        mock_client.get_product.return_value = MagicMock(
+        mock_client.get_product.return_value = UnifiedResult(
             success=True,
             data={"id": "prod_1", "name": "Test", "basePrice": 20.00},
         )
@@ -309,10 +441,34 @@ class TestRequestDealTool:
         assert "DV360" in result or "Display & Video" in result
         assert "Amazon" in result
 
-    @pytest.mark.asyncio
+    def test_deal_output_uses_stored_activation_instructions(
+        self, mock_client, agency_context
+    ):
+        """Test the rendered instructions match those stored on the deal."""
+        deal = DealResponse(
+            deal_id="DEAL-A1B2C3D4",
+            product_id="prod_1",
+            product_name="Test",
+            deal_type=DealType.PREFERRED_DEAL,
+            price=18.00,
+            original_price=20.00,
+            discount_applied=10.0,
+            access_tier=AccessTier.AGENCY,
+            flight_start="2026-02-01",
+            flight_end="2026-02-28",
+            activation_instructions={"ttd": "CUSTOM SELLER PATH"},
+            expires_at="2026-01-25",
+        )
+        tool = RequestDealTool(client=mock_client, buyer_context=agency_context)
+
+        result = tool._format_deal_response(deal)
+
+        assert "• TTD: CUSTOM SELLER PATH" in result
+        assert "YAHOO" not in result
+
     async def test_request_deal_pg_requires_impressions(self, mock_client, agency_context):
         """Test that PG deals require impressions."""
-        mock_client.get_product.return_value = MagicMock(
+        mock_client.get_product.return_value = UnifiedResult(
             success=True,
             data={"id": "prod_1", "name": "Test", "basePrice": 20.00},
         )
@@ -330,10 +486,9 @@ class TestRequestDealTool:
 
         assert "require" in result.lower() or "impressions" in result.lower()
 
-    @pytest.mark.asyncio
     async def test_request_deal_negotiation_requires_tier(self, mock_client, public_context):
         """Test that price negotiation requires agency/advertiser tier."""
-        mock_client.get_product.return_value = MagicMock(
+        mock_client.get_product.return_value = UnifiedResult(
             success=True,
             data={"id": "prod_1", "name": "Test", "basePrice": 20.00},
         )
@@ -351,26 +506,56 @@ class TestRequestDealTool:
         # Should indicate negotiation not available at public tier
         assert "tier" in result.lower() or "negotiation" in result.lower()
 
-    @pytest.mark.asyncio
-    async def test_request_deal_applies_tier_discount(self, mock_client, advertiser_context):
-        """Test that deal price includes tier discount."""
-        mock_client.get_product.return_value = MagicMock(
+    @pytest.mark.parametrize("context_fixture, final_price, discount", TIER_PRICING)
+    async def test_request_deal_applies_tier_discount(
+        self, request, mock_client, context_fixture, final_price, discount
+    ):
+        """Test that deal price includes the tier discount."""
+        mock_client.get_product.return_value = UnifiedResult(
             success=True,
             data={"id": "prod_1", "name": "Test", "basePrice": 20.00},
         )
 
         tool = RequestDealTool(
             client=mock_client,
-            buyer_context=advertiser_context,
+            buyer_context=request.getfixturevalue(context_fixture),
         )
 
         result = await tool._arun(product_id="prod_1")
 
-        # Advertiser gets 15% discount: $20 * 0.85 = $17
-        assert "$17.00" in result
-        assert "15" in result
+        assert f"({discount}% discount)" in result
+        assert f"Final CPM: {final_price}" in result
+
+    async def test_request_deal_returns_structured_response(
+        self, mock_client, advertiser_context
+    ):
+        """Test programmatic callers get the deal fields without parsing text."""
+        mock_client.get_product.return_value = UnifiedResult(
+            success=True,
+            data={"id": "prod_1", "name": "Test", "basePrice": 20.00},
+        )
+
+        tool = RequestDealTool(
+            client=mock_client,
+            buyer_context=advertiser_context,
+        )
+
+        deal = await tool.request_deal(product_id="prod_1")
+
+        assert deal.deal_id.startswith("DEAL-")
+        assert deal.price == pytest.approx(17.0)
+        assert deal.access_tier == AccessTier.ADVERTISER
+
+    async def test_request_deal_raises_on_rejected_request(self, mock_client, agency_context):
+        """Test rejected requests raise instead of returning error text."""
+        tool = RequestDealTool(
+            client=mock_client,
+            buyer_context=agency_context,
+        )
+
+        with pytest.raises(DealRequestError, match="Invalid deal type"):
+            await tool.request_deal(product_id="prod_1", deal_type="INVALID")
 
-    @pytest.mark.asyncio
     async def test_request_deal_invalid_type(self, mock_client, agency_context):
         """Test handling of invalid deal type."""
         tool = RequestDealTool(
@@ -389,27 +574,17 @@ class TestRequestDealTool:
 class TestToolIntegration:
     """Integration tests for DSP tools working together."""
 
-    @pytest.mark.asyncio
     async def test_discover_then_price_then_deal(
         self, mock_client, advertiser_context
     ):
         """Test typical workflow: discover -> get pricing -> request deal."""
-        # Mock product data
-        product_data = {
-            "id": "ctv_premium_001",
-            "name": "Premium CTV Package",
-            "basePrice": 22.00,
-            "publisherId": "streaming_pub",
-            "channel": "ctv",
-        }
-
-        mock_client.search_products.return_value = MagicMock(
+        mock_client.search_products.return_value = UnifiedResult(
             success=True,
-            data=[product_data],
+            data=[CTV_PRODUCT_DATA],
         )
-        mock_client.get_product.return_value = MagicMock(
+        mock_client.get_product.return_value = UnifiedResult(
             success=True,
-            data=product_data,
+            data=CTV_PRODUCT_DATA,
         )
 
         # Step 1: Discover inventory
@@ -448,3 +623,23 @@ class TestToolIntegration:
 
         assert "DEAL-" in deal_result
         assert "5,000,000" in deal_result
+
+
+class TestNormalizeProduct:
+    """Tests for seller product normalization."""
+
+    def test_first_present_key_wins(self):
+        """Primary seller keys should take precedence over fallbacks."""
+        product = normalize_product(
+            {"id": "prod_1", "basePrice": 20.0, "price": 99.0, "publisher": "pub_1"}
+        )
+
+        assert product == {"id": "prod_1", "base_price": 20.0, "publisher": "pub_1"}
+
+    def test_fallback_keys(self):
+        """Fallback seller keys should map to the same canonical fields."""
+        product = normalize_product(
+            {"deliveryType": "ctv", "available_impressions": 1000, "availableTargeting": ["geo"]}
+        )
+
+        assert product == {"channel": "ctv", "impressions": 1000, "targeting": ["geo"]}
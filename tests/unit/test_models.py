@@ -26,6 +26,10 @@ from ad_buyer.models.flow_state import (
     ExecutionStatus,
     ProductRecommendation,
 )
+from ad_buyer.models.ucp import CoverageEstimate
+
+FLIGHT_START = datetime(2025, 2, 1)
+FLIGHT_END = datetime(2025, 2, 28)
 
 
 class TestOpenDirectModels:
@@ -75,8 +79,8 @@ class TestOpenDirectModels:
             account_id="acct_456",
             budget=50000,
             currency="USD",
-            start_date=datetime(2025, 2, 1),
-            end_date=datetime(2025, 2, 28),
+            start_date=FLIGHT_START,
+            end_date=FLIGHT_END,
         )
 
         assert order.id == "order_123"
@@ -90,8 +94,8 @@ class TestOpenDirectModels:
             order_id="order_456",
             product_id="prod_789",
             name="Homepage Line",
-            start_date=datetime(2025, 2, 1),
-            end_date=datetime(2025, 2, 28),
+            start_date=FLIGHT_START,
+            end_date=FLIGHT_END,
             rate_type=RateType.CPM,
             rate=15.00,
             quantity=500000,
@@ -118,8 +122,8 @@ class TestOpenDirectModels:
         """Test creating an AvailsRequest."""
         request = AvailsRequest(
             product_id="prod_123",
-            start_date=datetime(2025, 2, 1),
-            end_date=datetime(2025, 2, 28),
+            start_date=FLIGHT_START,
+            end_date=FLIGHT_END,
             requested_impressions=1000000,
             budget=15000,
         )
@@ -204,3 +208,21 @@ class TestFlowStateModels:
         assert ExecutionStatus.INITIALIZED.value == "initialized"
         assert ExecutionStatus.AWAITING_APPROVAL.value == "awaiting_approval"
         assert ExecutionStatus.COMPLETED.value == "completed"
+
+
+class TestUCPModels:
+    """Tests for UCP models."""
+
+    def test_coverage_estimate_tenths(self):
+        """Coverage tenths should round the percentage to one decimal."""
+        estimate = CoverageEstimate(targeting_key="ctv_ab12", coverage_percentage=42.36)
+
+        assert estimate.coverage_tenths == 424
+        assert "coverage_tenths" not in estimate.model_dump()
+
+    def test_coverage_tenths_match_one_decimal_format(self):
+        """Tenths should round like ':.1f' on the stored float, not on x * 10."""
+        estimate = CoverageEstimate(targeting_key="ctv_ab12", coverage_percentage=22.95)
+
+        assert f"{estimate.coverage_percentage:.1f}" == "22.9"
+        assert estimate.coverage_tenths == 229
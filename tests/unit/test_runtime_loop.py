@@ -0,0 +1,36 @@
+# Author: Green Mountain Systems AI Inc.
+# Donated to IAB Tech Lab
+
+"""Tests for the shared background event loop."""
+
+import asyncio
+
+from ad_buyer.runtime import get_loop, run_sync
+
+
+async def _current_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+class TestRunSync:
+    """Tests for run_sync."""
+
+    def test_returns_coroutine_result(self):
+        """run_sync should return the awaited value."""
+
+        async def add(a: int, b: int) -> int:
+            return a + b
+
+        assert run_sync(add(2, 3)) == 5
+
+    def test_reuses_one_loop(self):
+        """Every call should run on the same persistent loop."""
+        first = run_sync(_current_loop())
+        second = run_sync(_current_loop())
+
+        assert first is second is get_loop()
+        assert first.is_running()
+
+    async def test_callable_from_running_loop(self):
+        """run_sync should not fail when a loop is already running."""
+        assert run_sync(_current_loop()) is get_loop()
@@ -3,6 +3,9 @@
 
 """Tests for CrewAI tools."""
 
+import asyncio
+from datetime import datetime
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -13,9 +16,83 @@ from ad_buyer.tools.execution.line_management import (
     CreateLineTool,
     BookLineTool,
     CreateLineInput,
+    CreateLinesBulkTool,
+    ReserveAndBookLineTool,
 )
 from ad_buyer.tools.reporting.stats_retrieval import GetStatsTool
-from ad_buyer.models.opendirect import Product, RateType, DeliveryType, AvailsResponse
+from ad_buyer.models.opendirect import (
+    AvailsResponse,
+    DeliveryType,
+    Line,
+    LineBookingStatus,
+    LineStats,
+    Product,
+    RateType,
+)
+
+
+def returns(client, method, value):
+    """Make ``client.method`` a coroutine function that returns ``value``."""
+
+    async def _method(*args, **kwargs):
+        return value
+
+    setattr(client, method, _method)
+
+
+# The tools only read products, so tests share these validated instances
+BANNER_PRODUCT = Product(
+    id="prod_1",
+    publisher_id="pub_1",
+    name="Banner Ad",
+    currency="USD",
+    base_price=15.00,
+    rate_type=RateType.CPM,
+    delivery_type=DeliveryType.GUARANTEED,
+    available_impressions=1000000,
+)
+CHEAP_PRODUCT = Product(
+    id="prod_1",
+    publisher_id="pub_1",
+    name="Cheap Ad",
+    currency="USD",
+    base_price=10.00,
+    rate_type=RateType.CPM,
+    delivery_type=DeliveryType.GUARANTEED,
+)
+EXPENSIVE_PRODUCT = Product(
+    id="prod_2",
+    publisher_id="pub_2",
+    name="Expensive Ad",
+    currency="USD",
+    base_price=100.00,
+    rate_type=RateType.CPM,
+    delivery_type=DeliveryType.GUARANTEED,
+)
+
+
+class TestToolInitialization:
+    """Tests for the name and description every OpenDirect tool exposes."""
+
+    @pytest.mark.parametrize(
+        ("tool_cls", "name", "description"),
+        [
+            (ProductSearchTool, "search_advertising_products", "Search for advertising products"),
+            (AvailsCheckTool, "check_inventory_availability", "Check real-time availability"),
+            (GetStatsTool, "get_line_statistics", "Retrieve performance statistics"),
+            (CreateOrderTool, "create_advertising_order", "Create a new advertising order"),
+            (CreateLineTool, "create_line_item", "Create a line item"),
+            (BookLineTool, "book_line_item", "Confirm booking"),
+            (CreateLinesBulkTool, "create_line_items_bulk", "Create several line items"),
+            (ReserveAndBookLineTool, "reserve_and_book_line_items", "Reserve inventory"),
+        ],
+    )
+    def test_tool_initialization(self, tool_cls, name, description):
+        """Test tool initializes correctly."""
+        tool = tool_cls(MagicMock())
+
+        assert tool.name == name
+        assert description in tool.description
 
 
 class TestProductSearchTool:
@@ -32,11 +109,6 @@ class TestProductSearchTool:
         """Create the tool with mock client."""
         return ProductSearchTool(mock_client)
 
-    def test_tool_initialization(self, tool):
-        """Test tool initializes correctly."""
-        assert tool.name == "search_advertising_products"
-        assert "Search for advertising products" in tool.description
-
     def test_input_schema(self):
         """Test input schema validation."""
         input_data = ProductSearchInput(
@@ -49,23 +121,9 @@ class TestProductSearchTool:
         assert input_data.channel == "display"
         assert input_data.limit == 5
 
-    @pytest.mark.asyncio
     async def test_search_with_results(self, tool, mock_client):
         """Test search returns formatted results."""
-        mock_products = [
-            Product(
-                id="prod_1",
-                publisher_id="pub_1",
-                name="Banner Ad",
-                currency="USD",
-                base_price=15.00,
-                rate_type=RateType.CPM,
-                delivery_type=DeliveryType.GUARANTEED,
-                available_impressions=1000000,
-            ),
-        ]
-
-        mock_client.search_products = AsyncMock(return_value=mock_products)
+        returns(mock_client, "search_products", [BANNER_PRODUCT])
 
         result = await tool._arun(channel="display", limit=10)
 
@@ -73,45 +131,54 @@ class TestProductSearchTool:
         assert "Banner Ad" in result
         assert "$15.00" in result
 
-    @pytest.mark.asyncio
+    async def test_sync_run_inside_event_loop(self, tool, mock_client):
+        """Test the sync wrapper works even when called from a running loop."""
+        returns(mock_client, "search_products", [])
+
+        result = tool._run(channel="ctv")
+
+        assert "No products found" in result
+
     async def test_search_no_results(self, tool, mock_client):
         """Test search with no matching products."""
-        mock_client.search_products = AsyncMock(return_value=[])
+        returns(mock_client, "search_products", [])
 
         result = await tool._arun(channel="ctv", max_price=5.0)
 
         assert "No products found" in result
 
-    @pytest.mark.asyncio
     async def test_search_price_filter(self, tool, mock_client):
         """Test price filtering works correctly."""
+        returns(mock_client, "list_products", [CHEAP_PRODUCT, EXPENSIVE_PRODUCT])
+
+        result = await tool._arun(max_price=50.0)
+
+        assert "Cheap Ad" in result
+        assert "Expensive Ad" not in result
+
+    async def test_search_limit_applies_after_price_filter(self, tool, mock_client):
+        """Test the limit counts only products within the price range."""
         mock_products = [
             Product(
-                id="prod_1",
+                id=f"prod_{i}",
                 publisher_id="pub_1",
-                name="Cheap Ad",
+                name=f"Ad {i}",
                 currency="USD",
-                base_price=10.00,
+                base_price=price,
                 rate_type=RateType.CPM,
                 delivery_type=DeliveryType.GUARANTEED,
-            ),
-            Product(
-                id="prod_2",
-                publisher_id="pub_2",
-                name="Expensive Ad",
-                currency="USD",
-                base_price=100.00,
-                rate_type=RateType.CPM,
-                delivery_type=DeliveryType.GUARANTEED,
-            ),
+            )
+            for i, price in enumerate([5.0, 20.0, 80.0, 25.0, 30.0])
         ]
 
-        mock_client.list_products = AsyncMock(return_value=mock_products)
+        returns(mock_client, "search_products", mock_products)
 
-        result = await tool._arun(max_price=50.0)
+        result = await tool._arun(channel="display", min_price=10.0, max_price=50.0, limit=2)
 
-        assert "Cheap Ad" in result
-        assert "Expensive Ad" not in result
+        assert "Found 2 matching products" in result
+        assert "Ad 1" in result
+        assert "Ad 3" in result
+        assert "Ad 4" not in result
 
 
 class TestAvailsCheckTool:
@@ -127,11 +194,6 @@ class TestAvailsCheckTool:
         """Create the tool with mock client."""
         return AvailsCheckTool(mock_client)
 
-    def test_tool_initialization(self, tool):
-        """Test tool initializes correctly."""
-        assert tool.name == "check_inventory_availability"
-
-    @pytest.mark.asyncio
     async def test_check_avails(self, tool, mock_client):
         """Test availability check returns formatted results."""
         mock_response = AvailsResponse(
@@ -144,7 +206,7 @@ class TestAvailsCheckTool:
             available_targeting=["geo", "demographic"],
         )
 
-        mock_client.check_avails = AsyncMock(return_value=mock_response)
+        returns(mock_client, "check_avails", mock_response)
 
         result = await tool._arun(
             product_id="prod_123",
@@ -158,7 +220,6 @@ class TestAvailsCheckTool:
         assert "$18.50" in result
         assert "Good to book" in result
 
-    @pytest.mark.asyncio
     async def test_check_avails_low_confidence(self, tool, mock_client):
         """Test availability check with low delivery confidence."""
         mock_response = AvailsResponse(
@@ -169,7 +230,7 @@ class TestAvailsCheckTool:
             delivery_confidence=60.0,
         )
 
-        mock_client.check_avails = AsyncMock(return_value=mock_response)
+        returns(mock_client, "check_avails", mock_response)
 
         result = await tool._arun(
             product_id="prod_123",
@@ -180,8 +241,8 @@ class TestAvailsCheckTool:
         assert "Consider alternatives" in result
 
 
-class TestCreateOrderTool:
-    """Tests for the CreateOrderTool."""
+class TestGetStatsTool:
+    """Tests for the GetStatsTool."""
 
     @pytest.fixture
     def mock_client(self):
@@ -191,11 +252,70 @@ class TestCreateOrderTool:
     @pytest.fixture
     def tool(self, mock_client):
         """Create the tool with mock client."""
-        return CreateOrderTool(mock_client)
+        return GetStatsTool(mock_client)
+
+    @pytest.mark.parametrize(
+        ("delivery_rate", "budget_utilization", "health"),
+        [
+            (30.0, 50.0, "Under-delivering"),
+            (50.0, 50.0, "On track"),
+            (70.0, 50.0, "Over-delivering"),
+            (0.0, 0.0, "On track"),
+            (5.0, 0.0, "Over-delivering"),
+        ],
+    )
+    async def test_pacing_health(
+        self, tool, mock_client, delivery_rate, budget_utilization, health
+    ):
+        """Test pacing health compares delivery against budget utilization."""
+        returns(
+            mock_client,
+            "get_line_stats",
+            LineStats(
+                line_id="line_1",
+                delivery_rate=delivery_rate,
+                budget_utilization=budget_utilization,
+            ),
+        )
 
-    def test_tool_initialization(self, tool):
-        """Test tool initializes correctly."""
-        assert tool.name == "create_advertising_order"
+        result = await tool._arun(account_id="acc_1", order_id="ord_1", line_id="line_1")
+
+        assert f"Pacing Health: {health}" in result
+
+
+class TestCreateLineTool:
+    """Tests for the CreateLineTool."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock OpenDirect client."""
+        return MagicMock()
+
+    @pytest.fixture
+    def tool(self, mock_client):
+        """Create the tool with mock client."""
+        return CreateLineTool(mock_client)
+
+    async def test_invalid_rate_type(self, tool, mock_client):
+        """Test an unknown rate type is rejected before calling the seller."""
+        mock_client.create_line = AsyncMock()
+
+        result = await tool._arun(
+            account_id="acc_1",
+            order_id="ord_1",
+            product_id="prod_1",
+            line_name="Line A",
+            start_date="2025-01-01",
+            end_date="2025-01-31",
+            rate_type="CPX",
+            rate=10.0,
+            quantity=1_000,
+        )
+
+        assert result == (
+            "Invalid rate type: CPX. Valid options: CPM, CPMV, CPC, CPD, FlatRate"
+        )
+        mock_client.create_line.assert_not_called()
 
 
 class TestBookLineTool:
@@ -211,7 +331,202 @@ class TestBookLineTool:
         """Create the tool with mock client."""
         return BookLineTool(mock_client)
 
-    def test_tool_initialization(self, tool):
-        """Test tool initializes correctly."""
-        assert tool.name == "book_line_item"
-        assert "Confirm booking" in tool.description
+    @pytest.mark.parametrize(
+        ("rate_type", "cost"),
+        [
+            (RateType.CPM, "$20.00"),
+            (RateType.CPC, "$20,000.00"),
+            (RateType.FLAT_RATE, "$10.00"),
+        ],
+    )
+    async def test_book_line_cost_by_rate_type(self, tool, mock_client, rate_type, cost):
+        """Test the booked cost is estimated for every rate type."""
+        returns(
+            mock_client,
+            "book_line",
+            Line(
+                id="line_1",
+                order_id="ord_1",
+                product_id="prod_1",
+                name="Line",
+                start_date=datetime(2025, 1, 1),
+                end_date=datetime(2025, 1, 31),
+                rate_type=rate_type,
+                rate=10.0,
+                quantity=2_000,
+                booking_status=LineBookingStatus.BOOKED,
+            ),
+        )
+
+        result = await tool._arun(account_id="acc_1", order_id="ord_1", line_id="line_1")
+
+        assert f"Total Cost: {cost}" in result
+
+
+class TestCreateLinesBulkTool:
+    """Tests for the CreateLinesBulkTool."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock OpenDirect client."""
+        return MagicMock()
+
+    @pytest.fixture
+    def tool(self, mock_client):
+        """Create the tool with mock client."""
+        return CreateLinesBulkTool(mock_client)
+
+    async def test_create_lines_isolates_failures(self, tool, mock_client):
+        """Test every line is created and one bad entry does not fail the rest."""
+        created = []
+
+        async def create_line(account_id, order_id, line):
+            created.append(line.name)
+            return line.model_copy(update={"id": f"line_{len(created)}"})
+
+        mock_client.create_line = create_line
+        base = {
+            "account_id": "acc_1",
+            "order_id": "ord_1",
+            "product_id": "prod_1",
+            "start_date": "2025-01-01",
+            "end_date": "2025-01-31",
+            "rate": 10.0,
+            "quantity": 1_000_000,
+        }
+
+        result = await tool._arun(
+            lines=[
+                {**base, "line_name": "Line A"},
+                CreateLineInput(**base, line_name="Line B"),
+                {**base, "line_name": "Line C", "start_date": "not-a-date"},
+            ]
+        )
+
+        assert sorted(created) == ["Line A", "Line B"]
+        assert "Line C: Error creating line" in result
+        assert "Created 2 of 3 lines" in result
+
+    async def test_invalid_entries_are_reported_per_line(self, tool, mock_client):
+        """Test entries failing validation are reported without failing the batch."""
+        mock_client.create_line = AsyncMock(
+            side_effect=lambda account_id, order_id, line: line.model_copy(
+                update={"id": "line_1"}
+            )
+        )
+        base = {
+            "account_id": "acc_1",
+            "order_id": "ord_1",
+            "product_id": "prod_1",
+            "start_date": "2025-01-01",
+            "end_date": "2025-01-31",
+            "rate": 10.0,
+        }
+
+        result = await tool._arun(
+            lines=[
+                {**base, "line_name": "Line A", "quantity": 1_000},
+                {**base, "line_name": "Line B", "quantity": 0},
+                {**base, "quantity": 1_000},
+            ]
+        )
+
+        assert "Line A: " in result
+        assert "Line B: Error creating line" in result
+        assert "Line 3: Error creating line" in result
+        assert "Created 1 of 3 lines" in result
+
+    def test_input_schema_enforces_line_name_length(self):
+        """Test the Line name limit is checked at the tool boundary."""
+        with pytest.raises(ValueError):
+            CreateLineInput(
+                account_id="acc_1",
+                order_id="ord_1",
+                product_id="prod_1",
+                line_name="x" * 201,
+                start_date="2025-01-01",
+                end_date="2025-01-31",
+                rate=10.0,
+                quantity=1_000,
+            )
+
+
+class TestReserveAndBookLineTool:
+    """Tests for the ReserveAndBookLineTool."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock OpenDirect client."""
+        return MagicMock()
+
+    @pytest.fixture
+    def tool(self, mock_client):
+        """Create the tool with mock client."""
+        return ReserveAndBookLineTool(mock_client)
+
+    async def test_reserve_and_book_lines(self, tool, mock_client):
+        """Test each line is reserved before booking and failures are isolated."""
+        calls = []
+
+        async def reserve_line(account_id, order_id, line_id):
+            calls.append(("reserve", line_id))
+            if line_id == "line_bad":
+                raise RuntimeError("inventory unavailable")
+
+        async def book_line(account_id, order_id, line_id):
+            calls.append(("book", line_id))
+            return Line(
+                id=line_id,
+                order_id=order_id,
+                product_id="prod_1",
+                name=line_id,
+                start_date=datetime(2025, 1, 1),
+                end_date=datetime(2025, 1, 31),
+                rate_type=RateType.CPM,
+                rate=10.0,
+                quantity=1_000_000,
+                booking_status=LineBookingStatus.BOOKED,
+            )
+
+        mock_client.reserve_line = reserve_line
+        mock_client.book_line = book_line
+
+        result = await tool._arun(
+            account_id="acc_1",
+            order_id="ord_1",
+            line_ids=["line_1", "line_bad", "line_2"],
+        )
+
+        assert calls.index(("reserve", "line_1")) < calls.index(("book", "line_1"))
+        assert ("book", "line_bad") not in calls
+        assert "line_bad: Error reserving line: inventory unavailable" in result
+        assert "Booked 2 of 3 lines, total cost $20,000.00" in result
+
+    async def test_book_failure_reports_reserved_line(self, tool, mock_client):
+        """Test a booking failure after reservation says the line stays reserved."""
+        mock_client.reserve_line = AsyncMock()
+        mock_client.book_line = AsyncMock(side_effect=RuntimeError("booking window closed"))
+
+        result = await tool._arun(
+            account_id="acc_1",
+            order_id="ord_1",
+            line_ids=["line_1"],
+        )
+
+        assert "line_1: Error booking line: booking window closed" in result
+        assert "still reserved" in result
+        assert "Booked 0 of 1 lines" in result
+
+    async def test_cancelled_booking_is_reported(self, tool, mock_client):
+        """Test a cancelled client call is reported instead of crashing the batch."""
+        mock_client.reserve_line = AsyncMock()
+        mock_client.book_line = AsyncMock(side_effect=asyncio.CancelledError)
+
+        result = await tool._arun(
+            account_id="acc_1",
+            order_id="ord_1",
+            line_ids=["line_1"],
+        )
+
+        assert "line_1: Error reserving or booking line: CancelledError" in result
+        assert "Booked 0 of 1 lines" in result
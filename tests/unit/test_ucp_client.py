@@ -0,0 +1,261 @@
+# Author: Green Mountain Systems AI Inc.
+# Donated to IAB Tech Lab
+
+"""Tests for UCP client."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from ad_buyer.clients import ucp_client
+from ad_buyer.clients.ucp_client import UCPClient, clear_capabilities_cache
+
+CAPABILITIES_PAYLOAD = {
+    "capabilities": [
+        {
+            "capabilityId": "cap_ctx_categories",
+            "name": "Content Categories",
+            "signalType": "contextual",
+            "coveragePercentage": 95.0,
+        }
+    ]
+}
+
+
+def make_client(handler) -> UCPClient:
+    """Create a UCPClient that routes requests to a mock transport."""
+    client = UCPClient()
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """Skip retry backoff delays."""
+
+    async def sleep(delay):
+        return None
+
+    monkeypatch.setattr(ucp_client.asyncio, "sleep", sleep)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Isolate the module-level capability cache between tests."""
+    clear_capabilities_cache()
+    yield
+    clear_capabilities_cache()
+
+
+class TestDiscoverCapabilitiesCache:
+    """Tests for capability discovery caching and de-duplication."""
+
+    async def test_repeat_discovery_is_served_from_cache(self):
+        """Second discovery for the same endpoint should not hit the network."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url)
+            return httpx.Response(200, json=CAPABILITIES_PAYLOAD)
+
+        client = make_client(handler)
+        first = await client.discover_capabilities("http://seller.test/caps")
+        second = await client.discover_capabilities("http://seller.test/caps")
+        await client.close()
+
+        assert len(calls) == 1
+        assert [c.capability_id for c in first] == ["cap_ctx_categories"]
+        assert [c.capability_id for c in second] == ["cap_ctx_categories"]
+
+    async def test_cache_expires_after_ttl(self, monkeypatch):
+        """Entries older than the TTL should be refetched."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url)
+            return httpx.Response(200, json=CAPABILITIES_PAYLOAD)
+
+        client = make_client(handler)
+        await client.discover_capabilities("http://seller.test/caps")
+
+        now = ucp_client.time.monotonic()
+        monkeypatch.setattr(
+            ucp_client.time,
+            "monotonic",
+            lambda: now + ucp_client.CAPABILITIES_CACHE_TTL_SECONDS + 1,
+        )
+        await client.discover_capabilities("http://seller.test/caps")
+        await client.close()
+
+        assert len(calls) == 2
+
+    async def test_no_store_response_is_not_cached(self):
+        """Responses marked no-store should not be cached."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url)
+            return httpx.Response(
+                200,
+                json=CAPABILITIES_PAYLOAD,
+                headers={"Cache-Control": "no-store"},
+            )
+
+        client = make_client(handler)
+        await client.discover_capabilities("http://seller.test/caps")
+        await client.discover_capabilities("http://seller.test/caps")
+        await client.close()
+
+        assert len(calls) == 2
+
+    async def test_nocache_endpoint_bypasses_cache(self):
+        """Endpoints with a nocache query parameter should never be cached."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url)
+            return httpx.Response(200, json=CAPABILITIES_PAYLOAD)
+
+        client = make_client(handler)
+        await client.discover_capabilities("http://seller.test/caps?nocache")
+        await client.discover_capabilities("http://seller.test/caps?nocache")
+        await client.close()
+
+        assert len(calls) == 2
+
+    async def test_failed_discovery_is_not_cached(self):
+        """Errors return an empty list and are retried on the next call."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url)
+            return httpx.Response(404)
+
+        client = make_client(handler)
+        assert await client.discover_capabilities("http://seller.test/caps") == []
+        assert await client.discover_capabilities("http://seller.test/caps") == []
+        await client.close()
+
+        assert len(calls) == 2
+
+    async def test_concurrent_discovery_is_deduplicated(self):
+        """Concurrent misses for one endpoint should share a single request."""
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=CAPABILITIES_PAYLOAD)
+
+        client = make_client(handler)
+        results = await asyncio.gather(
+            *(client.discover_capabilities("http://seller.test/caps") for _ in range(5))
+        )
+        await client.close()
+
+        assert len(calls) == 1
+        assert all(len(r) == 1 for r in results)
+
+    async def test_followers_survive_cancelled_leader(self):
+        """Cancelling the leading request should not cancel its followers."""
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=CAPABILITIES_PAYLOAD)
+
+        client = make_client(handler)
+        leader = asyncio.create_task(client.discover_capabilities("http://seller.test/caps"))
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.create_task(client.discover_capabilities("http://seller.test/caps"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        await client.close()
+
+        assert leader.cancelled()
+        assert len(calls) == 2
+        assert all(len(r) == 1 for r in results)
+
+
+class TestSellerRequests:
+    """Tests for bounded concurrency and retries on seller requests."""
+
+    async def test_retries_rate_limited_responses(self, no_backoff):
+        """429 and 5xx responses should be retried until success."""
+        statuses = iter([429, 503])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            status = next(statuses, 200)
+            if status != 200:
+                return httpx.Response(status)
+            return httpx.Response(200, json=CAPABILITIES_PAYLOAD)
+
+        client = make_client(handler)
+        capabilities = await client.discover_capabilities("http://seller.test/caps")
+        await client.close()
+
+        assert [c.capability_id for c in capabilities] == ["cap_ctx_categories"]
+
+    async def test_gives_up_after_max_attempts(self, no_backoff):
+        """Persistent failures should stop after MAX_ATTEMPTS requests."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url)
+            return httpx.Response(503)
+
+        client = make_client(handler)
+        assert await client.discover_capabilities("http://seller.test/caps") == []
+        await client.close()
+
+        assert len(calls) == ucp_client.MAX_ATTEMPTS
+
+    async def test_posts_are_only_retried_when_rate_limited(self, no_backoff):
+        """Non-idempotent requests should not be replayed after a 5xx."""
+        statuses = iter([429, 503])
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.method)
+            return httpx.Response(next(statuses, 200))
+
+        client = make_client(handler)
+        response = await client._request("POST", "http://seller.test/ucp", json={})
+        await client.close()
+
+        assert response.status_code == 503
+        assert calls == ["POST", "POST"]
+
+    async def test_concurrency_is_bounded(self, monkeypatch):
+        """No more than ucp_max_concurrency requests should be in flight."""
+        monkeypatch.setattr(ucp_client.get_settings(), "ucp_max_concurrency", 2)
+        # Tests share one event loop, so drop any semaphore an earlier test
+        # created for it with the default limit
+        monkeypatch.setattr(ucp_client, "_seller_semaphores", {})
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json=CAPABILITIES_PAYLOAD)
+
+        client = make_client(handler)
+        await asyncio.gather(
+            *(
+                client.discover_capabilities(f"http://seller.test/caps/{i}")
+                for i in range(6)
+            )
+        )
+        await client.close()
+
+        assert peak == 2
@@ -0,0 +1,139 @@
+# Author: Green Mountain Systems AI Inc.
+# Donated to IAB Tech Lab
+
+"""Tests for UnifiedClient connection reuse and product projection."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from ad_buyer.clients import (
+    MCPToolResult,
+    Protocol,
+    UnifiedClient,
+    close_shared_http_client,
+    shared_http_client,
+)
+
+
+def make_mcp_client(tool_properties: dict) -> UnifiedClient:
+    """Create a UnifiedClient with a stub MCP connection."""
+    mcp = MagicMock()
+    mcp.tools = {
+        name: {"name": name, "schema": {"properties": tool_properties}}
+        for name in ("list_products", "search_products")
+    }
+    mcp.call_tool = AsyncMock(return_value=MCPToolResult(data=[]))
+    client = UnifiedClient()
+    client._mcp_client = mcp
+    return client
+
+
+class TestSharedHttpPool:
+    """Tests for the shared keep-alive HTTP pool."""
+
+    async def test_clients_share_one_pool(self):
+        """A2A connections from separate clients should reuse one pool."""
+        first = UnifiedClient(protocol=Protocol.A2A)
+        second = UnifiedClient(protocol=Protocol.A2A)
+        await first.connect()
+        await second.connect()
+
+        assert first.a2a._client is second.a2a._client
+        assert first.a2a._client is shared_http_client()
+
+        await first.close()
+        await second.close()
+        assert not shared_http_client().is_closed
+
+        await close_shared_http_client()
+
+    async def test_explicit_http_client_is_used(self):
+        """A caller-supplied HTTP client should be used instead of the pool."""
+        pool = shared_http_client()
+        client = UnifiedClient(protocol=Protocol.A2A, http_client=pool)
+        await client.connect()
+
+        assert client.a2a._client is pool
+
+        await client.close()
+        await close_shared_http_client()
+        assert pool.is_closed
+
+
+class TestProductProjection:
+    """Tests for requesting product field subsets from sellers."""
+
+    async def test_fields_sent_when_tool_supports_them(self):
+        """Projection should be requested when the tool declares fields."""
+        client = make_mcp_client({"filters": {}, "fields": {}})
+
+        await client.list_products(fields=("id", "name"))
+
+        client.mcp.call_tool.assert_awaited_once_with(
+            "list_products", {"fields": ["id", "name"]}
+        )
+
+    async def test_fields_dropped_when_tool_lacks_them(self):
+        """Sellers without projection support should get the original call."""
+        client = make_mcp_client({"query": {}, "filters": {}})
+
+        await client.list_products(fields=("id", "name"))
+        await client.search_products(query="ctv", fields=("id", "name"))
+
+        assert client.mcp.call_tool.await_args_list[0].args == ("list_products", None)
+        assert client.mcp.call_tool.await_args_list[1].args == (
+            "search_products",
+            {"query": "ctv"},
+        )
+
+
+class TestProductFilters:
+    """Tests for pushing product filters to sellers."""
+
+    async def test_filters_sent_when_tool_supports_them(self):
+        """Filters should go to list_products when the tool declares them."""
+        client = make_mcp_client({"filters": {}})
+
+        await client.list_products(filters={"channel": "ctv"})
+
+        client.mcp.call_tool.assert_awaited_once_with(
+            "list_products", {"filters": {"channel": "ctv"}}
+        )
+
+    async def test_filters_searched_when_tool_lacks_them(self):
+        """Undeclared filters should be sent through search_products instead."""
+        client = make_mcp_client({"query": {}})
+        client.mcp.tools["search_products"]["schema"]["properties"] = {"filters": {}}
+
+        await client.list_products(filters={"channel": "ctv"})
+
+        client.mcp.call_tool.assert_awaited_once_with(
+            "search_products", {"filters": {"channel": "ctv"}}
+        )
+
+    async def test_filters_dropped_when_no_tool_declares_them(self):
+        """Sellers declaring filters on neither tool should get the plain list."""
+        client = make_mcp_client({"query": {}})
+
+        await client.list_products(filters={"channel": "ctv"})
+
+        client.mcp.call_tool.assert_awaited_once_with("list_products", None)
+
+    async def test_discovery_without_predicates_lists_catalog(self):
+        """Identity context alone should keep the original no-argument call."""
+        client = make_mcp_client({"filters": {}})
+
+        await client.discover_inventory()
+
+        client.mcp.call_tool.assert_awaited_once_with("list_products", None)
+
+    async def test_a2a_listing_keeps_canned_message(self):
+        """A2A sellers should still get the plain product listing request."""
+        client = UnifiedClient(protocol=Protocol.A2A)
+        client._a2a_client = MagicMock()
+        client._a2a_client.send_message = AsyncMock(return_value=MagicMock())
+
+        await client.discover_inventory()
+
+        client._a2a_client.send_message.assert_awaited_once_with(
+            "List all available advertising products"
+        )